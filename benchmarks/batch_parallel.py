@@ -0,0 +1,44 @@
+"""Measure how batch analysis throughput scales with worker processes.
+
+Run with:
+    uv run python benchmarks/batch_parallel.py --count 200000 --workers 1 2 4 8
+"""
+
+import argparse
+import time
+
+from corpus import build_corpus
+from uoes_learning_objectives.batch_analyzer import (
+    DEFAULT_CHUNK_SIZE,
+    analyze_batch,
+    analyze_batch_parallel,
+)
+
+
+def main() -> None:
+    """Print objectives/sec and speedup for each worker count."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000,
+                        help="Number of objectives to score")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4],
+                        help="Worker counts to compare")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Objectives per worker task")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.count)
+    baseline = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        if workers == 1:
+            count = sum(1 for _ in analyze_batch(corpus))
+        else:
+            count = sum(1 for _ in analyze_batch_parallel(corpus, workers, args.chunk_size))
+        rate = count / (time.perf_counter() - start)
+        baseline = baseline or rate
+        print(f"workers={workers:<3} {rate:12,.0f} objectives/sec  "
+              f"speedup {rate / baseline:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Synthetic learning-objective corpora for benchmarks."""
+
+import random
+import re
+from typing import List, Tuple
+
+from uoes_learning_objectives.blooms_taxonomy import EXAMPLE_OBJECTIVES, TAXONOMY
+from uoes_learning_objectives.objective_creator import COURSE_LEVELS
+from uoes_learning_objectives.sample_objectives import SAMPLE_OBJECTIVES
+
+PREFIX = "By the end of this course, students will be able to "
+
+# Variations applied to template prefixes so corpora exercise every heuristic branch
+PREFIXES = [
+    PREFIX,
+    "Students will be able to ",
+    "By the end of the semester, learners will ",
+    "",
+]
+
+SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+
+def _templates() -> List[Tuple[str, str]]:
+    """Return (level, text after the action verb) for every bundled objective."""
+    objectives = list(EXAMPLE_OBJECTIVES.items())
+    for levels in SAMPLE_OBJECTIVES.values():
+        objectives.extend(levels.items())
+
+    templates = []
+    for level, objective in objectives:
+        body = objective[len(PREFIX):] if objective.startswith(PREFIX) else objective
+        # Drop the leading verb; it is re-drawn for each synthetic objective
+        templates.append((level, re.sub(r"^\w+\s+", "", body)))
+    return templates
+
+
+def build_corpus(count: int, seed: int = 0) -> List[str]:
+    """Build count synthetic objectives from the bundled templates.
+
+    Each objective combines a template with a random prefix and a random verb
+    from a random level; one in ten has no action verb at all.
+    """
+    rng = random.Random(seed)
+    templates = _templates()
+    levels = TAXONOMY.levels
+    corpus = []
+    for _ in range(count):
+        _, tail = rng.choice(templates)
+        if rng.random() < 0.1:
+            verb = "learn about"
+        else:
+            verb = rng.choice(TAXONOMY.verbs[rng.choice(levels)])
+        corpus.append(f"{rng.choice(PREFIXES)}{verb} {tail}")
+    return corpus
+
+
+def build_course_corpus(count: int, seed: int = 0) -> List[Tuple[str, str, str]]:
+    """Build count (course_level, key_topics, subject_area) inputs for generate_objectives."""
+    rng = random.Random(seed)
+    topics = [tail.rstrip(".") for _, tail in _templates()]
+    subjects = list(SAMPLE_OBJECTIVES)
+    return [
+        (
+            rng.choice(COURSE_LEVELS),
+            ", ".join(rng.sample(topics, rng.randint(3, 5))),
+            rng.choice(subjects),
+        )
+        for _ in range(count)
+    ]
@@ -0,0 +1,63 @@
+"""Benchmark closest-exemplar search over a large memory-mapped exemplar store.
+
+Builds a store from a synthetic corpus, saves it, reopens it memory-mapped and
+times queries with and without discipline/level filters.
+
+Run with:
+    uv run python benchmarks/exemplar_search.py --size 100000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from corpus import build_corpus
+from uoes_learning_objectives.blooms_taxonomy import TAXONOMY
+from uoes_learning_objectives.exemplar_store import ExemplarStore
+from uoes_learning_objectives.sample_objectives import SAMPLE_OBJECTIVES
+
+
+def per_query_ms(search: Callable[[str], object], queries: List[str]) -> float:
+    """Return the mean milliseconds search takes per query."""
+    start = time.perf_counter()
+    for query in queries:
+        search(query)
+    return (time.perf_counter() - start) / len(queries) * 1000
+
+
+def main() -> None:
+    """Build, reopen and query a store, printing build time and per-query latency."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000, help="Exemplars in the store")
+    parser.add_argument("--queries", type=int, default=200, help="Queries to time")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    disciplines = list(SAMPLE_OBJECTIVES)
+    records = [
+        (rng.choice(disciplines), rng.choice(TAXONOMY.levels), objective)
+        for objective in build_corpus(args.size)
+    ]
+    queries = build_corpus(args.queries, seed=1)
+
+    start = time.perf_counter()
+    store = ExemplarStore.build(records)
+    print(f"built {len(store):,} exemplars in {time.perf_counter() - start:.1f} s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        store.save(Path(directory))
+        start = time.perf_counter()
+        mapped = ExemplarStore.load(Path(directory))
+        print(f"opened memory-mapped store in {(time.perf_counter() - start) * 1000:.1f} ms")
+        print(f"top-5 search        {per_query_ms(mapped.search, queries):8.3f} ms/query")
+        filtered = per_query_ms(
+            lambda query: mapped.search(query, discipline="Biology", level="Analyze"), queries
+        )
+        print(f"filtered search     {filtered:8.3f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
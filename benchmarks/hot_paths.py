@@ -0,0 +1,118 @@
+"""Benchmark suite for the objective analysis hot paths.
+
+Times each hot path over synthetic corpora and saves the results as a JSON
+baseline. With --compare, the run fails if any path is slower than the
+baseline by more than --max-regression percent.
+
+Run with:
+    uv run python benchmarks/hot_paths.py --sizes 1k 100k --save benchmarks/results/baseline.json
+    uv run python benchmarks/hot_paths.py --sizes 1k 100k --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from corpus import SIZES, build_corpus, build_course_corpus
+from uoes_learning_objectives.objective_analyzer import (
+    analyze,
+    basic_objective_analysis,
+    contains_action_verb,
+    evaluate_objective_rubric,
+    identify_blooms_level,
+)
+from uoes_learning_objectives.objective_creator import generate_objectives
+
+# Each benchmark maps every corpus item through one hot path
+BENCHMARKS: Dict[str, Callable[[Any], Any]] = {
+    "contains_action_verb": lambda objective: contains_action_verb(objective, "Create"),
+    "identify_blooms_level": identify_blooms_level,
+    "basic_objective_analysis": basic_objective_analysis,
+    "evaluate_objective_rubric": evaluate_objective_rubric,
+    "analyze": analyze,
+    "generate_objectives": lambda course: generate_objectives(*course),
+}
+
+
+def time_benchmark(func: Callable[[Any], Any], corpus: List[Any], repeat: int) -> float:
+    """Return the best wall-clock time in seconds to run func over the corpus."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in corpus:
+            func(item)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes: List[str], repeat: int) -> Dict[str, Any]:
+    """Run every benchmark at every corpus size and return the results document."""
+    results = {}
+    for size in sizes:
+        count = SIZES[size]
+        objectives = build_corpus(count)
+        courses = build_course_corpus(count)
+        for name, func in BENCHMARKS.items():
+            corpus = courses if name == "generate_objectives" else objectives
+            seconds = time_benchmark(func, corpus, repeat)
+            results[f"{name}[{size}]"] = {
+                "items": count,
+                "seconds": seconds,
+                "items_per_sec": count / seconds,
+            }
+            print(f"{name + '[' + size + ']':36} {count / seconds:14,.0f} items/sec")
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """Return a description of every benchmark that regressed beyond max_regression percent."""
+    regressions = []
+    for name, result in current["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        change = (result["items_per_sec"] / previous["items_per_sec"] - 1) * 100
+        print(f"{name:36} {change:+7.1f}% vs baseline")
+        if change < -max_regression:
+            regressions.append(f"{name} is {-change:.1f}% slower than the baseline")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=["1k", "100k"],
+                        help="Corpus sizes to run (default: 1k 100k)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per benchmark; the fastest is kept (default: 3)")
+    parser.add_argument("--save", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON file to compare against")
+    parser.add_argument("--max-regression", type=float, default=10.0,
+                        help="Allowed slowdown in percent before failing (default: 10)")
+    args = parser.parse_args()
+
+    current = run(args.sizes, args.repeat)
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(current, indent=2) + "\n")
+        print(f"Saved results to {args.save}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(current, baseline, args.max_regression)
+        if regressions:
+            print("\n".join(regressions), file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark per-keystroke cost of the live analyzer on a long syllabus.
+
+Simulates typing into the end of a multi-paragraph syllabus and compares a
+full re-analysis of the text with the incremental, per-segment path.
+
+Run with:
+    uv run python benchmarks/live_analysis.py --paragraphs 50
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from corpus import build_corpus
+from uoes_learning_objectives.live_analysis import analyze_incrementally
+from uoes_learning_objectives.objective_analyzer import (
+    basic_objective_analysis,
+    evaluate_objective_rubric,
+    identify_blooms_level,
+)
+
+
+def full_analysis(text: str) -> None:
+    """Re-run every heuristic on the whole text, as the button-driven analyzer does."""
+    basic_objective_analysis(text)
+    identify_blooms_level(text)
+    evaluate_objective_rubric(text)
+
+
+def keystrokes(paragraphs: int, sentences_per_paragraph: int = 5) -> List[str]:
+    """Return the successive texts produced by typing one more sentence into a syllabus."""
+    objectives = build_corpus(paragraphs * sentences_per_paragraph + 1)
+    syllabus = "\n\n".join(
+        " ".join(objectives[i:i + sentences_per_paragraph])
+        for i in range(0, len(objectives) - 1, sentences_per_paragraph)
+    )
+    typed = "\n\n" + objectives[-1]
+    return [syllabus + typed[:i] for i in range(1, len(typed) + 1)]
+
+
+def per_keystroke_ms(func: Callable[[str], object], texts: List[str]) -> float:
+    """Return the mean milliseconds func takes per text."""
+    start = time.perf_counter()
+    for text in texts:
+        func(text)
+    return (time.perf_counter() - start) / len(texts) * 1000
+
+
+def main() -> None:
+    """Run the benchmark and print the mean time per keystroke for both paths."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paragraphs", type=int, default=50,
+                        help="Paragraphs of five objectives in the syllabus")
+    args = parser.parse_args()
+
+    texts = keystrokes(args.paragraphs)
+    print(f"syllabus of {len(texts[0]):,} characters, {len(texts)} keystrokes")
+    print(f"full re-analysis   {per_keystroke_ms(full_analysis, texts):8.3f} ms/keystroke")
+    # The first call fills the segment cache, as the first render would
+    analyze_incrementally(texts[0])
+    print(f"incremental        {per_keystroke_ms(analyze_incrementally, texts):8.3f} ms/keystroke")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark the rerun cost of the Sample Objectives and Action Verbs pages.
+
+Renders each page with Streamlit's AppTest and reports the number of delta
+messages (elements and layout blocks) the script run sends to the browser,
+their serialized size, and the wall-clock time of a rerun.
+
+Run with:
+    uv run python benchmarks/page_render.py
+"""
+
+import argparse
+import statistics
+import time
+from typing import Any, Tuple
+
+from streamlit.testing.v1 import AppTest
+
+
+def sample_objectives_page() -> None:
+    from uoes_learning_objectives.sample_objectives import display_sample_objectives_page
+
+    display_sample_objectives_page()
+
+
+def action_verbs_page() -> None:
+    from uoes_learning_objectives.blooms_taxonomy import display_action_verbs
+
+    display_action_verbs()
+
+
+PAGES = {
+    "Sample Objectives": sample_objectives_page,
+    "Action Verbs": action_verbs_page,
+}
+
+
+def payload(node: Any) -> Tuple[int, int]:
+    """Return the number of delta messages under node and their size in bytes."""
+    children = getattr(node, "children", None)
+    messages, size = 0, 0
+    proto = getattr(node, "proto", None)
+    if proto is not None:
+        messages, size = 1, proto.ByteSize()
+    for child in (children or {}).values():
+        child_messages, child_size = payload(child)
+        messages += child_messages
+        size += child_size
+    return messages, size
+
+
+def main() -> None:
+    """Render every page and print its payload and rerun time."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=20, help="Reruns to time per page")
+    args = parser.parse_args()
+
+    for name, page in PAGES.items():
+        at = AppTest.from_function(page).run()
+        messages, size = payload(at.main)
+        times = []
+        for _ in range(args.reruns):
+            start = time.perf_counter()
+            at.run()
+            times.append(time.perf_counter() - start)
+        print(
+            f"{name:18} {messages:5} messages {size / 1024:8.1f} KiB "
+            f"{statistics.median(times) * 1000:8.1f} ms/rerun"
+        )
+
+
+if __name__ == "__main__":
+    main()
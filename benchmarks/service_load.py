@@ -0,0 +1,145 @@
+"""Load test for the headless analysis service.
+
+Starts `uoes-serve` (or targets --url), sends POST /analyze requests for a
+synthetic corpus over several keep-alive connections and reports latency
+percentiles and throughput. Exits with status 1 if the p99 latency is above
+the target.
+
+Run with:
+    uv run python benchmarks/service_load.py --workers 2 --connections 4 --requests 20000
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from corpus import build_corpus
+
+
+def free_port() -> int:
+    """Return a TCP port that is free on localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, workers: int) -> subprocess.Popen:
+    """Start the service and wait until it accepts connections."""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uoes_learning_objectives.service",
+         "--port", str(port), "--workers", str(workers)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return server
+        except OSError:
+            if server.poll() is not None:
+                raise RuntimeError("the service exited during start-up")
+            time.sleep(0.1)
+    server.terminate()
+    raise RuntimeError("the service did not start within 30 seconds")
+
+
+async def post(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, host: str, path: str, body: bytes
+) -> Tuple[int, bytes]:
+    """Send one HTTP/1.1 POST on an open connection and read the response."""
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body
+    )
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split()[1])
+    length = next(
+        int(line.split(":", 1)[1]) for line in lines if line.lower().startswith("content-length:")
+    )
+    return status, await reader.readexactly(length)
+
+
+async def connection(
+    host: str, port: int, bodies: List[bytes], latencies: List[float]
+) -> None:
+    """Send bodies one after another over one keep-alive connection, recording latencies."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for body in bodies:
+            start = time.perf_counter()
+            status, _ = await post(reader, writer, host, "/analyze", body)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                raise RuntimeError(f"/analyze returned HTTP {status}")
+    finally:
+        writer.close()
+
+
+async def run_load(host: str, port: int, connections: int, requests: int) -> Tuple[List[float], float]:
+    """Spread requests over connections; return the latencies and the wall-clock time."""
+    objectives = build_corpus(min(requests, 5_000))
+    bodies = [
+        json.dumps({"objective": objectives[i % len(objectives)]}).encode("utf-8")
+        for i in range(requests)
+    ]
+    latencies: List[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        connection(host, port, bodies[i::connections], latencies) for i in range(connections)
+    ))
+    return latencies, time.perf_counter() - start
+
+
+def percentile(values: List[float], share: float) -> float:
+    """Return the value below which share of the sorted values fall."""
+    return sorted(values)[min(len(values) - 1, int(share * len(values)))]
+
+
+def main() -> None:
+    """Run the load test and print latency percentiles and throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Service to test, e.g. http://127.0.0.1:8000 "
+                        "(default: start one on a free port)")
+    parser.add_argument("--workers", type=int, default=2, help="Workers of the started service")
+    parser.add_argument("--connections", type=int, default=4, help="Concurrent connections")
+    parser.add_argument("--requests", type=int, default=20_000, help="Requests to send")
+    parser.add_argument("--warmup", type=int, default=1_000, help="Untimed requests sent first")
+    parser.add_argument("--p99-ms", type=float, default=5.0, help="p99 latency target in ms")
+    args = parser.parse_args()
+
+    server: Optional[subprocess.Popen] = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname or "127.0.0.1", parts.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        server = start_server(port, args.workers)
+    try:
+        asyncio.run(run_load(host, port, args.connections, args.warmup))
+        latencies, seconds = asyncio.run(run_load(host, port, args.connections, args.requests))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    p99 = percentile(latencies, 0.99) * 1000
+    print(f"{len(latencies):,} requests over {args.connections} connections in {seconds:.1f} s "
+          f"({len(latencies) / seconds:,.0f} req/s)")
+    print(f"p50 {statistics.median(latencies) * 1000:.2f} ms  "
+          f"p95 {percentile(latencies, 0.95) * 1000:.2f} ms  p99 {p99:.2f} ms")
+    if p99 > args.p99_ms:
+        print(f"p99 latency {p99:.2f} ms is above the {args.p99_ms:g} ms target", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
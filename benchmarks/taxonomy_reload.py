@@ -0,0 +1,80 @@
+"""Benchmark reloading the taxonomy data file.
+
+Times parsing and compiling the data file, a full reload through the store,
+and rebuilding the caches derived from a new snapshot (system prompt and
+sample exemplar store).
+
+Run with:
+    uv run python benchmarks/taxonomy_reload.py
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from uoes_learning_objectives.exemplar_store import default_store
+from uoes_learning_objectives.prompts import system_prompt
+from uoes_learning_objectives.taxonomy_data import (
+    DEFAULT_DATA_PATH,
+    TaxonomyStore,
+    current_data,
+    parse_taxonomy_data,
+    set_taxonomy_store,
+)
+
+
+def best_ms(func: Callable[[], object], repeat: int) -> float:
+    """Return the fastest of repeat runs of func, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    """Print the cost of each step of a reload."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per step; the fastest is kept")
+    args = parser.parse_args()
+
+    raw = DEFAULT_DATA_PATH.read_bytes()
+    print(f"parse and compile     {best_ms(lambda: parse_taxonomy_data(raw), args.repeat):8.3f} ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "taxonomy.json"
+        shutil.copy(DEFAULT_DATA_PATH, path)
+        store = TaxonomyStore(path)
+        set_taxonomy_store(store)
+        data = json.loads(raw)
+
+        def reload() -> None:
+            data["version"] = str(int(time.time_ns()))
+            path.write_text(json.dumps(data), encoding="utf-8")
+            os.utime(path, ns=(time.time_ns(), time.time_ns()))
+            if not store.reload_if_changed():
+                raise RuntimeError("the data file change was not detected")
+
+        print(f"write and reload      {best_ms(reload, args.repeat):8.3f} ms")
+
+        def rebuild_caches() -> None:
+            reload()
+            snapshot = current_data()
+            system_prompt(snapshot)
+            default_store()
+
+        print(f"reload and rebuild    {best_ms(rebuild_caches, args.repeat):8.3f} ms")
+        calls = 100_000
+        lookups = best_ms(lambda: [current_data() for _ in range(calls)], 3)
+        print(f"current_data()        {lookups / calls * 1e6:8.1f} ns/call")
+        set_taxonomy_store(None)
+
+
+if __name__ == "__main__":
+    main()
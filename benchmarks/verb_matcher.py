@@ -0,0 +1,58 @@
+"""Benchmark the Bloom's level verb matcher against the legacy per-verb scan.
+
+Run with:
+    uv run python benchmarks/verb_matcher.py --count 100000
+"""
+
+import argparse
+import re
+import time
+from typing import Callable, List, Optional
+
+from corpus import build_corpus
+from uoes_learning_objectives.blooms_taxonomy import ACTION_VERBS
+from uoes_learning_objectives.objective_analyzer import identify_blooms_level
+
+
+def legacy_identify_blooms_level(objective: str) -> Optional[str]:
+    """Previous implementation: one regex search per verb, highest level first."""
+    for level in ["Create", "Evaluate", "Analyze", "Apply", "Understand", "Remember"]:
+        for verb in ACTION_VERBS.get(level, "").split(", "):
+            if re.search(r'\b' + verb + r'\b', objective.lower()):
+                return level
+    return None
+
+
+def measure(func: Callable[[str], Optional[str]], corpus: List[str]) -> float:
+    """Return the throughput of func over the corpus in objectives per second."""
+    start = time.perf_counter()
+    for objective in corpus:
+        func(objective)
+    return len(corpus) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print objectives/sec before and after."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000,
+                        help="Number of objectives to score")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.count)
+    mismatches = sum(
+        identify_blooms_level(o) != legacy_identify_blooms_level(o)
+        for o in corpus[:1000]
+    )
+    if mismatches:
+        raise SystemExit(f"{mismatches} objectives disagree with the legacy scan")
+
+    before = measure(legacy_identify_blooms_level, corpus)
+    after = measure(identify_blooms_level, corpus)
+    print(f"objectives:    {len(corpus)}")
+    print(f"legacy scan:   {before:12,.0f} objectives/sec")
+    print(f"verb index:    {after:12,.0f} objectives/sec")
+    print(f"speedup:       {after / before:12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,262 @@
 """Test fixtures and configuration."""
 
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 import pandas as pd
 
+from uoes_learning_objectives.anthropic_client import close_anthropic_client
+from uoes_learning_objectives.prompts import MIN_CACHEABLE_TOKENS, estimate_tokens
+from uoes_learning_objectives.response_cache import ResponseCache, set_response_cache
+
+
+@pytest.fixture(autouse=True)
+def in_memory_response_cache():
+    """Give every test a fresh in-memory Claude response cache."""
+    cache = ResponseCache()
+    set_response_cache(cache)
+    yield cache
+    set_response_cache(None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_anthropic_client():
+    """Close the shared Anthropic client so each test builds its own."""
+    yield
+    close_anthropic_client()
+
 
 @pytest.fixture
 def sample_dataframe():
     """Fixture providing a sample dataframe for testing."""
-    return pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
+    return pd.DataFrame({"value_a": [1, 2, 3], "value_b": [4, 6, 5]})
+
+
+class StubAnthropicServer(ThreadingHTTPServer):
+    """Local HTTP server that stands in for the Anthropic Messages API.
+
+    Each POST to /v1/messages is answered with a message echoing the prompt,
+    unless a scripted failure is queued in `failures` as (status, headers).
+
+    Message batches created through /v1/messages/batches end after
+    `batch_polls` status checks. Their results are served in reverse order,
+    and requests whose prompt contains "FAIL" come back errored.
+
+    Requests offering tools are answered with a call to the first tool, whose
+    input is taken from `tool_inputs` by tool name.
+
+    A system prompt with a cache_control breakpoint is reported as a prompt
+    cache write the first time and a read afterwards, of its estimated token
+    count, but only when that reaches MIN_CACHEABLE_TOKENS, like the API.
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubAnthropicHandler)
+        self.lock = threading.Lock()
+        self.requests = []
+        self.failures = []
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.batches = {}
+        self.batch_polls = 1
+        self.tool_inputs = {}
+        self.cached_prefixes = set()
+
+    def handle_error(self, request, client_address):
+        # Clients that time out close their connection mid-response
+        pass
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class StubAnthropicHandler(BaseHTTPRequestHandler):
+    """Request handler for StubAnthropicServer."""
+
+    server: StubAnthropicServer
+    # Keep connections open so clients can reuse them
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body, headers=None):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_stream(self, message):
+        """Send a message as server-sent events, in text deltas of 8 characters."""
+        text = message["content"][0]["text"]
+        start = dict(message, content=[], stop_reason=None)
+        events = [
+            ("message_start", {"message": start}),
+            ("content_block_start", {"index": 0, "content_block": {"type": "text", "text": ""}}),
+            *(
+                ("content_block_delta",
+                 {"index": 0, "delta": {"type": "text_delta", "text": text[i:i + 8]}})
+                for i in range(0, len(text), 8)
+            ),
+            ("content_block_stop", {"index": 0}),
+            ("message_delta", {"delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                               "usage": {"output_tokens": 5}}),
+            ("message_stop", {}),
+        ]
+        payload = "".join(
+            f"event: {name}\ndata: {json.dumps(dict(data, type=name))}\n\n"
+            for name, data in events
+        ).encode()
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.send_header("content-length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _echo_message(self, message_id, body):
+        prompt = body["messages"][-1]["content"]
+        usage = {"input_tokens": 10, "output_tokens": 5}
+        system = body.get("system")
+        if isinstance(system, list) and any("cache_control" in block for block in system):
+            prefix = json.dumps([body.get("tools"), system], sort_keys=True)
+            tools = json.dumps(body["tools"]) if body.get("tools") else ""
+            tokens = estimate_tokens(tools + "".join(block["text"] for block in system))
+            if tokens >= MIN_CACHEABLE_TOKENS:
+                with self.server.lock:
+                    cached = prefix in self.server.cached_prefixes
+                    self.server.cached_prefixes.add(prefix)
+                usage["cache_read_input_tokens" if cached else "cache_creation_input_tokens"] = tokens
+        content = [{"type": "text", "text": f"echo: {prompt}"}]
+        stop_reason = "end_turn"
+        if body.get("tools"):
+            name = body["tools"][0]["name"]
+            content = [{"type": "tool_use", "id": f"toolu_{message_id}", "name": name,
+                        "input": self.server.tool_inputs.get(name, {})}]
+            stop_reason = "tool_use"
+        return {
+            "id": message_id,
+            "type": "message",
+            "role": "assistant",
+            "model": body["model"],
+            "content": content,
+            "stop_reason": stop_reason,
+            "stop_sequence": None,
+            "usage": usage,
+        }
+
+    def _batch_json(self, batch_id):
+        batch = self.server.batches[batch_id]
+        ended = batch["polls"] >= self.server.batch_polls
+        count = len(batch["requests"])
+        return {
+            "id": batch_id,
+            "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {
+                "processing": 0 if ended else count,
+                "succeeded": count if ended else 0,
+                "errored": 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": "2024-01-01T00:00:00Z",
+            "expires_at": "2024-01-02T00:00:00Z",
+            "ended_at": "2024-01-01T01:00:00Z" if ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": (
+                f"{self.server.base_url}/v1/messages/batches/{batch_id}/results" if ended else None
+            ),
+        }
+
+    def _send_batch_results(self, batch_id):
+        lines = []
+        for request in reversed(self.server.batches[batch_id]["requests"]):
+            params = request["params"]
+            if "FAIL" in params["messages"][-1]["content"]:
+                result = {
+                    "type": "errored",
+                    "error": {
+                        "type": "error",
+                        "error": {"type": "invalid_request_error", "message": "stub failure"},
+                    },
+                }
+            else:
+                message = self._echo_message(f"msg_{request['custom_id']}", params)
+                result = {"type": "succeeded", "message": message}
+            lines.append(json.dumps({"custom_id": request["custom_id"], "result": result}))
+        payload = "".join(line + "\n" for line in lines).encode()
+        self.send_response(200)
+        self.send_header("content-type", "application/binary")
+        self.send_header("content-length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        parts = self.path.split("?")[0].strip("/").split("/")
+        batch_id = parts[3] if len(parts) > 3 else None
+        if parts[:3] != ["v1", "messages", "batches"] or batch_id not in self.server.batches:
+            self._send_json(404, {"type": "error", "error": {"type": "not_found_error",
+                                                             "message": "stub"}})
+        elif parts[4:] == ["results"]:
+            self._send_batch_results(batch_id)
+        else:
+            with self.server.lock:
+                self.server.batches[batch_id]["polls"] += 1
+            self._send_json(200, self._batch_json(batch_id))
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["content-length"])))
+        server = self.server
+        if self.path.startswith("/v1/messages/batches"):
+            with server.lock:
+                batch_id = f"msgbatch_{len(server.batches) + 1}"
+                server.batches[batch_id] = {"requests": body["requests"], "polls": 0}
+            self._send_json(200, self._batch_json(batch_id))
+            return
+        with server.lock:
+            server.requests.append(body)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            failure = server.failures.pop(0) if server.failures else None
+        try:
+            time.sleep(server.delay)
+            if failure:
+                status, headers = failure
+                self._send_json(
+                    status,
+                    {"type": "error", "error": {"type": "api_error", "message": "stub"}},
+                    headers,
+                )
+                return
+            message = self._echo_message(f"msg_{len(server.requests)}", body)
+            if body.get("stream"):
+                self._send_stream(message)
+            else:
+                self._send_json(200, message)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+
+@pytest.fixture
+def stub_anthropic():
+    """Fixture running a local stub of the Anthropic API for the test's duration."""
+    server = StubAnthropicServer()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
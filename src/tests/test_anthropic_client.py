@@ -0,0 +1,145 @@
+"""Test cases for the concurrent Anthropic client layer."""
+
+import asyncio
+import gc
+import time
+
+import anthropic
+
+from uoes_learning_objectives.anthropic_client import (
+    ConcurrentClaudeClient,
+    TokenBucket,
+    connection_stats,
+    get_anthropic_client,
+    message_text,
+)
+from uoes_learning_objectives.config import CLAUDE_MODEL
+from uoes_learning_objectives.objective_analyzer import (
+    analyze_objective_with_anthropic,
+    analyze_objectives_with_anthropic,
+)
+
+
+def request(text):
+    return {
+        "model": CLAUDE_MODEL,
+        "max_tokens": 16,
+        "messages": [{"role": "user", "content": text}],
+    }
+
+
+def run_many(stub, requests, **limits):
+    """Send requests to the stub server through a ConcurrentClaudeClient."""
+
+    async def run():
+        async with anthropic.AsyncAnthropic(
+            api_key="test", base_url=stub.base_url, max_retries=0
+        ) as client:
+            runner = ConcurrentClaudeClient(client, backoff_base=0.01, **limits)
+            return await runner.create_many(requests)
+
+    return asyncio.run(run())
+
+
+def test_create_many_bounds_concurrency_and_keeps_order(stub_anthropic):
+    """No more than max_concurrency requests are in flight at once."""
+    stub_anthropic.delay = 0.05
+    results = run_many(
+        stub_anthropic,
+        [request(str(i)) for i in range(12)],
+        max_concurrency=3,
+        requests_per_second=1000,
+    )
+    assert [message_text(r) for r in results] == [f"echo: {i}" for i in range(12)]
+    assert stub_anthropic.max_in_flight <= 3
+
+
+def test_retries_rate_limit_and_server_errors(stub_anthropic):
+    """429 and 5xx responses are retried until a request succeeds."""
+    stub_anthropic.failures = [(429, {"retry-after": "0"}), (503, {})]
+    (result,) = run_many(stub_anthropic, [request("hello")], requests_per_second=1000)
+    assert message_text(result) == "echo: hello"
+    assert len(stub_anthropic.requests) == 3
+
+
+def test_does_not_retry_client_errors(stub_anthropic):
+    """4xx errors other than 408/429 are returned without retrying."""
+    stub_anthropic.failures = [(400, {})]
+    (result,) = run_many(stub_anthropic, [request("hello")], requests_per_second=1000)
+    assert isinstance(result, anthropic.BadRequestError)
+    assert len(stub_anthropic.requests) == 1
+
+
+def test_per_request_timeout(stub_anthropic):
+    """Attempts slower than the timeout fail once retries are exhausted."""
+    stub_anthropic.delay = 0.5
+    (result,) = run_many(
+        stub_anthropic, [request("slow")], timeout=0.05, max_retries=1,
+        requests_per_second=1000,
+    )
+    assert isinstance(result, asyncio.TimeoutError)
+
+
+def test_token_bucket_limits_rate():
+    """After the initial burst, tokens are handed out at the configured rate."""
+
+    async def run():
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 0.09
+
+
+def test_analyze_objectives_with_anthropic(stub_anthropic, monkeypatch):
+    """The analyzer fans objectives out and returns text in input order."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    results = analyze_objectives_with_anthropic(
+        ["first", "second"], base_url=stub_anthropic.base_url
+    )
+    assert results[0].startswith("echo: ") and results[0].endswith("first")
+    assert results[1].endswith("second")
+
+
+def test_shared_client_reuses_connections(stub_anthropic, monkeypatch):
+    """Repeated analyses share one client and one pooled connection."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_anthropic.base_url)
+    client = get_anthropic_client()
+    assert get_anthropic_client() is client
+
+    before = connection_stats()
+    for i in range(3):
+        assert analyze_objective_with_anthropic(f"objective {i}").startswith("echo: ")
+    after = connection_stats()
+    assert after["requests"] - before["requests"] == 3
+    assert after["connections_opened"] - before["connections_opened"] == 1
+
+
+def test_api_key_change_leaves_old_client_usable(stub_anthropic, monkeypatch):
+    """A new key gets a new client without closing the one other sessions may be using."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "first")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_anthropic.base_url)
+    old = get_anthropic_client()
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "second")
+    new = get_anthropic_client()
+
+    assert new is not old and new.api_key == "second"
+    assert not old.is_closed()
+    message = old.messages.create(
+        model=CLAUDE_MODEL, max_tokens=8, messages=[{"role": "user", "content": "still open"}]
+    )
+    assert message.content[0].text == "echo: still open"
+
+    http_client = old._client
+    del old, message
+    gc.collect()
+    assert http_client.is_closed
+
+
+def test_shared_client_requires_api_key(monkeypatch):
+    """Without an API key no client is created."""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    assert get_anthropic_client() is None
@@ -0,0 +1,106 @@
+"""Test cases for batch analysis of learning objectives."""
+
+import csv
+import json
+
+import pytest
+
+from uoes_learning_objectives.batch_analyzer import (
+    RESULT_FIELDS,
+    analyze_batch,
+    analyze_batch_parallel,
+    analyze_file,
+    main,
+    read_objectives,
+)
+from uoes_learning_objectives.objective_analyzer import evaluate_objective_rubric
+
+OBJECTIVES = [
+    "By the end of this course, students will be able to design a web application.",
+    "Learn things",
+]
+
+
+def test_analyze_batch_yields_one_record_per_objective():
+    """analyze_batch keeps input order and combines all three analyses."""
+    records = list(analyze_batch(iter(OBJECTIVES)))
+    assert [r["objective"] for r in records] == OBJECTIVES
+    assert records[0]["blooms_level"] == "Create"
+    assert records[1]["blooms_level"] is None
+    scores = evaluate_objective_rubric(OBJECTIVES[0])
+    assert all(records[0][criterion] == score for criterion, score in scores.items())
+    assert records[0]["average_score"] == sum(scores.values()) / len(scores)
+
+
+@pytest.mark.parametrize("output_suffix", [".csv", ".jsonl", ".parquet"])
+def test_analyze_file_round_trip(tmp_path, output_suffix):
+    """Objectives read from CSV are written out in every supported format."""
+    pytest.importorskip("pyarrow")
+    input_path = tmp_path / "objectives.csv"
+    with open(input_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["course", "objective"])
+        for objective in OBJECTIVES:
+            writer.writerow(["CS101", objective])
+
+    output_path = tmp_path / f"results{output_suffix}"
+    assert analyze_file(input_path, output_path) == len(OBJECTIVES)
+
+    if output_suffix == ".csv":
+        with open(output_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert list(rows[0].keys()) == RESULT_FIELDS
+        assert rows[0]["blooms_level"] == "Create"
+    else:
+        assert list(read_objectives(output_path)) == OBJECTIVES
+
+
+def test_read_objectives_accepts_bare_jsonl_strings(tmp_path):
+    """JSONL input may hold bare strings or objects keyed by column."""
+    path = tmp_path / "objectives.jsonl"
+    path.write_text(json.dumps(OBJECTIVES[0]) + "\n\n" + json.dumps({"text": "x"}) + "\n")
+    assert list(read_objectives(path, column="text")) == [OBJECTIVES[0], "x"]
+
+
+@pytest.mark.parametrize(
+    "line, message",
+    [
+        ('{"text": "x"}', "line 2 is missing required key: objective"),
+        ('{"objective": 42}', "line 2: objective must be a string, not int"),
+        ("[1, 2]", "line 2 must be a JSON object or string"),
+        ("{not json", "line 2 is not valid JSON"),
+    ],
+)
+def test_invalid_jsonl_lines_are_rejected(tmp_path, line, message):
+    """Bad JSONL records raise ValueError naming the line, like a missing CSV column."""
+    path = tmp_path / "objectives.jsonl"
+    path.write_text(json.dumps({"objective": OBJECTIVES[0]}) + "\n" + line + "\n")
+    with pytest.raises(ValueError, match=message):
+        list(read_objectives(path))
+
+
+def test_non_string_parquet_values_are_rejected(tmp_path):
+    """A Parquet objective column of another type raises ValueError naming the row; nulls read as ""."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "objectives.parquet"
+    pq.write_table(pa.table({"objective": [OBJECTIVES[0], None], "course": [101, 102]}), path)
+    assert list(read_objectives(path)) == [OBJECTIVES[0], ""]
+    with pytest.raises(ValueError, match="row 1: course must be a string, not int"):
+        list(read_objectives(path, column="course"))
+
+
+def test_unsupported_format_is_rejected(tmp_path):
+    """Unknown suffixes raise ValueError and make the CLI exit with an error."""
+    with pytest.raises(ValueError):
+        list(read_objectives(tmp_path / "objectives.xlsx"))
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "objectives.txt"), str(tmp_path / "out.csv")])
+
+
+def test_analyze_batch_parallel_preserves_input_order():
+    """Parallel results match serial results in the same order."""
+    objectives = [f"Students will be able to design system {i}." for i in range(50)]
+    objectives[7] = "Learn things"
+    parallel = list(analyze_batch_parallel(objectives, workers=2, chunk_size=3))
+    assert parallel == list(analyze_batch(objectives))
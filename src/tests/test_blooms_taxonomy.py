@@ -0,0 +1,54 @@
+"""Test cases for the compiled Bloom's taxonomy tables."""
+
+import dataclasses
+
+import pytest
+
+from uoes_learning_objectives.blooms_taxonomy import (
+    ACTION_VERBS,
+    COGNITIVE_LEVELS,
+    TAXONOMY,
+    action_verbs_table_html,
+    compile_taxonomy,
+)
+
+
+def test_action_verbs_is_a_view_of_the_compiled_tables():
+    """The comma-separated dict matches the compiled per-level tuples."""
+    assert list(ACTION_VERBS) == list(TAXONOMY.levels) == list(COGNITIVE_LEVELS)
+    for level, verbs in TAXONOMY.verbs.items():
+        assert ACTION_VERBS[level].split(", ") == list(verbs)
+
+
+def test_reverse_index_and_ranking():
+    """Every verb maps back to its levels, and levels rank lowest to highest."""
+    assert TAXONOMY.verb_levels["design"] == ("Create",)
+    assert dict(TAXONOMY.ambiguous_verbs) == {
+        "compare": ("Understand", "Analyze"),
+        "contrast": ("Understand", "Analyze"),
+    }
+    assert TAXONOMY.level_rank["Remember"] == 0
+    assert TAXONOMY.level_rank["Create"] == len(TAXONOMY.levels) - 1
+
+
+def test_compiled_taxonomy_is_immutable():
+    """Neither the record nor its tables can be modified."""
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        TAXONOMY.levels = ()
+    with pytest.raises(TypeError):
+        TAXONOMY.verbs["Create"] = ("invent",)
+
+
+def test_verb_pattern_prefers_multi_word_verbs():
+    """A multi-word verb is matched whole rather than by its first word."""
+    taxonomy = compile_taxonomy({"Remember": ["break"], "Analyze": ["break down"]})
+    assert taxonomy.verb_pattern.findall("break down the problem") == ["break down"]
+
+
+def test_action_verbs_table_lists_every_level():
+    """The verbs table has one row per level with its badge and verbs, built once."""
+    table = action_verbs_table_html(TAXONOMY)
+    assert table.count("<tr>") == len(TAXONOMY.levels) + 1
+    for level in TAXONOMY.levels:
+        assert f"{level}</span></td><td>{ACTION_VERBS[level]}</td>" in table
+    assert action_verbs_table_html(TAXONOMY) is table
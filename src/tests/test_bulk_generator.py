@@ -0,0 +1,80 @@
+"""Test cases for the bulk objective generator."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from uoes_learning_objectives.blooms_taxonomy import TAXONOMY
+from uoes_learning_objectives.bulk_generator import (
+    GENERATED_FIELDS,
+    generate_bulk,
+    generate_file,
+    generate_objectives_frame,
+)
+from uoes_learning_objectives.objective_creator import COURSE_LEVELS, LEVEL_TO_BLOOMS
+
+
+@pytest.fixture
+def courses():
+    """Fixture with one course per course level, plus one without topics."""
+    return pd.DataFrame(
+        {
+            "course_level": [*COURSE_LEVELS, "Graduate"],
+            "subject_area": ["Biology", "Chemistry", "History", None, "Physics", "Art"],
+            "key_topics": ["cells, genetics", "atoms", " wars ,  , empires", "proofs", "optics", None],
+        }
+    )
+
+
+def test_generates_one_objective_per_topic_and_level(courses):
+    """Rows follow generate_objectives: each topic once per suggested Bloom's level."""
+    result = generate_objectives_frame(courses, np.random.default_rng(0))
+    assert list(result.columns) == GENERATED_FIELDS
+    assert list(result["topic"]) == [
+        "cells", "cells", "genetics", "genetics", "atoms", "atoms",
+        "wars", "wars", "empires", "empires", "proofs", "proofs", "optics", "optics",
+    ]
+    for row in result.itertuples():
+        assert row.blooms_level in LEVEL_TO_BLOOMS[row.course_level]
+        assert row.verb in TAXONOMY.verbs[row.blooms_level]
+        assert row.objective == (
+            f"By the end of this course, students will be able to {row.verb} {row.topic}."
+        )
+
+
+def test_same_seed_gives_same_output_for_any_chunking(courses):
+    """Output depends only on the seed, not on how the input is chunked."""
+    whole = pd.concat(generate_bulk([courses], seed=42), ignore_index=True)
+    chunked = pd.concat(
+        generate_bulk((courses.iloc[i:i + 2] for i in range(0, len(courses), 2)), seed=42),
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(whole, chunked)
+    other = pd.concat(generate_bulk([courses], seed=7), ignore_index=True)
+    assert not whole["verb"].equals(other["verb"])
+
+
+def test_unknown_course_level_raises(courses):
+    """Course levels the creator does not know are rejected."""
+    courses.loc[0, "course_level"] = "Kindergarten"
+    with pytest.raises(ValueError, match="Unknown course levels: Kindergarten"):
+        generate_objectives_frame(courses, np.random.default_rng(0))
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_generate_file_round_trip(tmp_path, courses, suffix):
+    """Course files are streamed through the generator into CSV or Parquet."""
+    pytest.importorskip("pyarrow")
+    input_path = tmp_path / f"courses{suffix}"
+    if suffix == ".csv":
+        courses.to_csv(input_path, index=False)
+    else:
+        courses.to_parquet(input_path, index=False)
+
+    output_path = tmp_path / f"objectives{suffix}"
+    assert generate_file(input_path, output_path, seed=3, chunk_size=2) == 14
+
+    result = pd.read_csv(output_path) if suffix == ".csv" else pd.read_parquet(output_path)
+    expected = pd.concat(generate_bulk([courses], seed=3), ignore_index=True)
+    assert list(result["objective"]) == list(expected["objective"])
+    assert list(result["course_id"]) == list(expected["course_id"])
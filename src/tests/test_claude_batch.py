@@ -0,0 +1,113 @@
+"""Test cases for batch Claude reviews through the Message Batches API."""
+
+import json
+
+import anthropic
+import pytest
+
+from uoes_learning_objectives.claude_batch import main, run_batch_review
+from uoes_learning_objectives.objective_analyzer import analysis_cache_key, analysis_request
+
+OBJECTIVES = [
+    "Students will be able to analyze data.",
+    "Students will be able to design a study.",
+    "Students will be able to list FAIL cases.",
+    "Students will be able to compare methods.",
+]
+
+
+@pytest.fixture
+def client(stub_anthropic):
+    """Anthropic client talking to the stub server."""
+    client = anthropic.Anthropic(api_key="test", base_url=stub_anthropic.base_url, max_retries=0)
+    yield client
+    client.close()
+
+
+def review(objectives, state_path, client, **kwargs):
+    kwargs.setdefault("sleep", lambda seconds: None)
+    return run_batch_review(objectives, state_path, client, **kwargs)
+
+
+def test_results_are_joined_back_in_row_order(stub_anthropic, client, tmp_path):
+    """Results come back in input order whatever order the batch returns them in."""
+    stub_anthropic.batch_polls = 4
+    waits = []
+    rows = review(OBJECTIVES, tmp_path / "job.sqlite3", client, max_batch_requests=3,
+                  poll_interval=1, max_poll_interval=3, sleep=waits.append)
+
+    assert [objective for objective, _, _ in rows] == OBJECTIVES
+    assert [status for _, status, _ in rows] == ["succeeded", "succeeded", "errored", "succeeded"]
+    assert OBJECTIVES[1] in rows[1][2]
+    assert "stub failure" in rows[2][2]
+    assert len(stub_anthropic.batches) == 2
+    # Polling backs off by doubling, capped at max_poll_interval
+    assert waits == [1, 2, 3]
+
+
+def test_resume_polls_submitted_batches_instead_of_resubmitting(
+    stub_anthropic, client, tmp_path
+):
+    """A job interrupted after submitting picks up its batches on the next run."""
+    state_path = tmp_path / "job.sqlite3"
+    stub_anthropic.batch_polls = 5
+
+    def crash(seconds):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        review(OBJECTIVES, state_path, client, sleep=crash)
+    assert len(stub_anthropic.batches) == 1
+
+    rows = review(OBJECTIVES, state_path, client)
+    assert len(stub_anthropic.batches) == 1
+    assert [status for _, status, _ in rows].count("succeeded") == 3
+
+    # Finished jobs are answered from the checkpoint alone
+    assert review(OBJECTIVES, state_path, client) == rows
+    assert len(stub_anthropic.batches) == 1
+
+
+def test_cached_reviews_are_not_submitted(
+    stub_anthropic, client, tmp_path, in_memory_response_cache
+):
+    """Objectives with a cached review skip the batch, and batch results fill the cache."""
+    objective = OBJECTIVES[0]
+    in_memory_response_cache.set(
+        analysis_cache_key(objective, analysis_request(objective)), "cached review"
+    )
+    rows = review(OBJECTIVES[:2], tmp_path / "job.sqlite3", client)
+
+    assert rows[0] == (objective, "succeeded", "cached review")
+    (batch,) = stub_anthropic.batches.values()
+    assert [request["custom_id"] for request in batch["requests"]] == ["row-1"]
+    second = OBJECTIVES[1]
+    assert in_memory_response_cache.get(
+        analysis_cache_key(second, analysis_request(second))
+    ) == rows[1][2]
+
+
+def test_checkpoint_for_other_input_is_rejected(client, tmp_path):
+    """Reusing a checkpoint with different objectives raises ValueError."""
+    state_path = tmp_path / "job.sqlite3"
+    review(OBJECTIVES[:2], state_path, client)
+    with pytest.raises(ValueError, match="different input"):
+        review(["Students will be able to define terms.", OBJECTIVES[1]], state_path, client)
+    with pytest.raises(ValueError, match="different input"):
+        review(OBJECTIVES[:1], state_path, client)
+
+
+def test_main_writes_reviews(stub_anthropic, tmp_path, monkeypatch, capsys):
+    """The command-line entry point reviews a file through the shared client."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_anthropic.base_url)
+    input_path = tmp_path / "objectives.jsonl"
+    input_path.write_text("".join(json.dumps({"objective": o}) + "\n" for o in OBJECTIVES))
+    output_path = tmp_path / "reviews.jsonl"
+
+    assert main([str(input_path), str(output_path), "--poll-interval", "0"]) == 0
+    rows = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert [row["objective"] for row in rows] == OBJECTIVES
+    assert rows[2]["status"] == "errored"
+    assert (tmp_path / "reviews.batch.sqlite3").exists()
+    assert "Reviewed 4 objectives" in capsys.readouterr().out
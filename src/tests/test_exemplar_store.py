@@ -0,0 +1,98 @@
+"""Test cases for the closest-exemplar store."""
+
+import numpy as np
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from uoes_learning_objectives.exemplar_store import (
+    ExemplarStore,
+    default_store,
+    main,
+    sample_records,
+)
+from uoes_learning_objectives.sample_objectives import SAMPLE_OBJECTIVES
+
+
+def test_search_ranks_the_closest_exemplar_first():
+    """A paraphrase of a sample finds it first, with a cosine similarity in (0, 1]."""
+    (best, *rest) = default_store().search(
+        "Students will explain how object oriented programming works.", k=3
+    )
+    assert (best.discipline, best.level) == ("Computer Science", "Understand")
+    assert best.objective == SAMPLE_OBJECTIVES["Computer Science"]["Understand"]
+    assert 0 < best.score <= 1
+    assert all(exemplar.score <= best.score for exemplar in rest)
+
+
+def test_search_filters_by_discipline_and_level():
+    """Filters restrict results to one discipline and Bloom's level."""
+    store = default_store()
+    results = store.search("design an experiment", k=10, discipline="Biology", level="Create")
+    assert [(e.discipline, e.level) for e in results] == [("Biology", "Create")]
+    assert store.search("design an experiment", discipline="Astronomy") == []
+    assert store.search("   ") == []
+
+
+def test_saved_store_is_memory_mapped(tmp_path):
+    """A saved store opens with memory-mapped arrays and answers the same queries."""
+    store = ExemplarStore.build(sample_records())
+    store.save(tmp_path)
+    loaded = ExemplarStore.load(tmp_path)
+
+    assert isinstance(loaded._arrays["posting_docs"], np.memmap)
+    query = "judge the ethics of genetic engineering"
+    assert loaded.search(query) == store.search(query)
+
+
+def test_unknown_levels_are_rejected():
+    """Records must use the taxonomy's level names."""
+    with pytest.raises(ValueError, match="Memorize"):
+        ExemplarStore.build([("Biology", "Memorize", "List the stages of mitosis.")])
+
+
+def test_main_builds_store_from_corpus(tmp_path, monkeypatch, capsys):
+    """The command-line entry point indexes a corpus file, optionally with the samples."""
+    corpus = tmp_path / "corpus.csv"
+    corpus.write_text(
+        "discipline,level,objective\n"
+        "Chemistry,Apply,Students will be able to balance chemical equations.\n"
+        "Chemistry,Create,Students will be able to design a titration experiment.\n",
+        encoding="utf-8",
+    )
+    output = tmp_path / "store"
+    assert main([str(corpus), str(output), "--include-samples"]) == 0
+    assert "Indexed 38 exemplars" in capsys.readouterr().out
+
+    store = ExemplarStore.load(output)
+    (best, *_) = store.search("balance equations in chemistry")
+    assert (best.discipline, best.level) == ("Chemistry", "Apply")
+
+
+def test_sample_page_shows_closest_exemplars():
+    """The Sample Objectives page lists exemplars for the entered objective."""
+    def app():
+        from uoes_learning_objectives.sample_objectives import display_sample_objectives_page
+
+        display_sample_objectives_page()
+
+    at = AppTest.from_function(app).run()
+    at.text_input[0].input("critique research papers on artificial intelligence").run()
+    assert not at.exception
+    assert any("similarity" in m.value for m in at.markdown)
+
+
+def test_analyzer_shows_exemplars_at_the_detected_level():
+    """The Analyzer lists the closest exemplars at the objective's Bloom's level."""
+    def app():
+        from uoes_learning_objectives.objective_analyzer import objective_analyzer
+
+        objective_analyzer()
+
+    at = AppTest.from_function(app).run()
+    at.text_area[0].input("Students will be able to design an experiment on enzymes.").run()
+    at.button[0].click().run()
+    assert not at.exception
+    (expander,) = [e for e in at.expander if e.label == "Similar sample objectives"]
+    samples = [m.value for m in expander.markdown]
+    assert samples
+    assert all(sample.startswith("- **") and ", Create**" in sample for sample in samples)
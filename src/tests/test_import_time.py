@@ -0,0 +1,76 @@
+"""Import-time regression tests for the Streamlit entry point."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import uoes_learning_objectives
+from uoes_learning_objectives import config
+
+# Modules that must only be loaded once a feature actually needs them
+LAZY_MODULES = ("anthropic", "httpx", "dotenv", "pandas", "numpy")
+
+# Budget for the package's own module bodies, excluding their dependencies
+PACKAGE_SELF_TIME_BUDGET_US = 50_000
+
+
+def importtime(module):
+    """Import module in a fresh interpreter and return {name: (self_us, cumulative_us)}."""
+    # The child must find the package wherever pytest was started from
+    source_dir = str(Path(uoes_learning_objectives.__file__).parents[1])
+    pythonpath = os.pathsep.join(filter(None, [source_dir, os.environ.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": pythonpath},
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+@pytest.fixture(scope="module")
+def app_import_timings():
+    return importtime("uoes_learning_objectives.app")
+
+
+def test_app_import_defers_heavy_dependencies(app_import_timings):
+    """Loading the app does not import the Anthropic SDK, dotenv, pandas or numpy."""
+    loaded = {
+        name for name in app_import_timings
+        if name.split(".")[0] in LAZY_MODULES
+    }
+    assert not loaded
+
+
+def test_app_import_stays_within_budget(app_import_timings):
+    """The package's own modules import quickly."""
+    package_self_time = sum(
+        self_us for name, (self_us, _) in app_import_timings.items()
+        if name.startswith("uoes_learning_objectives")
+    )
+    assert package_self_time < PACKAGE_SELF_TIME_BUDGET_US
+
+
+def test_env_file_is_parsed_once(monkeypatch):
+    """get_api_key loads .env on first use only."""
+    import dotenv
+
+    calls = []
+    monkeypatch.setattr(dotenv, "load_dotenv", lambda *args, **kwargs: calls.append(1))
+    config.load_environment.cache_clear()
+    try:
+        config.get_api_key()
+        config.get_api_key()
+    finally:
+        config.load_environment.cache_clear()
+    assert len(calls) == 1
@@ -0,0 +1,69 @@
+"""Test cases for the incremental live analysis."""
+
+import random
+
+import pytest
+
+from uoes_learning_objectives.live_analysis import (
+    analyze_incrementally,
+    live_analysis,
+    segment_features,
+    split_segments,
+)
+from uoes_learning_objectives.objective_analyzer import analyze
+from uoes_learning_objectives.sample_objectives import SAMPLE_OBJECTIVES
+
+SYLLABUS = "\n".join(
+    objective for levels in SAMPLE_OBJECTIVES.values() for objective in levels.values()
+)
+
+
+def random_edits(text, count, seed=0):
+    """Yield text after each of count random single-character insertions or deletions."""
+    rng = random.Random(seed)
+    alphabet = "abcdefg .!?\n"
+    for _ in range(count):
+        position = rng.randrange(len(text) + 1)
+        if text and rng.random() < 0.3:
+            text = text[:position - 1] + text[position:]
+        else:
+            text = text[:position] + rng.choice(alphabet) + text[position:]
+        yield text
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "Students will be able to analyze data.",
+        "By the end of the course. Students will be able to design a study!",
+        "by the end\nof the course, create?",
+        SYLLABUS,
+        *random_edits(SYLLABUS[:400], 50),
+    ],
+)
+def test_incremental_analysis_matches_whole_text_analysis(text):
+    """Combining per-segment features gives exactly the whole-text results."""
+    assert analyze_incrementally(text) == analyze(text)
+
+
+def test_split_segments_round_trips():
+    """Segments join back to the original text."""
+    assert "".join(split_segments(SYLLABUS)) == SYLLABUS
+    assert split_segments("One. Two!\nThree") == ["One.", " Two!", "\n", "Three"]
+
+
+def test_edit_only_rescans_changed_segment():
+    """After an edit only the edited segment misses the feature cache."""
+    analyze_incrementally(SYLLABUS)
+    misses = segment_features.cache_info().misses
+
+    analyze_incrementally(SYLLABUS.replace("design", "devise", 1))
+    assert segment_features.cache_info().misses == misses + 1
+
+
+def test_unchanged_normalized_text_reuses_previous_result():
+    """Whitespace-only changes at the ends of the text skip re-analysis."""
+    previous = live_analysis("Students will be able to analyze data.")
+    assert live_analysis("  Students will be able to analyze data.\n", previous) is previous
+    assert live_analysis("Students will be able to analyze text.", previous) is not previous
@@ -0,0 +1,186 @@
+"""Test cases for the instrumentation layer."""
+
+import logging
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from uoes_learning_objectives import metrics
+from uoes_learning_objectives.anthropic_client import create_message, get_anthropic_client
+from uoes_learning_objectives.objective_analyzer import (
+    analysis_request,
+    analyze_objective_with_anthropic,
+    stream_objective_analysis,
+)
+from uoes_learning_objectives.prompts import MIN_CACHEABLE_TOKENS, estimate_tokens, system_prompt
+from uoes_learning_objectives.sample_objectives import SAMPLE_OBJECTIVES
+
+
+@pytest.fixture
+def enabled_metrics(tmp_path):
+    """Fixture recording metrics into a clean registry for the test's duration."""
+    metrics.REGISTRY.clear()
+    metrics.enable(True, profile_dir=tmp_path / "profiles", metrics_file=tmp_path / "metrics.prom")
+    yield tmp_path
+    metrics.enable(False)
+    metrics.REGISTRY.clear()
+
+
+def test_disabled_metrics_record_nothing():
+    """Recording functions are no-ops while metrics are disabled."""
+    metrics.REGISTRY.clear()
+    metrics.increment("test_total")
+    metrics.observe("test_seconds", 0.1)
+    with metrics.timer("test_seconds"):
+        pass
+    text = metrics.render_prometheus()
+    assert "test_total" not in text
+    assert "test_seconds" not in text
+
+
+def test_renders_counters_and_histograms(enabled_metrics):
+    """Counters and histograms are exported in the Prometheus text format."""
+    metrics.increment("test_total", page="Analyzer")
+    metrics.increment("test_total", 2, page="Analyzer")
+    metrics.observe("test_seconds", 0.02)
+    metrics.observe("test_seconds", 3.0)
+
+    text = metrics.render_prometheus()
+    assert "# TYPE test_total counter" in text
+    assert 'test_total{page="Analyzer"} 3' in text
+    assert "# TYPE test_seconds histogram" in text
+    assert 'test_seconds_bucket{le="0.01"} 0' in text
+    assert 'test_seconds_bucket{le="0.025"} 1' in text
+    assert 'test_seconds_bucket{le="+Inf"} 2' in text
+    assert "test_seconds_sum 3.02" in text
+    assert "test_seconds_count 2" in text
+
+
+def test_timed_decorator_and_collectors(enabled_metrics):
+    """Decorated functions are timed and collectors are exported as gauges."""
+
+    @metrics.timed("test_call_seconds", function="double")
+    def double(x):
+        return 2 * x
+
+    assert double(4) == 8
+    metrics.register_collector("test_cache", lambda: {"hits": 3, "memory-entries": 1})
+
+    text = metrics.render_prometheus()
+    assert 'test_call_seconds_count{function="double"} 1' in text
+    assert "test_cache_hits 3" in text
+    assert "test_cache_memory_entries 1" in text
+
+
+def test_write_prometheus_and_profile_capture(enabled_metrics):
+    """Metrics are written to the configured file and profiles to the profile directory."""
+    with metrics.profile_request("Objective Analyzer"):
+        sum(range(1000))
+    metrics.increment("test_total")
+    metrics.write_prometheus()
+
+    assert "test_total 1" in (enabled_metrics / "metrics.prom").read_text()
+    (profile,) = (enabled_metrics / "profiles").iterdir()
+    assert profile.name.startswith("Objective_Analyzer-")
+
+
+def test_concurrent_writes_and_profiles(enabled_metrics):
+    """Sessions rendering at once neither collide on the metrics file nor on the profiler."""
+    inside, release = threading.Event(), threading.Event()
+
+    def render(i):
+        with metrics.profile_request("Objective Analyzer"):
+            if i == 0:
+                inside.set()
+                release.wait(5)
+            metrics.write_prometheus()
+
+    with ThreadPoolExecutor(8) as pool:
+        first = pool.submit(render, 0)
+        inside.wait(5)
+        list(pool.map(render, range(1, 200)))
+        release.set()
+        first.result()
+
+    assert "uoes_metrics_write_errors_total" not in metrics.render_prometheus()
+    assert sorted(p.name for p in enabled_metrics.iterdir()) == ["metrics.prom", "profiles"]
+    assert len(list((enabled_metrics / "profiles").iterdir())) == 1
+
+
+def test_metrics_server_serves_metrics(enabled_metrics):
+    """The local endpoint serves the current metrics."""
+    server = metrics.start_metrics_server(0)
+    metrics.increment("test_total")
+    url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+    with urllib.request.urlopen(url) as response:
+        assert "test_total 1" in response.read().decode()
+
+
+def test_anthropic_calls_record_latency_tokens_and_cache(enabled_metrics, stub_anthropic, monkeypatch):
+    """Claude calls record latency and token usage; cache hits show up as gauges."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_anthropic.base_url)
+
+    analyze_objective_with_anthropic("Students will explain recursion.")
+    analyze_objective_with_anthropic("Students will explain recursion.")
+    "".join(stream_objective_analysis("Students will design a compiler."))
+
+    text = metrics.render_prometheus()
+    assert 'uoes_anthropic_request_seconds_count{operation="analysis"} 2' in text
+    assert 'uoes_anthropic_tokens_total{direction="input",operation="analysis"} 20' in text
+    assert 'uoes_anthropic_tokens_total{direction="output",operation="analysis"} 10' in text
+    assert "uoes_response_cache_memory_hits 1" in text
+    assert len(stub_anthropic.requests) == 2
+
+
+def test_prompt_cache_tokens_are_logged_and_recorded(enabled_metrics, stub_anthropic, monkeypatch, caplog):
+    """The shared system prompt is sent with a cache breakpoint; cache usage is logged and counted."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_anthropic.base_url)
+    caplog.set_level(logging.INFO, logger="uoes_learning_objectives.anthropic_client")
+
+    analyze_objective_with_anthropic("Students will explain recursion.")
+    "".join(stream_objective_analysis("Students will design a compiler."))
+
+    first, second = stub_anthropic.requests
+    assert first["system"] == second["system"]
+    assert first["system"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert "Students will explain recursion." in first["messages"][-1]["content"]
+    assert "Bloom's Taxonomy" not in first["messages"][-1]["content"]
+    # Below the minimum cacheable length the breakpoint has no effect
+    assert "cache_write=0 cache_read=0" in caplog.messages[0]
+    assert 'direction="cache_read"' not in metrics.render_prometheus()
+
+    # A prefix long enough to cache is written once and read afterwards
+    client = get_anthropic_client()
+    request = dict(analysis_request("Students will explain recursion."))
+    text = "Reference material. " * (MIN_CACHEABLE_TOKENS // 4)
+    request["system"] = [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+    create_message(client, request, "analysis")
+    create_message(client, request, "analysis")
+    tokens = estimate_tokens(text)
+    assert caplog.messages[-1].endswith(f"cache_write=0 cache_read={tokens}")
+    text = metrics.render_prometheus()
+    assert f'uoes_anthropic_tokens_total{{direction="cache_write",operation="analysis"}} {tokens}' in text
+    assert f'uoes_anthropic_tokens_total{{direction="cache_read",operation="analysis"}} {tokens}' in text
+
+
+def test_system_prompt_holds_only_instructions_and_reference_tables():
+    """The system prompt is not padded with examples to reach the minimum cacheable length."""
+    prompt = system_prompt()
+    assert "Action verbs: define, list" in prompt
+    assert "Example objectives" not in prompt
+    assert SAMPLE_OBJECTIVES["Biology"]["Create"] not in prompt
+    assert estimate_tokens(prompt) < MIN_CACHEABLE_TOKENS // 2
+
+
+def test_anthropic_errors_are_counted(enabled_metrics, stub_anthropic, monkeypatch):
+    """Failed Claude calls increment the error counter."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_anthropic.base_url)
+    stub_anthropic.failures = [(400, {})]
+
+    assert analyze_objective_with_anthropic("Students will list primes.").startswith("Error")
+    assert 'uoes_anthropic_errors_total{operation="analysis"} 1' in metrics.render_prometheus()
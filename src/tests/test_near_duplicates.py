@@ -0,0 +1,123 @@
+"""Test cases for the near-duplicate objective index."""
+
+import anthropic
+import pytest
+
+from uoes_learning_objectives.claude_batch import run_batch_review
+from uoes_learning_objectives.near_duplicates import (
+    DEFAULT_DUPLICATE_THRESHOLD,
+    MIN_DUPLICATE_THRESHOLD,
+    MinHashIndex,
+    canonical_text,
+    duplicate_groups,
+    minhash,
+)
+from uoes_learning_objectives.sample_objectives import SAMPLE_OBJECTIVES
+
+OBJECTIVE = (
+    "By the end of this course, students will be able to explain the principles of "
+    "object-oriented programming."
+)
+VARIANTS = [
+    "By the end of CS 101, students will be able to  explain the principles of object oriented "
+    "programming",
+    "Students will be able to explain the principles of Object-Oriented Programming!",
+    "explain the principles of object-oriented programming.",
+]
+
+
+def test_canonical_text_drops_boilerplate():
+    """Lead-ins, course codes, case and punctuation do not distinguish objectives."""
+    expected = "explain the principles of object oriented programming"
+    assert canonical_text(OBJECTIVE) == expected
+    assert all(canonical_text(variant) == expected for variant in VARIANTS)
+
+
+def test_numbers_that_are_not_course_codes_are_kept():
+    """Objectives that differ only in years or numbers are not duplicates."""
+    objectives = [
+        "Students will be able to analyze European art from 1600 to 1700.",
+        "Students will be able to analyze European art from 1800 to 1900.",
+        "Students will be able to compare the causes of WWI and WWII.",
+        "Students will be able to compare the causes of WWII and the Cold War.",
+    ]
+    assert canonical_text(objectives[0]) == "analyze european art from 1600 to 1700"
+    assert duplicate_groups(objectives) == ([0, 1, 2, 3], [0, 1, 2, 3])
+
+
+def test_duplicate_groups_fan_out_to_first_occurrence():
+    """Near duplicates share the group of their first occurrence."""
+    other = "By the end of this course, students will be able to list the stages of cell division."
+    near = "By the end of this course, students will be able to list the stages of cell-division!"
+    representatives, groups = duplicate_groups([OBJECTIVE, *VARIANTS, other, near, OBJECTIVE])
+    assert representatives == [0, 4]
+    assert groups == [0, 0, 0, 0, 1, 1, 0]
+
+
+# Pairs whose texts overlap heavily but that mean different things
+DIFFERENT_MEANING = [
+    (
+        "By the end of this course, students will be able to analyze the structure and "
+        "function of proteins in living cells.",
+        "By the end of this course, students will be able to evaluate the structure and "
+        "function of proteins in living cells.",
+    ),
+    (
+        "Students will be able to explain the causes and consequences of the French Revolution.",
+        "Students will be able to explain the causes and consequences of the American Revolution.",
+    ),
+]
+
+
+@pytest.mark.parametrize("pair", DIFFERENT_MEANING)
+@pytest.mark.parametrize("threshold", [None, DEFAULT_DUPLICATE_THRESHOLD, MIN_DUPLICATE_THRESHOLD])
+def test_objectives_with_different_words_are_not_duplicates(pair, threshold):
+    """Different action verbs or content words keep objectives apart, even with fuzzy matching."""
+    assert duplicate_groups(pair, threshold) == ([0, 1], [0, 1])
+
+
+def test_fuzzy_matching_is_opt_in_with_a_high_threshold():
+    """Only a threshold merges objectives differing in filler words, and low thresholds are refused."""
+    pair = [
+        "Students will be able to design and conduct a controlled experiment that tests a "
+        "hypothesis about the effect of temperature on enzyme activity in the laboratory.",
+        "Students will be able to design and conduct a controlled experiment that tests a "
+        "hypothesis about the effect of temperature on enzyme activity in a laboratory.",
+    ]
+    assert duplicate_groups(pair) == ([0, 1], [0, 1])
+    assert duplicate_groups(pair, MIN_DUPLICATE_THRESHOLD) == ([0], [0, 0])
+    with pytest.raises(ValueError):
+        duplicate_groups(pair, 0.8)
+
+
+def test_index_query_and_round_trip(tmp_path):
+    """Queries rank by similarity, and a saved index answers the same queries."""
+    index = MinHashIndex()
+    for discipline, objectives in SAMPLE_OBJECTIVES.items():
+        for level, objective in objectives.items():
+            index.add((discipline, level), objective)
+
+    matches = index.query(SAMPLE_OBJECTIVES["Biology"]["Create"], threshold=0.5)
+    assert matches[0] == (("Biology", "Create"), 1.0)
+
+    path = tmp_path / "index.npz"
+    index.save(path)
+    loaded = MinHashIndex.load(path)
+    assert len(loaded) == len(index)
+    assert loaded.query(SAMPLE_OBJECTIVES["Biology"]["Create"], threshold=0.5) == matches
+    assert (minhash(OBJECTIVE) == minhash(VARIANTS[0])).all()
+
+
+def test_batch_review_submits_each_duplicate_group_once(stub_anthropic, tmp_path):
+    """Only one objective per group is submitted and its review is copied to the rest."""
+    client = anthropic.Anthropic(api_key="test", base_url=stub_anthropic.base_url, max_retries=0)
+    objectives = [OBJECTIVE, *VARIANTS, "Students will be able to design a bridge."]
+    rows = run_batch_review(objectives, tmp_path / "job.sqlite3", client,
+                            sleep=lambda seconds: None, dedupe=True)
+    client.close()
+
+    (batch,) = stub_anthropic.batches.values()
+    assert len(batch["requests"]) == 2
+    assert [objective for objective, _, _ in rows] == objectives
+    assert len({review for _, _, review in rows[:4]}) == 1
+    assert rows[4][2] != rows[0][2]
@@ -0,0 +1,132 @@
+"""Test cases for the learning objective analyzer heuristics."""
+
+import json
+import re
+
+import pandas as pd
+import pytest
+
+from uoes_learning_objectives.blooms_taxonomy import (
+    ACTION_VERBS,
+    EXAMPLE_OBJECTIVES,
+    RUBRIC_CRITERIA,
+)
+from uoes_learning_objectives.objective_analyzer import (
+    analyze,
+    basic_objective_analysis,
+    cached_analysis,
+    contains_action_verb,
+    evaluate_objective_rubric,
+    find_action_verbs,
+    identify_blooms_level,
+    score_frame,
+)
+from uoes_learning_objectives.sample_objectives import SAMPLE_OBJECTIVES
+
+
+def legacy_identify_blooms_level(objective):
+    """Reference implementation scanning one regex per verb, highest level first."""
+    for level in ["Create", "Evaluate", "Analyze", "Apply", "Understand", "Remember"]:
+        for verb in ACTION_VERBS[level].split(", "):
+            if re.search(r"\b" + verb + r"\b", objective.lower()):
+                return level
+    return None
+
+
+OBJECTIVES = [
+    *EXAMPLE_OBJECTIVES.values(),
+    *(o for levels in SAMPLE_OBJECTIVES.values() for o in levels.values()),
+    "",
+    "Learn things",
+    "Students will COMPARE and Contrast sorting algorithms.",
+    "Students will re-use designs; testing is not test-driven.",
+    "Listing, naming and labelling are not verbs here.",
+]
+
+
+@pytest.mark.parametrize("objective", OBJECTIVES)
+def test_identify_blooms_level_matches_legacy_scan(objective):
+    """The single-pass matcher agrees with the per-verb regex scan."""
+    assert identify_blooms_level(objective) == legacy_identify_blooms_level(objective)
+
+
+def test_find_action_verbs_reports_every_level_for_ambiguous_verbs():
+    """Verbs listed under several levels are reported once per level."""
+    matches = find_action_verbs("Students will compare and design.")
+    assert matches == [
+        ("compare", "Understand"),
+        ("compare", "Analyze"),
+        ("design", "Create"),
+    ]
+
+
+def test_contains_action_verb():
+    """contains_action_verb only reports levels whose verbs are present."""
+    objective = "Students will be able to list the stages of cell division."
+    assert contains_action_verb(objective, "Remember")
+    assert not contains_action_verb(objective, "Create")
+    assert not contains_action_verb(objective, "Unknown")
+
+
+def test_score_frame_matches_per_objective_rubric():
+    """Columnar scoring gives the same scores as evaluate_objective_rubric."""
+    objectives = OBJECTIVES + [None]
+    df = pd.DataFrame({"objective": objectives}, index=range(10, 10 + len(objectives)))
+    scores = score_frame(df)
+
+    assert list(scores.columns) == [*RUBRIC_CRITERIA, "Average"]
+    assert scores.index.equals(df.index)
+    for index, objective in zip(df.index, objectives):
+        expected = evaluate_objective_rubric(objective or "")
+        assert scores.loc[index, list(RUBRIC_CRITERIA)].tolist() == list(expected.values())
+        assert scores.loc[index, "Average"] == pytest.approx(sum(expected.values()) / len(expected))
+
+
+NON_ASCII_OBJECTIVES = [
+    "Students will listé things",
+    "Students will éxplain the naïve approach by the end of the semester.",
+    "Étudiants: analyser, design and café-list ﬁles.",
+    "Students will İdentify and CREATE models.",
+]
+
+
+@pytest.mark.parametrize("dtype", [None, "string"])
+def test_score_frame_matches_analyze_on_non_ascii_text(dtype):
+    """Verb boundaries next to non-ASCII letters score like analyze(), whatever the string dtype."""
+    df = pd.DataFrame({"objective": pd.Series(NON_ASCII_OBJECTIVES, dtype=dtype)})
+    scores = score_frame(df)
+    for index, objective in enumerate(NON_ASCII_OBJECTIVES):
+        expected = analyze(objective).scores
+        assert scores.loc[index, list(RUBRIC_CRITERIA)].tolist() == list(expected.values())
+
+
+@pytest.mark.parametrize("objective", OBJECTIVES + ["By the end of class, solve it"])
+def test_analyze_matches_legacy_heuristics(objective):
+    """The single-pass analysis agrees with the original per-function heuristics."""
+    result = analyze(objective)
+    assert result.level == legacy_identify_blooms_level(objective)
+    assert [(m.verb, m.level) for m in result.verbs] == find_action_verbs(objective)
+    for match in result.verbs:
+        assert result.lowered[match.start:match.end] == match.verb
+    assert (list(result.strengths), list(result.suggestions)) == basic_objective_analysis(objective)
+    assert result.scores == evaluate_objective_rubric(objective)
+
+
+def test_analysis_result_is_slotted_and_serializable():
+    """Results have no per-instance dict and convert to plain JSON."""
+    result = analyze("By the end of this course, students will be able to compare designs.")
+    assert not hasattr(result, "__dict__")
+    data = json.loads(json.dumps(result.to_dict()))
+    assert data["level"] == "Analyze"
+    assert data["verbs"][0] == {"start": 52, "end": 59, "verb": "compare", "level": "Understand"}
+    assert data["scores"] == dict(zip(RUBRIC_CRITERIA, [3, 2, 4, 3, 4, 3]))
+    assert data["average_score"] == result.average_score
+
+
+def test_cached_results_cannot_be_mutated():
+    """Shared cached results expose tuples and a read-only score mapping."""
+    result = cached_analysis("Students will be able to list the stages of mitosis.")
+    assert isinstance(result.suggestions, tuple)
+    with pytest.raises(TypeError):
+        result.scores["Specific"] = 5
+    assert cached_analysis(result.objective) is result
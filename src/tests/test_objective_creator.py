@@ -0,0 +1,65 @@
+"""Test cases for the learning objective creator page."""
+
+from streamlit.testing.v1 import AppTest
+
+from uoes_learning_objectives import objective_creator as creator
+from uoes_learning_objectives.objective_creator import level_verb_lists
+
+
+def creator_app():
+    def app():
+        from uoes_learning_objectives.objective_creator import objective_creator
+
+        objective_creator()
+
+    return AppTest.from_function(app).run()
+
+
+def generated(at):
+    return [m.value for m in at.markdown if m.value.startswith("- ")]
+
+
+def test_each_click_generates_new_objectives(monkeypatch):
+    """Every Generate Objectives click draws a fresh set of objectives."""
+    calls = []
+
+    def fake_generate(course_level, key_topics, subject_area):
+        calls.append(key_topics)
+        return [f"Draw {len(calls)}: {key_topics}"]
+
+    monkeypatch.setattr(creator, "generate_objectives", fake_generate)
+    at = creator_app()
+    at.text_area(key="key_topics").input("cell division, genetics").run()
+    at.button[0].click().run()
+    assert generated(at) == ["- Draw 1: cell division, genetics"]
+
+    # Same inputs, new click: the objectives are drawn again
+    at.button[0].click().run()
+    assert generated(at) == ["- Draw 2: cell division, genetics"]
+
+    at.text_area(key="key_topics").input("evolution").run()
+    at.button[0].click().run()
+    assert generated(at) == ["- Draw 3: evolution"]
+
+
+def test_reruns_within_a_click_reuse_generated_objectives(monkeypatch):
+    """Objectives are memoized per session on the normalized inputs and the click."""
+    calls = []
+    monkeypatch.setattr(
+        creator, "generate_objectives", lambda *args: calls.append(args) or ["objective"]
+    )
+    monkeypatch.setattr(creator.st, "session_state", {"objectives_generation": 1})
+    first = creator.session_objectives("100-level (introductory)", "cells, genetics", "Biology")
+    # Whitespace-only changes keep the same objectives
+    again = creator.session_objectives("100-level (introductory)", " cells,  genetics ", "Biology ")
+    assert again is first
+    assert len(calls) == 1
+
+    creator.st.session_state["objectives_generation"] = 2
+    creator.session_objectives("100-level (introductory)", "cells, genetics", "Biology")
+    assert len(calls) == 2
+
+
+def test_level_verb_lists():
+    """The verb lists follow the Bloom's levels suggested for the course level."""
+    assert [level for level, _ in level_verb_lists("Graduate")] == ["Evaluate", "Create"]
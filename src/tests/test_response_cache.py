@@ -0,0 +1,87 @@
+"""Test cases for the Claude response cache."""
+
+from uoes_learning_objectives.objective_analyzer import analyze_objective_with_anthropic
+from uoes_learning_objectives.objective_creator import get_anthropic_objectives
+from uoes_learning_objectives.response_cache import ResponseCache, cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def key(text, **overrides):
+    params = {"model": "m", "temperature": 0.2, "max_tokens": 10}
+    params.update(overrides)
+    return cache_key("analysis", "1", text, **params)
+
+
+def test_cache_key_normalizes_text_and_covers_parameters():
+    """Case and whitespace do not matter; request parameters do."""
+    assert key("Students  will\nDESIGN ") == key("students will design")
+    assert key("x") != key("x", temperature=0.5)
+    assert key("x") != key("x", max_tokens=20)
+    assert key("x") != cache_key("analysis", "2", "x", "m", 0.2, 10)
+
+
+def test_disk_tier_survives_restart_and_counts_hits(tmp_path):
+    """Values persist in SQLite and are promoted back into memory."""
+    path = tmp_path / "cache.sqlite3"
+    cache = ResponseCache(path)
+    assert cache.get("a") is None
+    cache.set("a", ["line 1", "line 2"])
+    assert cache.get("a") == ["line 1", "line 2"]
+    cache.close()
+
+    reopened = ResponseCache(path)
+    assert reopened.get("a") == ["line 1", "line 2"]
+    assert reopened.get("a") == ["line 1", "line 2"]
+    stats = reopened.stats()
+    assert (stats["disk_hits"], stats["memory_hits"], stats["misses"]) == (1, 1, 0)
+
+
+def test_ttl_and_size_eviction(tmp_path):
+    """Expired entries miss, and the disk tier drops least recently used entries."""
+    clock = FakeClock()
+    cache = ResponseCache(
+        tmp_path / "cache.sqlite3", ttl=60, max_memory_entries=1, max_disk_entries=2,
+        clock=clock,
+    )
+    cache.set("a", "A")
+    clock.now += 1
+    cache.set("b", "B")
+    clock.now += 1
+    assert cache.get("a") == "A"
+    clock.now += 1
+    cache.set("c", "C")
+    assert cache.get("b") is None
+    assert cache.stats()["disk_entries"] == 2
+
+    clock.now += 120
+    assert cache.get("a") is None
+
+
+def test_analysis_is_served_from_cache(stub_anthropic, monkeypatch):
+    """A repeated analysis of the same objective does not call the API again."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_anthropic.base_url)
+    first = analyze_objective_with_anthropic("Students will design a bridge.")
+    second = analyze_objective_with_anthropic("students will  design a bridge.")
+    assert first == second
+    assert len(stub_anthropic.requests) == 1
+
+
+def test_errors_are_not_cached(stub_anthropic, monkeypatch):
+    """Failed requests are retried on the next call instead of being cached."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_anthropic.base_url)
+    stub_anthropic.failures = [(400, {})]
+    first = get_anthropic_objectives("Graduate", "ethics", "Philosophy")
+    assert first[0].startswith("Error communicating")
+    second = get_anthropic_objectives("Graduate", "ethics", "Philosophy")
+    assert second[0].startswith("echo: ")
+    assert get_anthropic_objectives("Graduate", "ethics", "Philosophy") == second
+    assert len(stub_anthropic.requests) == 2
@@ -0,0 +1,115 @@
+"""Test cases for the headless analysis service."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from uoes_learning_objectives.blooms_taxonomy import RUBRIC_CRITERIA
+from uoes_learning_objectives.objective_analyzer import cached_analysis
+from uoes_learning_objectives.service import app
+from uoes_learning_objectives.structured_output import REVIEW_TOOL_NAME
+
+
+def request(method, path, **kwargs):
+    """Send one request to the ASGI app and return the response."""
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, path, **kwargs)
+
+    return asyncio.run(run())
+
+
+def test_levels_lists_taxonomy_in_order():
+    """GET /levels returns every level with its verbs, and the course mapping."""
+    response = request("GET", "/levels")
+    assert response.status_code == 200
+    body = response.json()
+    assert [level["name"] for level in body["levels"]][0] == "Remember"
+    assert all(level["verbs"] for level in body["levels"])
+    assert list(body["rubric_criteria"]) == list(RUBRIC_CRITERIA)
+    assert body["course_levels"]["100-level (introductory)"]
+
+
+def test_analyze_matches_cached_analysis():
+    """POST /analyze returns the same analysis as the UI."""
+    objective = "Students will be able to analyze survey data."
+    response = request("POST", "/analyze", json={"objective": objective})
+    assert response.status_code == 200
+    assert response.json() == cached_analysis(objective).to_dict()
+
+
+def test_analyze_batch_streams_one_line_per_objective():
+    """POST /analyze/batch answers with indexed NDJSON lines in input order."""
+    objectives = [f"Explain topic {i}." for i in range(450)]
+    response = request("POST", "/analyze/batch", json={"objectives": objectives})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["index"] for line in lines] == list(range(450))
+    assert lines[0]["level"] == cached_analysis(objectives[0]).to_dict()["level"]
+
+
+@pytest.mark.parametrize(
+    "method, path, kwargs, status",
+    [
+        ("POST", "/analyze", {"content": b"not json"}, 400),
+        ("POST", "/analyze", {"json": {"objective": 3}}, 400),
+        ("POST", "/analyze/batch", {"json": {"objectives": "Explain."}}, 400),
+        ("POST", "/analyze", {"json": {"objective": "Explain.", "claude": "false"}}, 400),
+        ("POST", "/generate", {"json": {"course_level": "PhD", "key_topics": "x"}}, 400),
+        ("GET", "/analyze", {}, 405),
+        ("GET", "/missing", {}, 404),
+    ],
+)
+def test_errors_are_json(method, path, kwargs, status):
+    """Bad requests get an HTTP error status with a JSON error message."""
+    response = request(method, path, **kwargs)
+    assert response.status_code == status
+    assert response.json()["error"]
+
+
+def test_generate_accepts_topic_list():
+    """POST /generate drafts objectives for a list of topics."""
+    response = request("POST", "/generate", json={
+        "course_level": "100-level (introductory)",
+        "key_topics": ["cells", "genetics"],
+        "subject_area": "Biology",
+    })
+    assert response.status_code == 200
+    assert response.json()["objectives"]
+
+
+REVIEW = {
+    "strengths": ["Uses a clear action verb"],
+    "suggestions": ["Add a time frame"],
+    "blooms_level": "Analyze",
+    "scores": {criterion: 4 for criterion in RUBRIC_CRITERIA},
+}
+
+
+def test_analyze_with_claude_review(stub_anthropic, monkeypatch):
+    """"claude": true adds a structured review from Claude."""
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_anthropic.base_url)
+    stub_anthropic.tool_inputs[REVIEW_TOOL_NAME] = REVIEW
+
+    response = request("POST", "/analyze", json={"objective": "Analyze data.", "claude": True})
+    assert response.status_code == 200
+    assert response.json()["claude"] == REVIEW
+
+
+def test_claude_errors_are_told_apart(stub_anthropic, monkeypatch):
+    """A missing API key is the client's problem (400); an invalid Claude response is not (502)."""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    body = {"objective": "Analyze data.", "claude": True}
+    assert request("POST", "/analyze", json=body).status_code == 400
+
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub_anthropic.base_url)
+    stub_anthropic.tool_inputs[REVIEW_TOOL_NAME] = dict(REVIEW, blooms_level="Memorize")
+    response = request("POST", "/analyze", json=body)
+    assert response.status_code == 502
+    assert "Invalid response" in response.json()["error"]
@@ -0,0 +1,43 @@
+"""Test cases for streaming Claude responses."""
+
+from uoes_learning_objectives.objective_analyzer import stream_objective_analysis
+from uoes_learning_objectives.objective_creator import (
+    get_anthropic_objectives,
+    stream_anthropic_objectives,
+)
+
+
+def use_stub(stub, monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stub.base_url)
+
+
+def test_stream_objective_analysis_yields_partial_text(stub_anthropic, monkeypatch):
+    """The analysis arrives in several fragments and is cached once complete."""
+    use_stub(stub_anthropic, monkeypatch)
+    chunks = list(stream_objective_analysis("Students will design a bridge."))
+    assert len(chunks) > 1
+    assert "".join(chunks).endswith("Students will design a bridge.")
+    assert stub_anthropic.requests[0]["stream"] is True
+
+    assert list(stream_objective_analysis("Students will design a bridge.")) == ["".join(chunks)]
+    assert len(stub_anthropic.requests) == 1
+
+
+def test_cancelled_stream_is_not_cached(stub_anthropic, monkeypatch):
+    """Closing the generator early aborts the stream without caching it."""
+    use_stub(stub_anthropic, monkeypatch)
+    stream = stream_objective_analysis("Students will design a bridge.")
+    next(stream)
+    stream.close()
+
+    list(stream_objective_analysis("Students will design a bridge."))
+    assert len(stub_anthropic.requests) == 2
+
+
+def test_streamed_objectives_share_cache_with_list_api(stub_anthropic, monkeypatch):
+    """A completed stream is cached as the line list get_anthropic_objectives returns."""
+    use_stub(stub_anthropic, monkeypatch)
+    text = "".join(stream_anthropic_objectives("Graduate", "ethics", "Philosophy"))
+    assert get_anthropic_objectives("Graduate", "ethics", "Philosophy") == text.split("\n")
+    assert len(stub_anthropic.requests) == 1
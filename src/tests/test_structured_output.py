@@ -0,0 +1,144 @@
+"""Test cases for structured Claude reviews and suggestions."""
+
+import csv
+
+import anthropic
+import pytest
+
+from uoes_learning_objectives.blooms_taxonomy import RUBRIC_CRITERIA
+from uoes_learning_objectives.claude_batch import run_batch_review, write_reviews
+from uoes_learning_objectives.objective_analyzer import evaluate_objective_rubric
+from uoes_learning_objectives.structured_output import (
+    OBJECTIVES_TOOL_NAME,
+    REVIEW_TOOL,
+    REVIEW_TOOL_NAME,
+    SuggestedObjective,
+    parse_objectives,
+    parse_review,
+    review_objective,
+    suggest_objectives,
+)
+
+REVIEW = {
+    "strengths": ["Uses a clear action verb"],
+    "suggestions": ["Add a time frame"],
+    "blooms_level": "Analyze",
+    "scores": {criterion: 4 for criterion in RUBRIC_CRITERIA},
+}
+
+
+@pytest.fixture
+def client(stub_anthropic):
+    """Anthropic client talking to the stub server."""
+    client = anthropic.Anthropic(api_key="test", base_url=stub_anthropic.base_url, max_retries=0)
+    yield client
+    client.close()
+
+
+def test_parse_review_round_trips():
+    """A valid review parses, keeps rubric order and converts back to the same data."""
+    shuffled = dict(REVIEW, scores=dict(reversed(list(REVIEW["scores"].items()))))
+    review = parse_review(shuffled)
+
+    assert list(review.scores) == list(RUBRIC_CRITERIA)
+    assert review.to_dict() == REVIEW
+    assert review.average_score == 4
+    assert set(review.score_differences(evaluate_objective_rubric("Analyze data."))) == set(
+        RUBRIC_CRITERIA
+    )
+
+
+def test_reviews_cannot_be_mutated():
+    """A parsed review has read-only scores and does not share the input's dict."""
+    data = dict(REVIEW, scores=dict(REVIEW["scores"]))
+    review = parse_review(data)
+    with pytest.raises(TypeError):
+        review.scores["Specific"] = 1
+    data["scores"]["Specific"] = 1
+    assert review.scores["Specific"] == 4
+
+
+def test_review_schema_requires_every_criterion():
+    """The tool schema asks for exactly the RUBRIC_CRITERIA scores."""
+    scores = REVIEW_TOOL["input_schema"]["properties"]["scores"]
+    assert scores["required"] == list(RUBRIC_CRITERIA)
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"blooms_level": "Memorize"},
+        {"strengths": "one string"},
+        {"suggestions": [1]},
+        {"scores": {**REVIEW["scores"], "Specific": 6}},
+        {"scores": {**REVIEW["scores"], "Specific": True}},
+        {"scores": {**REVIEW["scores"], "Specific": "4"}},
+        {"scores": {criterion: 3 for criterion in list(RUBRIC_CRITERIA)[1:]}},
+        {"scores": {**REVIEW["scores"], "Clarity": 3}},
+        {"comment": "extra"},
+    ],
+)
+def test_parse_review_rejects_invalid_data(change):
+    """Anything that does not match the schema raises ValueError."""
+    with pytest.raises(ValueError):
+        parse_review({**REVIEW, **change})
+
+
+def test_parse_objectives():
+    """Suggested objectives are validated and typed."""
+    data = {"objectives": [
+        {"topic": "ethics", "blooms_level": "Evaluate", "objective": "Judge arguments."},
+    ]}
+    assert parse_objectives(data) == [SuggestedObjective("ethics", "Evaluate", "Judge arguments.")]
+    with pytest.raises(ValueError):
+        parse_objectives({"objectives": [{"topic": "ethics", "objective": "Judge arguments."}]})
+
+
+def test_review_objective_calls_tool_and_caches(stub_anthropic, client):
+    """The review is requested through the tool and cached as validated data."""
+    stub_anthropic.tool_inputs[REVIEW_TOOL_NAME] = REVIEW
+    review = review_objective("Students will be able to analyze data.", client)
+
+    assert review == parse_review(REVIEW)
+    (request,) = stub_anthropic.requests
+    assert request["tool_choice"] == {"type": "tool", "name": REVIEW_TOOL_NAME}
+    assert review_objective("students will be able to  analyze data.", client) == review
+    assert len(stub_anthropic.requests) == 1
+
+
+def test_invalid_tool_input_raises(stub_anthropic, client, in_memory_response_cache):
+    """A response that does not match the schema raises and is not cached."""
+    stub_anthropic.tool_inputs[REVIEW_TOOL_NAME] = dict(REVIEW, blooms_level="Memorize")
+    with pytest.raises(ValueError):
+        review_objective("Students will be able to analyze data.", client)
+    assert in_memory_response_cache.stats()["memory_entries"] == 0
+
+
+def test_suggest_objectives(stub_anthropic, client):
+    """Suggestions come back as typed objectives."""
+    stub_anthropic.tool_inputs[OBJECTIVES_TOOL_NAME] = {"objectives": [
+        {"topic": "ethics", "blooms_level": "Create", "objective": "Design a code of ethics."},
+    ]}
+    (suggestion,) = suggest_objectives("Graduate", "ethics", "Philosophy", client)
+    assert suggestion.blooms_level == "Create"
+
+
+def test_structured_batch_review_writes_columns(stub_anthropic, client, tmp_path):
+    """Structured batch reviews are written with one column per field."""
+    stub_anthropic.tool_inputs[REVIEW_TOOL_NAME] = REVIEW
+    objectives = ["Students will be able to analyze data.", "Students will list FAIL cases."]
+    rows = run_batch_review(objectives, tmp_path / "job.sqlite3", client,
+                            sleep=lambda seconds: None, structured=True)
+    output = tmp_path / "reviews.csv"
+    assert write_reviews(rows, output, structured=True) == 2
+
+    first, second = csv.DictReader(output.open(encoding="utf-8"))
+    assert first["blooms_level"] == "Analyze"
+    assert first["Specific"] == "4"
+    assert first["strengths"] == "Uses a clear action verb"
+    assert second["status"] == "errored"
+    assert second["error"]
+
+    # A checkpoint can only be resumed in the mode it was created in
+    with pytest.raises(ValueError, match="structured"):
+        run_batch_review(objectives, tmp_path / "job.sqlite3", client)
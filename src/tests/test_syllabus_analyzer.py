@@ -0,0 +1,117 @@
+"""Test cases for the streaming syllabus analyzer."""
+
+import io
+import zipfile
+
+import pytest
+
+from uoes_learning_objectives import objective_analyzer
+from uoes_learning_objectives.syllabus_analyzer import (
+    analyze_syllabus,
+    candidate_objectives,
+    iter_docx_paragraphs,
+    read_syllabus,
+    segment_sentences,
+)
+
+SYLLABUS = """# BIO 101 Syllabus
+
+Office hours: Tuesdays 2-4pm in Room 12.
+
+## Learning Objectives
+By the end of this course, students will be able to
+explain the process of natural selection. Students will design an experiment,
+e.g. a field study, to test a hypothesis!
+
+1. List the stages of cell division.
+2) Compare mitosis and meiosis
+- Judge the ethics of genetic engineering.
+"""
+
+DOCUMENT_XML = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    "<w:body>"
+    "<w:p><w:r><w:t>Students will </w:t></w:r><w:r><w:t>explain evolution.</w:t></w:r></w:p>"
+    "<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Design a study.</w:t></w:r></w:p></w:tc></w:tr></w:tbl>"
+    "</w:body></w:document>"
+)
+
+
+def test_segments_sentences_list_items_and_wrapped_lines():
+    """Paragraphs are split into sentences and every list item is its own segment."""
+    assert list(segment_sentences([SYLLABUS])) == [
+        "Office hours: Tuesdays 2-4pm in Room 12.",
+        "By the end of this course, students will be able to explain the process of natural selection.",
+        "Students will design an experiment, e.g. a field study, to test a hypothesis!",
+        "List the stages of cell division.",
+        "Compare mitosis and meiosis",
+        "Judge the ethics of genetic engineering.",
+    ]
+
+
+def test_segmentation_does_not_depend_on_chunk_boundaries():
+    """Text streamed one character at a time is segmented the same way."""
+    assert list(segment_sentences(iter(SYLLABUS))) == list(segment_sentences([SYLLABUS]))
+
+
+def test_segments_stay_bounded_without_breaks():
+    """Text without any sentence or line break is cut into bounded segments."""
+    text = "word " * 10_000
+    segments = list(segment_sentences(iter([text[i:i + 1000] for i in range(0, len(text), 1000)]), 200))
+    assert max(len(segment) for segment in segments) <= 200
+    assert " ".join(segments).split() == text.split()
+
+
+def test_candidate_objectives_need_an_action_verb():
+    """Segments without a Bloom's action verb are skipped."""
+    candidates = [result.objective for result in candidate_objectives(segment_sentences([SYLLABUS]))]
+    assert "Office hours: Tuesdays 2-4pm in Room 12." not in candidates
+    assert len(candidates) == 5
+
+
+def test_analyze_syllabus_is_lazy():
+    """Objectives are analyzed as they are produced, before the input is exhausted."""
+    consumed = []
+
+    def chunks():
+        for line in SYLLABUS.splitlines(keepends=True):
+            consumed.append(line)
+            yield line
+
+    records = analyze_syllabus(chunks())
+    first = next(records)
+    assert first["blooms_level"] == "Understand"
+    assert len(consumed) < len(SYLLABUS.splitlines())
+
+
+def test_each_segment_is_scanned_for_verbs_once(monkeypatch):
+    """Finding candidates and analyzing them share a single verb scan per segment."""
+    scanned = []
+    match_verbs = objective_analyzer.match_verbs
+
+    def counting_match_verbs(lowered, taxonomy=None):
+        scanned.append(lowered)
+        return match_verbs(lowered, taxonomy)
+
+    monkeypatch.setattr(objective_analyzer, "match_verbs", counting_match_verbs)
+    records = list(analyze_syllabus([SYLLABUS]))
+    assert len(records) == 5
+    assert len(scanned) == len(list(segment_sentences([SYLLABUS])))
+
+
+def test_reads_docx_paragraphs():
+    """Paragraphs, including those in tables, are read from a .docx document."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", DOCUMENT_XML)
+    buffer.seek(0)
+
+    assert list(iter_docx_paragraphs(buffer)) == ["Students will explain evolution.\n", "Design a study.\n"]
+
+
+def test_read_syllabus_streams_text_and_rejects_unknown_formats():
+    """Text files are read in chunks; unsupported suffixes raise ValueError."""
+    assert "".join(read_syllabus(io.BytesIO(SYLLABUS.encode()), "syllabus.md")) == SYLLABUS
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        read_syllabus(io.BytesIO(b""), "syllabus.pdf")
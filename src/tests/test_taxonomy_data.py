@@ -0,0 +1,108 @@
+"""Test cases for the hot-reloadable taxonomy data file."""
+
+import json
+import os
+import shutil
+import time
+
+import pytest
+
+from uoes_learning_objectives.blooms_taxonomy import ACTION_VERBS, RUBRIC_CRITERIA
+from uoes_learning_objectives.objective_analyzer import cached_analysis
+from uoes_learning_objectives.prompts import system_prompt
+from uoes_learning_objectives.sample_objectives import SAMPLE_OBJECTIVES
+from uoes_learning_objectives.taxonomy_data import (
+    DEFAULT_DATA_PATH,
+    TaxonomyStore,
+    current_data,
+    parse_taxonomy_data,
+    set_taxonomy_store,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A store of a copy of the packaged data file, installed as the process-wide store."""
+    path = tmp_path / "taxonomy.json"
+    shutil.copy(DEFAULT_DATA_PATH, path)
+    store = TaxonomyStore(path)
+    set_taxonomy_store(store)
+    yield store
+    set_taxonomy_store(None)
+
+
+def edit(path, change):
+    """Apply change to the parsed data file and write it back with a new modification time."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    change(data)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_packaged_data_matches_module_tables():
+    """The import-time tables are views of the packaged data file."""
+    data = current_data()
+    assert dict(data.action_verbs) == ACTION_VERBS
+    assert dict(data.rubric_criteria) == RUBRIC_CRITERIA
+    assert {d: dict(o) for d, o in data.sample_objectives.items()} == SAMPLE_OBJECTIVES
+
+
+def test_reload_swaps_in_a_new_snapshot(store):
+    """Edited verbs take effect after a reload, and the old snapshot stays intact."""
+    objective = "By the end of this course, students will be able to orchestrate a symphony."
+    before = current_data()
+    assert cached_analysis(objective).level is None
+
+    edit(store.path, lambda data: data["levels"]["Create"]["verbs"].append("orchestrate"))
+    assert current_data() is before
+    assert store.reload_if_changed()
+    assert not store.reload_if_changed()
+
+    after = current_data()
+    assert after is not before
+    assert "orchestrate" in after.taxonomy.verbs["Create"]
+    assert "orchestrate" not in before.taxonomy.verbs["Create"]
+    assert cached_analysis(objective).level == "Create"
+    assert "orchestrate" in system_prompt()
+
+
+def test_invalid_edits_keep_the_previous_snapshot(store):
+    """Broken or incompatible files are rejected and the current data stays in use."""
+    before = current_data()
+
+    store.path.write_text('{"levels": ', encoding="utf-8")
+    with pytest.raises(ValueError, match="not valid JSON"):
+        store.reload_if_changed()
+    # The same broken file is not parsed again on every poll
+    assert not store.reload_if_changed()
+
+    # Moving Remember to the top would change every level's rank
+    reordered = json.loads(DEFAULT_DATA_PATH.read_text(encoding="utf-8"))
+    reordered["levels"]["Remember"] = reordered["levels"].pop("Remember")
+    store.path.write_text(json.dumps(reordered), encoding="utf-8")
+    with pytest.raises(ValueError, match="Bloom's levels cannot change"):
+        store.reload_if_changed()
+
+    assert current_data() is before
+    assert store.stats() == {"reloads": 0, "failed_reloads": 2}
+
+
+def test_parse_rejects_unknown_levels():
+    """Course levels and samples must refer to the file's Bloom's levels."""
+    data = json.loads(DEFAULT_DATA_PATH.read_text(encoding="utf-8"))
+    data["course_levels"]["Graduate"] = ["Evaluate", "Invent"]
+    with pytest.raises(ValueError, match="course_levels.Graduate has unknown Bloom's levels: Invent"):
+        parse_taxonomy_data(json.dumps(data).encode("utf-8"))
+
+
+def test_watcher_picks_up_changes(store):
+    """The watcher thread reloads the file shortly after it changes."""
+    store.start_watcher(interval=0.01)
+    edit(store.path, lambda data: data.update(version="2"))
+
+    deadline = time.monotonic() + 5
+    while current_data().version != "2" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    store.stop_watcher()
+    assert current_data().version == "2"
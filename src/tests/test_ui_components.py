@@ -0,0 +1,61 @@
+"""Test cases for the shared UI components."""
+
+from streamlit.testing.v1 import AppTest
+
+from uoes_learning_objectives.ui_components import filter_objectives, objectives_table_html
+
+ROWS = (
+    ("Biology", "Remember", "List the stages of cell division."),
+    ("Biology", "Create", "Design an experiment on ecosystem dynamics."),
+    ("Business", "Create", "Construct a business strategy for a startup."),
+)
+
+
+def test_filter_objectives_by_discipline_and_search_words():
+    """Every search word must appear in the discipline, level or objective."""
+    assert filter_objectives(ROWS, "Biology") == ROWS[:2]
+    assert filter_objectives(ROWS, "All", "create  STRATEGY") == ROWS[2:]
+    assert filter_objectives(ROWS, "Business", "cell") == ()
+
+
+def test_objectives_table_is_escaped_html_with_badges():
+    """Objective text is escaped and each level gets its badge."""
+    table = objectives_table_html((("Math", "Apply", "Solve x < 3 & y > 2."),), False)
+    assert "Solve x &lt; 3 &amp; y &gt; 2." in table
+    assert '<span class="uoes-level uoes-level-Apply">Apply</span>' in table
+    assert "<th>Discipline</th>" not in table
+
+
+def test_sample_objectives_render_as_one_paginated_table():
+    """A page of objectives is one markdown element, with a page selector when needed."""
+    def app():
+        from uoes_learning_objectives.sample_objectives import sample_rows
+        from uoes_learning_objectives.taxonomy_data import current_data
+        from uoes_learning_objectives.ui_components import display_sample_objectives
+
+        display_sample_objectives(sample_rows(current_data()), page_size=10)
+
+    at = AppTest.from_function(app).run()
+    (table,) = [m for m in at.markdown if "uoes-table" in m.value]
+    assert table.value.count("<tr>") == 11
+    assert at.caption[0].value == "Showing 1-10 of 36 objectives"
+
+    at.number_input[0].set_value(4).run()
+    assert at.caption[0].value == "Showing 31-36 of 36 objectives"
+
+    at.text_input[0].input("genetic").run()
+    assert not at.number_input
+    assert at.caption[0].value == "Showing 1-2 of 2 objectives"
+
+
+def test_sample_objectives_accept_nested_dictionary():
+    """The original {discipline: {level: objective}} form still renders."""
+    def app():
+        from uoes_learning_objectives.ui_components import display_sample_objectives
+
+        display_sample_objectives({"Math": {"Apply": "Solve equations."}}, "Math")
+
+    at = AppTest.from_function(app).run()
+    (table,) = [m for m in at.markdown if "uoes-table" in m.value]
+    assert "Solve equations." in table.value
+    assert "<th>Discipline</th>" not in table.value
@@ -1,20 +1,30 @@
 """Test cases for utility functions."""
 
 import pandas as pd
+import pytest
 
-from uoes_learning_objectives.utils import get_data, process_data
+from uoes_learning_objectives.utils import get_sample_data, process_data, validate_dataframe
 
 
-def test_get_data():
-    """Test that get_data returns a properly structured dataframe."""
-    data = get_data()
+def test_get_sample_data():
+    """Test that get_sample_data returns a properly structured dataframe."""
+    data = get_sample_data(rows=5)
     assert isinstance(data, pd.DataFrame)
-    assert data.shape[1] == 2
-    assert all(col in data.columns for col in ["A", "B"])
+    assert data.shape == (5, 4)
+    assert all(col in data.columns for col in ["date", "value_a", "value_b", "category"])
 
 
 def test_process_data(sample_dataframe):
     """Test that process_data correctly adds computed columns."""
     result = process_data(sample_dataframe)
-    assert "C" in result.columns
-    assert all(result["C"] == sample_dataframe["A"] + sample_dataframe["B"])
+    assert "sum" in result.columns
+    assert all(result["sum"] == sample_dataframe["value_a"] + sample_dataframe["value_b"])
+    assert all(result["abs_diff"] == (sample_dataframe["value_a"] - sample_dataframe["value_b"]).abs())
+    assert "sum" not in sample_dataframe.columns
+
+
+def test_validate_dataframe(sample_dataframe):
+    """Test that validate_dataframe rejects frames missing required columns."""
+    assert validate_dataframe(sample_dataframe)
+    with pytest.raises(ValueError):
+        validate_dataframe(sample_dataframe, required_columns=["missing"])
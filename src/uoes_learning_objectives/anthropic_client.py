@@ -0,0 +1,399 @@
+"""Shared, pooled and concurrent access to the Anthropic Claude API."""
+
+import asyncio
+import atexit
+import logging
+import os
+import random
+import threading
+import time
+import weakref
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import anthropic
+import httpx
+
+from uoes_learning_objectives import metrics
+from uoes_learning_objectives.config import get_api_key
+
+logger = logging.getLogger(__name__)
+
+# HTTP status codes worth retrying: rate limiting, server errors and overload
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504, 529})
+
+# Connection pool defaults, overridable through the environment variables below
+DEFAULT_MAX_CONNECTIONS = 20  # UOES_ANTHROPIC_MAX_CONNECTIONS
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10  # UOES_ANTHROPIC_MAX_KEEPALIVE
+DEFAULT_KEEPALIVE_EXPIRY = 60.0  # UOES_ANTHROPIC_KEEPALIVE_EXPIRY (seconds)
+
+
+class ConnectionStats:
+    """Thread-safe counters showing how often pooled connections are reused.
+
+    Installed as an httpx request hook; it attaches an httpcore trace callback
+    to each request and counts the requests that had to open a new connection.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.connections_opened = 0
+
+    def on_request(self, request: httpx.Request) -> None:
+        """httpx request hook counting the request and tracing its connection."""
+        with self._lock:
+            self.requests += 1
+        request.extensions["trace"] = self._trace
+
+    def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace callback; fires once per newly opened connection."""
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self.connections_opened += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return the counters and the share of requests that reused a connection."""
+        with self._lock:
+            reused = max(self.requests - self.connections_opened, 0)
+            return {
+                "requests": self.requests,
+                "connections_opened": self.connections_opened,
+                "connections_reused": reused,
+                "reuse_ratio": reused / self.requests if self.requests else 0.0,
+            }
+
+
+def _env_number(name: str, default: float) -> float:
+    """Read a numeric setting from the environment, falling back to default."""
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def create_anthropic_client(
+    api_key: str,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+    stats: Optional[ConnectionStats] = None,
+) -> anthropic.Anthropic:
+    """Create a synchronous Anthropic client with a tuned keep-alive connection pool.
+
+    Args:
+        api_key: Anthropic API key
+        max_connections: Maximum number of open connections
+        max_keepalive_connections: Maximum idle connections kept alive for reuse
+        keepalive_expiry: Seconds an idle connection is kept before closing
+        stats: Optional counters to record connection reuse in
+
+    Returns:
+        A client whose HTTP connection pool is reused across calls, and closed
+        when the client is garbage collected
+    """
+    http_client = anthropic.DefaultHttpxClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        event_hooks={"request": [stats.on_request]} if stats else None,
+    )
+    client = anthropic.Anthropic(api_key=api_key, http_client=http_client)
+    # A client passed its own http_client does not close it when collected
+    weakref.finalize(client, http_client.close)
+    return client
+
+
+_shared_client: Optional[anthropic.Anthropic] = None
+_shared_client_lock = threading.Lock()
+_connection_stats = ConnectionStats()
+
+
+def get_anthropic_client() -> Optional[anthropic.Anthropic]:
+    """Return the process-wide Anthropic client, creating it on first use.
+
+    The client, and with it the HTTP connection pool and TLS sessions, is shared
+    by every Streamlit session and every call in this process. It is replaced
+    only if ANTHROPIC_API_KEY changes; requests already running on the old
+    client finish normally.
+
+    Returns:
+        The shared client, or None if ANTHROPIC_API_KEY is not set
+    """
+    global _shared_client
+    api_key = get_api_key()
+    if not api_key:
+        return None
+    with _shared_client_lock:
+        if _shared_client is None or _shared_client.api_key != api_key:
+            # The previous client is not closed here: other sessions may still be
+            # in the middle of a request on it. It is closed, with its connection
+            # pool, once the last of them drops it and it is garbage collected.
+            _shared_client = create_anthropic_client(
+                api_key,
+                max_connections=int(
+                    _env_number("UOES_ANTHROPIC_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)
+                ),
+                max_keepalive_connections=int(
+                    _env_number(
+                        "UOES_ANTHROPIC_MAX_KEEPALIVE", DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+                    )
+                ),
+                keepalive_expiry=_env_number(
+                    "UOES_ANTHROPIC_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY
+                ),
+                stats=_connection_stats,
+            )
+            metrics.register_collector("uoes_anthropic_connections", connection_stats)
+        return _shared_client
+
+
+@atexit.register
+def close_anthropic_client() -> None:
+    """Close the shared client and its connection pool, if one was created."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
+
+
+def connection_stats() -> Dict[str, float]:
+    """Return connection-reuse counters for the shared client."""
+    return _connection_stats.snapshot()
+
+
+class TokenBucket:
+    """Asynchronous token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`; each
+    request consumes one token and waits when the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        """Create a bucket that starts full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size, defaults to max(1, rate)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class ConcurrentClaudeClient:
+    """Fan out many Messages API requests with bounded concurrency.
+
+    Wraps an `anthropic.AsyncAnthropic` client, which should be created with
+    `max_retries=0` so that retries are handled here with jittered backoff.
+    """
+
+    def __init__(
+        self,
+        client: anthropic.AsyncAnthropic,
+        max_concurrency: int = 8,
+        requests_per_second: float = 4.0,
+        max_retries: int = 4,
+        timeout: float = 60.0,
+        backoff_base: float = 0.5,
+        backoff_max: float = 20.0,
+        operation: str = "batch",
+    ) -> None:
+        """Configure limits for the wrapped client.
+
+        Args:
+            client: The asynchronous Anthropic client used to send requests
+            max_concurrency: Maximum number of requests in flight at once
+            requests_per_second: Sustained request rate allowed by the limiter
+            max_retries: Retries after the first attempt for retryable errors
+            timeout: Seconds allowed for each individual attempt
+            backoff_base: Initial backoff in seconds, doubled on every retry
+            backoff_max: Upper bound for a single backoff in seconds
+            operation: Label for the request metrics
+        """
+        self.client = client
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.operation = operation
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._bucket = TokenBucket(requests_per_second)
+
+    def _backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Return the delay before the next attempt using full jitter."""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max))
+        return delay
+
+    @staticmethod
+    def _retry_after(error: anthropic.APIStatusError) -> Optional[float]:
+        """Read the server's retry-after header in seconds, if present."""
+        try:
+            return float(error.response.headers.get("retry-after", ""))
+        except ValueError:
+            return None
+
+    async def create(self, **params: Any) -> Any:
+        """Send one Messages API request, retrying transient failures.
+
+        Args:
+            **params: Keyword arguments for `client.messages.create`
+
+        Returns:
+            The Message returned by the API
+
+        Raises:
+            anthropic.APIStatusError: For non-retryable errors, or when retries
+                are exhausted
+            asyncio.TimeoutError: When the final attempt times out
+        """
+        async with self._semaphore:
+            attempt = 0
+            while True:
+                await self._bucket.acquire()
+                retry_after = None
+                try:
+                    with metrics.timer("uoes_anthropic_request_seconds", operation=self.operation):
+                        message = await asyncio.wait_for(
+                            self.client.messages.create(**params), self.timeout
+                        )
+                    record_usage(message, self.operation)
+                    return message
+                except anthropic.APIStatusError as e:
+                    metrics.increment("uoes_anthropic_errors_total", operation=self.operation)
+                    if e.status_code not in RETRYABLE_STATUS_CODES:
+                        raise
+                    if attempt >= self.max_retries:
+                        raise
+                    retry_after = self._retry_after(e)
+                except (asyncio.TimeoutError, anthropic.APIConnectionError):
+                    metrics.increment("uoes_anthropic_errors_total", operation=self.operation)
+                    if attempt >= self.max_retries:
+                        raise
+                metrics.increment("uoes_anthropic_retries_total", operation=self.operation)
+                await asyncio.sleep(self._backoff(attempt, retry_after))
+                attempt += 1
+
+    async def create_many(
+        self, requests: Iterable[Dict[str, Any]]
+    ) -> List[Union[Any, BaseException]]:
+        """Send many requests concurrently.
+
+        Args:
+            requests: Keyword-argument dicts for `client.messages.create`
+
+        Returns:
+            One Message or exception per request, in request order
+        """
+        return await asyncio.gather(
+            *(self.create(**params) for params in requests), return_exceptions=True
+        )
+
+
+def record_usage(message: Any, operation: str) -> None:
+    """Log and count the tokens reported in a Message's usage.
+
+    Besides uncached input and output tokens, prompt-cache writes and reads
+    are counted as the cache_write and cache_read directions, which shows
+    whether the cached system prompt is being reused. Every response's usage
+    is also logged at INFO level, whether or not metrics are enabled.
+    """
+    usage = getattr(message, "usage", None)
+    if usage is None:
+        return
+    cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+    cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+    logger.info(
+        "Claude %s usage: input=%d output=%d cache_write=%d cache_read=%d",
+        operation, usage.input_tokens, usage.output_tokens, cache_write, cache_read,
+    )
+    metrics.increment(
+        "uoes_anthropic_tokens_total", usage.input_tokens, direction="input", operation=operation
+    )
+    metrics.increment(
+        "uoes_anthropic_tokens_total", usage.output_tokens, direction="output", operation=operation
+    )
+    for direction, tokens in (("cache_write", cache_write), ("cache_read", cache_read)):
+        if tokens:
+            metrics.increment(
+                "uoes_anthropic_tokens_total", tokens, direction=direction, operation=operation
+            )
+
+
+def create_message(client: anthropic.Anthropic, request: Dict[str, Any], operation: str) -> Any:
+    """Send one Messages API request, recording its latency, tokens and errors.
+
+    Args:
+        client: The Anthropic client used to send the request
+        request: Keyword arguments for `client.messages.create`
+        operation: Label for the request metrics, e.g. "analysis"
+
+    Returns:
+        The Message returned by the API
+    """
+    try:
+        with metrics.timer("uoes_anthropic_request_seconds", operation=operation):
+            message = client.messages.create(**request)
+    except Exception:
+        metrics.increment("uoes_anthropic_errors_total", operation=operation)
+        raise
+    record_usage(message, operation)
+    return message
+
+
+def stream_message_text(
+    client: anthropic.Anthropic, request: Dict[str, Any], operation: str = "stream"
+) -> Iterator[str]:
+    """Stream a Messages API response, yielding text deltas as they arrive.
+
+    Closing the generator early (e.g. when the user cancels) closes the
+    underlying HTTP response and aborts the request.
+
+    Args:
+        client: The Anthropic client used to send the request
+        request: Keyword arguments for `client.messages.stream`
+        operation: Label for the request metrics
+
+    Returns:
+        An iterator of text fragments
+    """
+    start = time.perf_counter()
+    try:
+        with client.messages.stream(**request) as stream:
+            yield from stream.text_stream
+            record_usage(stream.get_final_message(), operation)
+    except GeneratorExit:
+        metrics.increment("uoes_anthropic_cancellations_total", operation=operation)
+        raise
+    except Exception:
+        metrics.increment("uoes_anthropic_errors_total", operation=operation)
+        raise
+    finally:
+        metrics.observe(
+            "uoes_anthropic_request_seconds", time.perf_counter() - start, operation=operation
+        )
+
+
+def message_text(message: Any) -> str:
+    """Return the text of the first content block of a Message."""
+    return message.content[0].text if hasattr(message, "content") else str(message)
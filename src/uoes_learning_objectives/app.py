@@ -2,15 +2,23 @@
 
 import streamlit as st
 
+from uoes_learning_objectives import metrics
 from uoes_learning_objectives.blooms_taxonomy import show_blooms_taxonomy
 from uoes_learning_objectives.objective_analyzer import objective_analyzer
 from uoes_learning_objectives.sample_objectives import display_sample_objectives_page
 from uoes_learning_objectives.objective_creator import objective_creator
+from uoes_learning_objectives.syllabus_analyzer import syllabus_analyzer
+from uoes_learning_objectives.taxonomy_data import get_taxonomy_store
 from uoes_learning_objectives.ui_components import sidebar_navigation
 
 
 def main() -> None:
     """Main Streamlit application entry point."""
+    metrics.configure()
+    metrics.increment("uoes_script_runs_total")
+    # Edits to the taxonomy data file are picked up without a restart
+    get_taxonomy_store().start_watcher()
+
     st.set_page_config(
         page_title="Learning Objectives Builder", 
         page_icon="📚", 
@@ -29,6 +37,7 @@ def main() -> None:
         "Objective Creator": objective_creator,
         "Bloom's Taxonomy Guide": show_blooms_taxonomy,
         "Objective Analyzer": objective_analyzer,
+        "Syllabus Analyzer": syllabus_analyzer,
         "Sample Objectives": display_sample_objectives_page
     }
 
@@ -36,7 +45,10 @@ def main() -> None:
     selected_page = sidebar_navigation(pages)
     
     # Display the selected page by calling its function
-    pages[selected_page]()
+    with metrics.timer("uoes_page_render_seconds", page=selected_page):
+        with metrics.profile_request(selected_page):
+            pages[selected_page]()
+    metrics.write_prometheus()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,350 @@
+"""Batch analysis of learning objectives outside the Streamlit UI."""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional
+
+from uoes_learning_objectives.blooms_taxonomy import RUBRIC_CRITERIA
+from uoes_learning_objectives.objective_analyzer import AnalysisResult, analyze, find_action_verbs
+
+SUPPORTED_FORMATS = (".csv", ".jsonl", ".parquet")
+
+# Output columns in the order they are written
+RESULT_FIELDS: List[str] = [
+    "objective",
+    "blooms_level",
+    "strengths",
+    "suggestions",
+    *RUBRIC_CRITERIA.keys(),
+    "average_score",
+]
+
+# Number of records buffered per Parquet row group
+PARQUET_BATCH_SIZE = 10_000
+
+# Number of objectives sent to a worker process per task
+DEFAULT_CHUNK_SIZE = 2_000
+
+
+def analyze_objective_record(objective: str) -> Dict[str, Any]:
+    """Run the heuristic analyses on one objective and flatten the results.
+
+    Args:
+        objective: The learning objective text
+
+    Returns:
+        Dictionary with the objective, its Bloom's level, strengths, suggestions
+        and one score per rubric criterion plus the average score
+    """
+    return analysis_record(analyze(objective))
+
+
+def analysis_record(result: AnalysisResult) -> Dict[str, Any]:
+    """Flatten a complete analysis into a result record with RESULT_FIELDS.
+
+    Args:
+        result: The analysis of one objective
+
+    Returns:
+        The result record, as returned by analyze_objective_record
+    """
+    record: Dict[str, Any] = {
+        "objective": result.objective,
+        "blooms_level": result.level,
+        "strengths": list(result.strengths),
+        "suggestions": list(result.suggestions),
+    }
+    record.update(result.scores)
+    record["average_score"] = result.average_score
+
+    return record
+
+
+def analyze_batch(objectives: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Analyze objectives lazily, yielding one result record per objective.
+
+    Args:
+        objectives: Any iterable of learning objective texts
+
+    Returns:
+        An iterator of result records in input order
+    """
+    for objective in objectives:
+        yield analyze_objective_record(objective)
+
+
+def _init_worker() -> None:
+    """Prepare a worker process once, before it receives any tasks.
+
+    Importing the analyzer builds the verb tables; running one match here makes
+    sure that cost is paid at worker start-up rather than inside the first task.
+    """
+    find_action_verbs("")
+
+
+def _analyze_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
+    """Analyze one chunk of objectives inside a worker process."""
+    return [analyze_objective_record(objective) for objective in chunk]
+
+
+def _chunked(objectives: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    """Split an iterable into lists of at most chunk_size objectives."""
+    iterator = iter(objectives)
+    while chunk := list(itertools.islice(iterator, chunk_size)):
+        yield chunk
+
+
+def analyze_batch_parallel(
+    objectives: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """Analyze objectives across a pool of worker processes.
+
+    Input is consumed in chunks and at most two chunks per worker are in flight,
+    so memory stays bounded for arbitrarily large inputs. Results are yielded in
+    input order regardless of which worker finishes first.
+
+    Args:
+        objectives: Any iterable of learning objective texts
+        workers: Number of worker processes, defaults to the CPU count
+        chunk_size: Number of objectives per task
+
+    Returns:
+        An iterator of result records in input order
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    max_pending = 2 * workers
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        pending: Deque[Future] = deque()
+        for chunk in _chunked(objectives, chunk_size):
+            pending.append(executor.submit(_analyze_chunk, chunk))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _check_format(path: Path) -> str:
+    """Return the file suffix, raising ValueError if it is not supported."""
+    suffix = path.suffix.lower()
+    if suffix not in SUPPORTED_FORMATS:
+        raise ValueError(
+            f"Unsupported file format '{suffix}'. "
+            f"Expected one of: {', '.join(SUPPORTED_FORMATS)}"
+        )
+    return suffix
+
+
+def _import_parquet() -> Any:
+    """Import pyarrow's Parquet module, which is only needed for .parquet files."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Reading or writing Parquet files requires pyarrow") from e
+    return pq
+
+
+def read_objectives(path: Path, column: str = "objective") -> Iterator[str]:
+    """Stream objective texts from a CSV, JSONL or Parquet file.
+
+    Args:
+        path: Input file; the format is chosen from its suffix
+        column: Column (or JSON key) holding the objective text. JSONL lines
+            may also be bare JSON strings.
+
+    Returns:
+        An iterator of objective texts; missing values are yielded as ""
+
+    Raises:
+        ValueError: If the column is missing, a JSONL line is not a JSON
+            object or string, or an objective is not a string
+    """
+    suffix = _check_format(path)
+
+    if suffix == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            if reader.fieldnames is None or column not in reader.fieldnames:
+                raise ValueError(f"CSV file is missing required column: {column}")
+            for row in reader:
+                yield row[column] or ""
+
+    elif suffix == ".jsonl":
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    value = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"JSONL line {number} is not valid JSON: {e}") from e
+                if isinstance(value, dict):
+                    if column not in value:
+                        raise ValueError(f"JSONL line {number} is missing required key: {column}")
+                    value = value[column]
+                elif not isinstance(value, str):
+                    raise ValueError(f"JSONL line {number} must be a JSON object or string")
+                if value is not None and not isinstance(value, str):
+                    raise ValueError(
+                        f"JSONL line {number}: {column} must be a string, "
+                        f"not {type(value).__name__}"
+                    )
+                yield value or ""
+
+    else:
+        pq = _import_parquet()
+        parquet_file = pq.ParquetFile(path)
+        if column not in parquet_file.schema_arrow.names:
+            raise ValueError(f"Parquet file is missing required column: {column}")
+        row = 0
+        for batch in parquet_file.iter_batches(columns=[column]):
+            for value in batch.column(0).to_pylist():
+                row += 1
+                if value is not None and not isinstance(value, str):
+                    raise ValueError(
+                        f"Parquet row {row}: {column} must be a string, "
+                        f"not {type(value).__name__}"
+                    )
+                yield value or ""
+
+
+def write_results(records: Iterable[Dict[str, Any]], path: Path) -> int:
+    """Stream result records to a CSV, JSONL or Parquet file.
+
+    Args:
+        records: Result records as produced by analyze_batch
+        path: Output file; the format is chosen from its suffix
+
+    Returns:
+        The number of records written
+    """
+    suffix = _check_format(path)
+    count = 0
+
+    if suffix == ".csv":
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+            writer.writeheader()
+            for record in records:
+                row = dict(record)
+                row["strengths"] = " | ".join(record["strengths"])
+                row["suggestions"] = " | ".join(record["suggestions"])
+                writer.writerow(row)
+                count += 1
+
+    elif suffix == ".jsonl":
+        with open(path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+                count += 1
+
+    else:
+        pq = _import_parquet()
+        import pyarrow as pa
+
+        schema = pa.schema(
+            [
+                ("objective", pa.string()),
+                ("blooms_level", pa.string()),
+                ("strengths", pa.list_(pa.string())),
+                ("suggestions", pa.list_(pa.string())),
+                *((criterion, pa.int64()) for criterion in RUBRIC_CRITERIA),
+                ("average_score", pa.float64()),
+            ]
+        )
+        with pq.ParquetWriter(path, schema) as parquet_writer:
+            buffer: List[Dict[str, Any]] = []
+            for record in records:
+                buffer.append(record)
+                count += 1
+                if len(buffer) >= PARQUET_BATCH_SIZE:
+                    parquet_writer.write_table(pa.Table.from_pylist(buffer, schema))
+                    buffer = []
+            if buffer:
+                parquet_writer.write_table(pa.Table.from_pylist(buffer, schema))
+
+    return count
+
+
+def analyze_file(
+    input_path: Path,
+    output_path: Path,
+    column: str = "objective",
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Analyze every objective in an input file and stream results to an output file.
+
+    Args:
+        input_path: CSV, JSONL or Parquet file with objectives
+        output_path: CSV, JSONL or Parquet file to write results to
+        column: Column (or JSON key) holding the objective text
+        workers: Number of worker processes; 1 analyzes in the current process
+            and 0 uses one worker per CPU
+        chunk_size: Number of objectives per task in parallel mode
+
+    Returns:
+        The number of objectives analyzed
+    """
+    # Validate both formats before any work is done
+    _check_format(input_path)
+    _check_format(output_path)
+
+    objectives = read_objectives(input_path, column)
+    if workers == 1:
+        records = analyze_batch(objectives)
+    else:
+        records = analyze_batch_parallel(objectives, workers or None, chunk_size)
+
+    return write_results(records, output_path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point for batch analysis."""
+    parser = argparse.ArgumentParser(
+        description="Score learning objectives against Bloom's Taxonomy and the rubric."
+    )
+    parser.add_argument("input", type=Path, help="Input file (.csv, .jsonl or .parquet)")
+    parser.add_argument("output", type=Path, help="Output file (.csv, .jsonl or .parquet)")
+    parser.add_argument(
+        "--column",
+        default="objective",
+        help="Column or JSON key holding the objective text (default: objective)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes; 0 uses one per CPU (default: 1)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Objectives per worker task (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        count = analyze_file(
+            args.input, args.output, args.column, args.workers, args.chunk_size
+        )
+    except (ValueError, ImportError, OSError) as e:
+        parser.exit(2, f"error: {e}\n")
+
+    print(f"Analyzed {count} objectives -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,47 +1,38 @@
 """Bloom's Taxonomy related functions and data."""
 
+import functools
+import html
+from typing import Dict, Tuple
+
 import streamlit as st
 
+from uoes_learning_objectives.taxonomy_data import current_data
+from uoes_learning_objectives.ui_components import html_table, level_badge_html
+# Re-exported; the compiled tables used to be defined here
+from uoes_learning_objectives.taxonomy_data import Taxonomy, compile_taxonomy  # noqa: F401
+
+# The tables below are loaded from the taxonomy data file when the module is
+# imported. They do not change when the file is reloaded; code that should see
+# edits without a restart reads current_data() instead.
+_DATA = current_data()
 
 # Dictionary of cognitive levels and their descriptions
-COGNITIVE_LEVELS = {
-    "Remember": "Recall facts and basic concepts",
-    "Understand": "Explain ideas or concepts",
-    "Apply": "Use information in new situations",
-    "Analyze": "Draw connections among ideas",
-    "Evaluate": "Justify a stand or decision",
-    "Create": "Produce new or original work"
-}
-
-# Dictionary of action verbs associated with each cognitive level
-ACTION_VERBS = {
-    "Remember": "define, list, name, identify, recall, recognize, state, repeat, reproduce, label",
-    "Understand": "explain, describe, interpret, summarize, paraphrase, classify, compare, contrast, discuss",
-    "Apply": "implement, execute, use, demonstrate, operate, solve, calculate, complete, illustrate",
-    "Analyze": "differentiate, organize, attribute, compare, contrast, distinguish, examine, experiment, question",
-    "Evaluate": "check, critique, judge, test, monitor, assess, defend, appraise, argue, value",
-    "Create": "design, construct, plan, produce, invent, develop, compose, formulate, generate, write"
-}
+COGNITIVE_LEVELS = dict(_DATA.cognitive_levels)
+
+# Compiled verb tables as of import
+TAXONOMY = _DATA.taxonomy
+
+# Action verbs associated with each cognitive level, ordered from lowest to highest level
+LEVEL_VERBS: Dict[str, Tuple[str, ...]] = dict(TAXONOMY.verbs)
+
+# Backwards-compatible view: each level's verbs as one comma-separated string
+ACTION_VERBS = dict(_DATA.action_verbs)
 
 # Example learning objectives for each cognitive level
-EXAMPLE_OBJECTIVES = {
-    "Remember": "By the end of this course, students will be able to list the key components of a computer system.",
-    "Understand": "By the end of this course, students will be able to explain the principles of object-oriented programming.",
-    "Apply": "By the end of this course, students will be able to implement sorting algorithms to solve specific problems.",
-    "Analyze": "By the end of this course, students will be able to compare and contrast different machine learning approaches for a given dataset.",
-    "Evaluate": "By the end of this course, students will be able to critique research papers in the field of artificial intelligence.",
-    "Create": "By the end of this course, students will be able to design and develop a web application using modern frameworks."
-}
+EXAMPLE_OBJECTIVES = dict(_DATA.example_objectives)
 
 # Rubric criteria for effective learning objectives
-RUBRIC_CRITERIA = {
-    "Specific": "Clearly defines what the student will be able to do",
-    "Measurable": "Can be assessed and evaluated",
-    "Action-oriented": "Uses action verbs from Bloom's Taxonomy",
-    "Realistic": "Achievable within the constraints of the course",
-    "Time-bound": "Specifies when the objective should be achieved (usually by the end of the course)",
-    "Aligned": "Supports program-level and institutional learning outcomes"
-}
+RUBRIC_CRITERIA = dict(_DATA.rubric_criteria)
 
 
 def display_blooms_overview() -> None:
@@ -65,7 +56,7 @@ def display_cognitive_domain() -> None:
     """Display information about the cognitive domain levels."""
     st.subheader("Cognitive Domain Levels")
     
-    for level, description in COGNITIVE_LEVELS.items():
+    for level, description in current_data().cognitive_levels.items():
         st.markdown(f"**{level}**: {description}")
         
     st.write("""
@@ -74,24 +65,45 @@ def display_cognitive_domain() -> None:
     """)
 
 
+@functools.lru_cache(maxsize=1)
+def action_verbs_table_html(taxonomy: Taxonomy) -> str:
+    """Render the verbs of every level as one HTML table, once per compiled taxonomy.
+    
+    Args:
+        taxonomy: The compiled verb tables
+        
+    Returns:
+        The table HTML, one row per level with its badge and verbs
+    """
+    return html_table(
+        ["Level", "Action verbs"],
+        (
+            [level_badge_html(level), html.escape(", ".join(verbs))]
+            for level, verbs in taxonomy.verbs.items()
+        ),
+    )
+
+
 def display_action_verbs() -> None:
     """Display action verbs for each cognitive level."""
     st.subheader("Action Verbs by Cognitive Level")
     
-    for level, verbs in ACTION_VERBS.items():
-        st.markdown(f"**{level}**")
-        verb_list = verbs.split(", ")
-        cols = st.columns(3)
-        for i, verb in enumerate(verb_list):
-            cols[i % 3].markdown(f"- {verb}")
-        st.markdown("---")
+    taxonomy = current_data().taxonomy
+    st.markdown(action_verbs_table_html(taxonomy), unsafe_allow_html=True)
+    
+    ambiguous = ", ".join(
+        f"{verb} ({' / '.join(levels)})"
+        for verb, levels in taxonomy.ambiguous_verbs.items()
+    )
+    if ambiguous:
+        st.caption(f"Verbs listed under more than one level: {ambiguous}")
 
 
 def display_example_objectives() -> None:
     """Display example learning objectives for each cognitive level."""
     st.subheader("Example Learning Objectives")
     
-    for level, example in EXAMPLE_OBJECTIVES.items():
+    for level, example in current_data().example_objectives.items():
         st.markdown(f"**{level}**: {example}")
 
 
@@ -103,7 +115,7 @@ def display_rubric() -> None:
     An effective learning objective should be:
     """)
     
-    for criterion, description in RUBRIC_CRITERIA.items():
+    for criterion, description in current_data().rubric_criteria.items():
         st.markdown(f"**{criterion}**: {description}")
     
     st.write("""
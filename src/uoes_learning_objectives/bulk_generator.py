@@ -0,0 +1,278 @@
+"""Reproducible bulk generation of draft objectives for many course shells."""
+
+import argparse
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple
+
+from uoes_learning_objectives.blooms_taxonomy import TAXONOMY
+from uoes_learning_objectives.objective_creator import LEVEL_TO_BLOOMS
+
+# pandas and numpy are imported where they are used, like in utils
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+INPUT_COLUMNS = ["course_level", "subject_area", "key_topics"]
+
+# Output columns in the order they are written
+GENERATED_FIELDS = [
+    "course_id",
+    "course_level",
+    "subject_area",
+    "topic",
+    "blooms_level",
+    "verb",
+    "objective",
+]
+
+SUPPORTED_FORMATS = (".csv", ".parquet")
+
+# Number of course rows processed per chunk
+DEFAULT_CHUNK_SIZE = 10_000
+
+OBJECTIVE_PREFIX = "By the end of this course, students will be able to "
+
+
+def _padded(rows: List[Tuple[object, ...]], fill: object) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Pack variable-length rows into a padded 2-D array plus the row lengths."""
+    import numpy as np
+
+    table = np.full((len(rows), max(map(len, rows))), fill, dtype=object)
+    for i, row in enumerate(rows):
+        table[i, :len(row)] = row
+    return table, np.array([len(row) for row in rows])
+
+
+def _expand(courses: "pd.DataFrame") -> Tuple["pd.DataFrame", "np.ndarray"]:
+    """Expand courses into one row per (topic, Bloom's level), in generate_objectives order.
+
+    Returns:
+        The expanded rows and, for each row, the position of its Bloom's level
+        in TAXONOMY.levels
+    """
+    import numpy as np
+    import pandas as pd
+
+    course_levels = list(LEVEL_TO_BLOOMS)
+    known = courses["course_level"].isin(course_levels)
+    if not known.all():
+        unknown = set(courses["course_level"][~known])
+        raise ValueError(f"Unknown course levels: {', '.join(sorted(map(str, unknown)))}")
+    codes = pd.Categorical(courses["course_level"], categories=course_levels).codes
+
+    # After explode, the index holds the position of each topic's course row
+    topics = (
+        courses["key_topics"].fillna("").reset_index(drop=True).str.split(",").explode().str.strip()
+    )
+    keep = (topics != "").to_numpy()
+    topic_values = topics.to_numpy(dtype=object)[keep]
+    topic_rows = topics.index.to_numpy()[keep]
+
+    # Repeat every topic once per Bloom's level suggested for its course level
+    level_table, level_counts = _padded(
+        [tuple(TAXONOMY.level_rank[level] for level in LEVEL_TO_BLOOMS[course_level])
+         for course_level in course_levels],
+        fill=0,
+    )
+    topic_codes = codes[topic_rows]
+    counts = level_counts[topic_codes]
+    repeat = np.repeat(np.arange(len(topic_rows)), counts)
+    position = np.arange(len(repeat)) - np.repeat(np.cumsum(counts) - counts, counts)
+    level_ranks = level_table[topic_codes[repeat], position].astype(np.intp)
+    rows = topic_rows[repeat]
+
+    expanded = pd.DataFrame(
+        {
+            "course_id": courses.index.to_numpy()[rows],
+            "course_level": courses["course_level"].to_numpy(dtype=object)[rows],
+            "subject_area": courses["subject_area"].fillna("").to_numpy(dtype=object)[rows],
+            "topic": topic_values[repeat],
+            "blooms_level": np.array(TAXONOMY.levels, dtype=object)[level_ranks],
+        }
+    )
+    return expanded, level_ranks
+
+
+def _pick_verbs(level_ranks: "np.ndarray", rng: "np.random.Generator") -> "np.ndarray":
+    """Draw one verb per row from the verbs of that row's Bloom's level."""
+    import numpy as np
+
+    verb_table, verb_counts = _padded([TAXONOMY.verbs[level] for level in TAXONOMY.levels], "")
+    # One uniform draw per row, in row order, so the stream of draws (and
+    # hence the output) does not depend on how the input is chunked
+    draws = rng.random(len(level_ranks))
+    return verb_table[level_ranks, (draws * verb_counts[level_ranks]).astype(np.intp)]
+
+
+def generate_objectives_frame(
+    courses: "pd.DataFrame", rng: "np.random.Generator"
+) -> "pd.DataFrame":
+    """Generate draft objectives for every course in a DataFrame.
+
+    Args:
+        courses: DataFrame with course_level, subject_area and key_topics
+            (comma-separated) columns; the index identifies each course
+        rng: Random generator used to pick the action verbs
+
+    Returns:
+        DataFrame with the GENERATED_FIELDS columns and one row per course,
+        topic and Bloom's level suggested for the course level
+    """
+    missing = [column for column in INPUT_COLUMNS if column not in courses.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    rows, level_ranks = _expand(courses)
+    rows["verb"] = _pick_verbs(level_ranks, rng)
+    rows["objective"] = OBJECTIVE_PREFIX + rows["verb"] + " " + rows["topic"] + "."
+    return rows[GENERATED_FIELDS]
+
+
+def generate_bulk(
+    courses: Iterable["pd.DataFrame"], seed: int = 0
+) -> Iterator["pd.DataFrame"]:
+    """Generate objectives for a stream of course chunks with one seeded generator.
+
+    The same seed always gives the same output, however the input is chunked.
+
+    Args:
+        courses: DataFrames of courses, e.g. from read_courses
+        seed: Seed for numpy.random.default_rng
+
+    Returns:
+        An iterator of generated objective DataFrames, one per input chunk
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    for chunk in courses:
+        yield generate_objectives_frame(chunk, rng)
+
+
+def _check_format(path: Path) -> str:
+    """Return the file suffix, raising ValueError if it is not supported."""
+    suffix = path.suffix.lower()
+    if suffix not in SUPPORTED_FORMATS:
+        raise ValueError(
+            f"Unsupported file format '{suffix}'. "
+            f"Expected one of: {', '.join(SUPPORTED_FORMATS)}"
+        )
+    return suffix
+
+
+def read_courses(path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator["pd.DataFrame"]:
+    """Stream course rows from a CSV or Parquet file in chunks.
+
+    Args:
+        path: Input file; the format is chosen from its suffix
+        chunk_size: Number of course rows per chunk
+
+    Returns:
+        An iterator of DataFrames whose index is the row number in the file
+    """
+    import pandas as pd
+
+    suffix = _check_format(path)
+    if suffix == ".csv":
+        yield from pd.read_csv(path, usecols=INPUT_COLUMNS, dtype=str, chunksize=chunk_size)
+    else:
+        import pyarrow.parquet as pq
+
+        start = 0
+        for batch in pq.ParquetFile(path).iter_batches(chunk_size, columns=INPUT_COLUMNS):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(start, start + len(chunk))
+            start += len(chunk)
+            yield chunk
+
+
+def write_generated(frames: Iterable["pd.DataFrame"], path: Path) -> int:
+    """Stream generated objectives to a CSV or Parquet file.
+
+    Args:
+        frames: DataFrames as produced by generate_bulk
+        path: Output file; the format is chosen from its suffix
+
+    Returns:
+        The number of objectives written
+    """
+    suffix = _check_format(path)
+    count = 0
+
+    if suffix == ".csv":
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            header = True
+            for frame in frames:
+                frame.to_csv(f, index=False, header=header)
+                header = False
+                count += len(frame)
+            if header:
+                f.write(",".join(GENERATED_FIELDS) + "\n")
+
+    else:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema(
+            [("course_id", pa.int64()), *((field, pa.string()) for field in GENERATED_FIELDS[1:])]
+        )
+        with pq.ParquetWriter(path, schema) as parquet_writer:
+            for frame in frames:
+                parquet_writer.write_table(
+                    pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+                )
+                count += len(frame)
+
+    return count
+
+
+def generate_file(
+    input_path: Path,
+    output_path: Path,
+    seed: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Generate objectives for every course in a file and stream them to another file.
+
+    Args:
+        input_path: CSV or Parquet file with course_level, subject_area and key_topics
+        output_path: CSV or Parquet file to write the objectives to
+        seed: Seed for the verb choices
+        chunk_size: Number of course rows per chunk
+
+    Returns:
+        The number of objectives generated
+    """
+    # Validate both formats before any work is done
+    _check_format(input_path)
+    _check_format(output_path)
+    return write_generated(generate_bulk(read_courses(input_path, chunk_size), seed), output_path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point for bulk objective generation."""
+    parser = argparse.ArgumentParser(
+        description="Generate draft learning objectives for many course shells."
+    )
+    parser.add_argument("input", type=Path, help="Course file (.csv or .parquet)")
+    parser.add_argument("output", type=Path, help="Output file (.csv or .parquet)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Course rows per chunk (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        count = generate_file(args.input, args.output, args.seed, args.chunk_size)
+    except (ValueError, ImportError, OSError) as e:
+        parser.exit(2, f"error: {e}\n")
+
+    print(f"Generated {count} objectives -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
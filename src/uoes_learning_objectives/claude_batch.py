@@ -0,0 +1,570 @@
+"""Bulk Claude reviews of learning objectives through the Message Batches API."""
+
+import argparse
+import csv
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from uoes_learning_objectives import metrics
+from uoes_learning_objectives.blooms_taxonomy import RUBRIC_CRITERIA
+from uoes_learning_objectives.near_duplicates import (
+    DEFAULT_DUPLICATE_THRESHOLD,
+    MIN_DUPLICATE_THRESHOLD,
+    duplicate_groups,
+)
+from uoes_learning_objectives.objective_analyzer import analysis_cache_key, analysis_request
+from uoes_learning_objectives.response_cache import get_response_cache
+from uoes_learning_objectives.structured_output import (
+    REVIEW_TOOL_NAME,
+    parse_review,
+    review_cache_key,
+    review_request,
+    tool_input,
+)
+
+# The Message Batches API accepts at most this many requests per batch
+MAX_BATCH_REQUESTS = 10_000
+
+# Seconds between status checks of an open batch; the wait doubles up to the maximum
+DEFAULT_POLL_INTERVAL = 30.0
+DEFAULT_MAX_POLL_INTERVAL = 600.0
+
+REVIEW_FORMATS = (".csv", ".jsonl")
+
+# Output columns in the order they are written
+REVIEW_FIELDS = ["objective", "status", "claude_review"]
+STRUCTURED_REVIEW_FIELDS = [
+    "objective",
+    "status",
+    "blooms_level",
+    "strengths",
+    "suggestions",
+    *RUBRIC_CRITERIA.keys(),
+    "average_score",
+    "error",
+]
+
+# Item states kept in the checkpoint file
+PENDING = "pending"
+SUBMITTED = "submitted"
+SUCCEEDED = "succeeded"
+ERRORED = "errored"
+
+# Batch results that can be sent again in a new batch
+RETRYABLE_RESULTS = frozenset({"canceled", "expired"})
+
+
+class BatchJobStore:
+    """SQLite checkpoint of a batch review job.
+
+    Every objective is an item keyed by its row number. The store records which
+    batch each item was submitted in and its result, so an interrupted job can
+    resume by polling the batches it already submitted instead of paying for
+    them twice.
+    """
+
+    def __init__(self, path: Path, structured: bool = False) -> None:
+        """Open (or create) the checkpoint file.
+
+        Args:
+            path: SQLite file holding the job state
+            structured: Whether the job asks for structured reviews; a
+                checkpoint can only be resumed in the mode it was created in
+
+        Raises:
+            ValueError: If the checkpoint was created in the other mode
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS items ("
+            "custom_id TEXT PRIMARY KEY, row_index INTEGER NOT NULL UNIQUE, "
+            "objective TEXT NOT NULL, batch_id TEXT, status TEXT NOT NULL, result TEXT);"
+            "CREATE INDEX IF NOT EXISTS items_status ON items (status);"
+            "CREATE TABLE IF NOT EXISTS batches ("
+            "batch_id TEXT PRIMARY KEY, status TEXT NOT NULL, created REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS job (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+        )
+        mode = "structured" if structured else "text"
+        self._db.execute("INSERT OR IGNORE INTO job (key, value) VALUES ('mode', ?)", (mode,))
+        self._db.commit()
+        stored = self._db.execute("SELECT value FROM job WHERE key = 'mode'").fetchone()[0]
+        if stored != mode:
+            self._db.close()
+            raise ValueError(f"Checkpoint {path} was written for {stored} reviews, not {mode}")
+        self.structured = structured
+
+    def add_rows(self, objectives: Iterable[str]) -> int:
+        """Record the job's objectives; rows already in the store are kept as they are.
+
+        Raises:
+            ValueError: If a stored row holds a different objective, i.e. the
+                checkpoint belongs to another input
+
+        Returns:
+            The number of rows in the job
+        """
+        count = 0
+        with self._db:
+            for row_index, objective in enumerate(objectives):
+                custom_id = f"row-{row_index}"
+                self._db.execute(
+                    "INSERT OR IGNORE INTO items (custom_id, row_index, objective, status) "
+                    "VALUES (?, ?, ?, ?)",
+                    (custom_id, row_index, objective, PENDING),
+                )
+                stored = self._db.execute(
+                    "SELECT objective FROM items WHERE custom_id = ?", (custom_id,)
+                ).fetchone()[0]
+                if stored != objective:
+                    raise ValueError(
+                        f"Checkpoint {self.path} was written for a different input "
+                        f"(row {row_index} differs)"
+                    )
+                count += 1
+        stored_rows = self._db.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        if stored_rows != count:
+            raise ValueError(
+                f"Checkpoint {self.path} was written for a different input "
+                f"({stored_rows} rows, not {count})"
+            )
+        return count
+
+    def pending(self) -> List[Tuple[str, str]]:
+        """Return (custom_id, objective) for the items not yet submitted, in row order."""
+        return self._db.execute(
+            "SELECT custom_id, objective FROM items WHERE status = ? ORDER BY row_index",
+            (PENDING,),
+        ).fetchall()
+
+    def mark_submitted(self, batch_id: str, custom_ids: List[str]) -> None:
+        """Record that items were submitted in a batch."""
+        with self._db:
+            self._db.execute(
+                "INSERT INTO batches (batch_id, status, created) VALUES (?, ?, ?)",
+                (batch_id, "in_progress", time.time()),
+            )
+            self._db.executemany(
+                "UPDATE items SET batch_id = ?, status = ? WHERE custom_id = ?",
+                [(batch_id, SUBMITTED, custom_id) for custom_id in custom_ids],
+            )
+
+    def open_batches(self) -> List[str]:
+        """Return the ids of submitted batches whose results are not stored yet."""
+        rows = self._db.execute(
+            "SELECT batch_id FROM batches WHERE status != 'ended' ORDER BY created"
+        ).fetchall()
+        return [batch_id for (batch_id,) in rows]
+
+    def batch_objectives(self, batch_id: str) -> Dict[str, str]:
+        """Return the objective of each item submitted in a batch, by custom_id."""
+        return dict(
+            self._db.execute(
+                "SELECT custom_id, objective FROM items WHERE batch_id = ?", (batch_id,)
+            )
+        )
+
+    def record_result(self, custom_id: str, status: str, result: Optional[str]) -> None:
+        """Store the result of one item; retryable outcomes put it back to pending.
+
+        Results are written in the current transaction; call commit or
+        finish_batch to make them durable.
+        """
+        if status in RETRYABLE_RESULTS:
+            self._db.execute(
+                "UPDATE items SET batch_id = NULL, status = ?, result = NULL "
+                "WHERE custom_id = ?",
+                (PENDING, custom_id),
+            )
+        else:
+            self._db.execute(
+                "UPDATE items SET status = ?, result = ? WHERE custom_id = ?",
+                (status, result, custom_id),
+            )
+
+    def finish_batch(self, batch_id: str) -> None:
+        """Mark a batch as ended and commit the results recorded for it."""
+        self._db.execute("UPDATE batches SET status = 'ended' WHERE batch_id = ?", (batch_id,))
+        self.commit()
+
+    def commit(self) -> None:
+        """Commit the results recorded so far."""
+        self._db.commit()
+
+    def results(self) -> List[Tuple[str, str, Optional[str]]]:
+        """Return (objective, status, result) for every item, in row order."""
+        return self._db.execute(
+            "SELECT objective, status, result FROM items ORDER BY row_index"
+        ).fetchall()
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of items in each state."""
+        return dict(self._db.execute("SELECT status, COUNT(*) FROM items GROUP BY status"))
+
+    def close(self) -> None:
+        """Close the checkpoint file."""
+        self._db.close()
+
+
+def _error_text(result: Any) -> str:
+    """Describe an errored batch result."""
+    error = getattr(getattr(result, "error", None), "error", None)
+    message = getattr(error, "message", None) or "unknown error"
+    return f"Error from Anthropic Message Batches API: {message}"
+
+
+def _request(objective: str, structured: bool) -> Dict[str, Any]:
+    """Build the Messages API parameters for one review."""
+    return review_request(objective) if structured else analysis_request(objective)
+
+
+def _cache_key(objective: str, structured: bool) -> str:
+    """Build the response cache key shared with the interactive reviews."""
+    if structured:
+        return review_cache_key(objective, review_request(objective))
+    return analysis_cache_key(objective, analysis_request(objective))
+
+
+def _fill_from_cache(store: BatchJobStore) -> None:
+    """Complete pending items whose review is already in the response cache."""
+    cache = get_response_cache()
+    for custom_id, objective in store.pending():
+        cached = cache.get(_cache_key(objective, store.structured))
+        if cached is not None:
+            if store.structured:
+                cached = json.dumps(cached)
+            store.record_result(custom_id, SUCCEEDED, cached)
+    store.commit()
+
+
+def _succeeded_result(message: Any, structured: bool) -> Tuple[str, str, Any]:
+    """Return the item status, stored result and cache value for a successful response."""
+    from uoes_learning_objectives.anthropic_client import message_text
+
+    if not structured:
+        text = message_text(message)
+        return SUCCEEDED, text, text
+    try:
+        review = parse_review(tool_input(message, REVIEW_TOOL_NAME))
+    except ValueError as e:
+        return ERRORED, f"Invalid structured review: {e}", None
+    data = review.to_dict()
+    return SUCCEEDED, json.dumps(data), data
+
+
+def submit_pending(
+    client: Any, store: BatchJobStore, max_batch_requests: int = MAX_BATCH_REQUESTS
+) -> List[str]:
+    """Submit every pending item, packing them into as few batches as possible.
+
+    Each batch id is checkpointed as soon as the API returns it. A crash between
+    the API accepting a batch and that write is the only way an item can be
+    submitted twice.
+
+    Args:
+        client: Anthropic client
+        store: The job's checkpoint
+        max_batch_requests: Maximum requests per batch
+
+    Returns:
+        The ids of the new batches
+    """
+    pending = store.pending()
+    batch_ids = []
+    for start in range(0, len(pending), max_batch_requests):
+        chunk = pending[start:start + max_batch_requests]
+        batch = client.messages.batches.create(
+            requests=[
+                {"custom_id": custom_id, "params": _request(objective, store.structured)}
+                for custom_id, objective in chunk
+            ]
+        )
+        store.mark_submitted(batch.id, [custom_id for custom_id, _ in chunk])
+        metrics.increment("uoes_anthropic_batch_requests_total", len(chunk))
+        batch_ids.append(batch.id)
+    return batch_ids
+
+
+def collect_results(client: Any, store: BatchJobStore, batch_id: str) -> None:
+    """Store the results of an ended batch and cache the successful reviews."""
+    from uoes_learning_objectives.anthropic_client import record_usage
+
+    cache = get_response_cache()
+    objectives = store.batch_objectives(batch_id)
+    for entry in client.messages.batches.results(batch_id):
+        result = entry.result
+        if result.type == "succeeded":
+            record_usage(result.message, "batch_review")
+            status, stored, value = _succeeded_result(result.message, store.structured)
+            objective = objectives.get(entry.custom_id)
+            if value is not None and objective is not None:
+                cache.set(_cache_key(objective, store.structured), value)
+            store.record_result(entry.custom_id, status, stored)
+        elif result.type == "errored":
+            store.record_result(entry.custom_id, ERRORED, _error_text(result))
+        else:
+            store.record_result(entry.custom_id, result.type, None)
+    store.finish_batch(batch_id)
+
+
+def _batch_ended(client: Any, batch_id: str) -> bool:
+    """Check whether a batch has ended, treating transient API failures as 'not yet'."""
+    import anthropic
+
+    from uoes_learning_objectives.anthropic_client import RETRYABLE_STATUS_CODES
+
+    try:
+        return client.messages.batches.retrieve(batch_id).processing_status == "ended"
+    except anthropic.APIConnectionError:
+        return False
+    except anthropic.APIStatusError as e:
+        if e.status_code in RETRYABLE_STATUS_CODES:
+            return False
+        raise
+
+
+def run_batch_review(
+    objectives: Iterable[str],
+    state_path: Path,
+    client: Optional[Any] = None,
+    max_batch_requests: int = MAX_BATCH_REQUESTS,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+    sleep: Callable[[float], None] = time.sleep,
+    structured: bool = False,
+    dedupe: bool = False,
+    duplicate_threshold: Optional[float] = None,
+) -> List[Tuple[str, str, Optional[str]]]:
+    """Review every objective with Claude through the Message Batches API.
+
+    Progress is checkpointed in state_path. Running the job again with the same
+    objectives and state file resumes it: batches that were already submitted
+    are polled rather than submitted again, and stored results are reused.
+    Objectives whose review is in the response cache are not submitted at all.
+
+    With dedupe, duplicate objectives (differing only in case, punctuation,
+    course codes or the "By the end of ..." lead-in) are reviewed once and the
+    review is copied to every duplicate. A duplicate_threshold also merges
+    fuzzy matches with the same content words; see duplicate_groups.
+
+    Args:
+        objectives: The objectives to review, in row order
+        state_path: SQLite checkpoint file for the job
+        client: Anthropic client; defaults to the shared client
+        max_batch_requests: Maximum requests per batch
+        poll_interval: Seconds before the first status check of an open batch
+        max_poll_interval: Longest wait between status checks
+        sleep: Function used to wait between status checks
+        structured: Ask for reviews through the structured review tool
+        dedupe: Review duplicate objectives once
+        duplicate_threshold: Minimum estimated Jaccard similarity for fuzzy
+            duplicates to share a review; implies dedupe
+
+    Returns:
+        (objective, status, review) for every row in input order, where status
+        is "succeeded" or "errored" and review is Claude's text (in structured
+        mode, the JSON of ObjectiveReview.to_dict()) or the error
+    """
+    if client is None:
+        from uoes_learning_objectives.anthropic_client import get_anthropic_client
+
+        client = get_anthropic_client()
+        if client is None:
+            raise ValueError(
+                "Anthropic API key not found. Please set ANTHROPIC_API_KEY in your environment."
+            )
+
+    groups: Optional[List[int]] = None
+    if dedupe or duplicate_threshold is not None:
+        objectives = list(objectives)
+        representatives, groups = duplicate_groups(objectives, duplicate_threshold)
+        unique = [objectives[row] for row in representatives]
+        metrics.increment("uoes_batch_duplicates_total", len(objectives) - len(unique))
+
+    store = BatchJobStore(state_path, structured)
+    try:
+        store.add_rows(objectives if groups is None else unique)
+        _fill_from_cache(store)
+        # Canceled or expired items are resubmitted until every item has a result
+        while store.pending() or store.open_batches():
+            submit_pending(client, store, max_batch_requests)
+            wait = poll_interval
+            while open_batches := store.open_batches():
+                for batch_id in open_batches:
+                    if _batch_ended(client, batch_id):
+                        collect_results(client, store, batch_id)
+                if store.open_batches():
+                    sleep(wait)
+                    wait = min(wait * 2, max_poll_interval)
+        results = store.results()
+    finally:
+        store.close()
+
+    if groups is None:
+        return results
+    # Fan each representative's review out to its duplicates
+    return [
+        (objective, *results[group][1:]) for objective, group in zip(objectives, groups)
+    ]
+
+
+def _check_format(path: Path) -> str:
+    """Return the file suffix, raising ValueError if it is not supported."""
+    suffix = path.suffix.lower()
+    if suffix not in REVIEW_FORMATS:
+        raise ValueError(
+            f"Unsupported file format '{suffix}'. Expected one of: {', '.join(REVIEW_FORMATS)}"
+        )
+    return suffix
+
+
+def structured_record(objective: str, status: str, review: Optional[str]) -> Dict[str, Any]:
+    """Flatten a structured review row into a record with the STRUCTURED_REVIEW_FIELDS."""
+    if status != SUCCEEDED:
+        return {"objective": objective, "status": status, "error": review}
+    record = parse_review(json.loads(review or "")).to_record(objective)
+    return {"status": status, **record, "error": None}
+
+
+def write_reviews(
+    rows: Iterable[Tuple[str, str, Optional[str]]], path: Path, structured: bool = False
+) -> int:
+    """Write review rows to a CSV or JSONL file.
+
+    Args:
+        rows: (objective, status, review) tuples as returned by run_batch_review
+        path: Output file; the format is chosen from its suffix
+        structured: Whether the rows hold structured reviews, which are
+            written as one column per field
+
+    Returns:
+        The number of rows written
+    """
+    suffix = _check_format(path)
+    fields = STRUCTURED_REVIEW_FIELDS if structured else REVIEW_FIELDS
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields) if suffix == ".csv" else None
+        if writer:
+            writer.writeheader()
+        for row in rows:
+            record = structured_record(*row) if structured else dict(zip(REVIEW_FIELDS, row))
+            if writer:
+                if structured and record["status"] == SUCCEEDED:
+                    record["strengths"] = " | ".join(record["strengths"])
+                    record["suggestions"] = " | ".join(record["suggestions"])
+                writer.writerow(record)
+            else:
+                f.write(json.dumps(record) + "\n")
+            count += 1
+    return count
+
+
+def review_file(
+    input_path: Path,
+    output_path: Path,
+    state_path: Optional[Path] = None,
+    column: str = "objective",
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    structured: bool = False,
+    dedupe: bool = False,
+    duplicate_threshold: Optional[float] = None,
+) -> int:
+    """Review every objective in a file with Claude and write the reviews to another file.
+
+    Args:
+        input_path: CSV, JSONL or Parquet file with objectives
+        output_path: CSV or JSONL file to write the reviews to
+        state_path: Checkpoint file; defaults to the output path with a
+            .batch.sqlite3 suffix
+        column: Column (or JSON key) holding the objective text
+        poll_interval: Seconds before the first status check of an open batch
+        structured: Ask for structured reviews and write one column per field
+        dedupe: Review duplicate objectives once; see run_batch_review
+        duplicate_threshold: Also merge fuzzy duplicates; see run_batch_review
+
+    Returns:
+        The number of objectives reviewed
+    """
+    from uoes_learning_objectives.batch_analyzer import read_objectives
+
+    _check_format(output_path)
+    if state_path is None:
+        state_path = output_path.with_suffix(".batch.sqlite3")
+    rows = run_batch_review(
+        read_objectives(input_path, column),
+        state_path,
+        poll_interval=poll_interval,
+        structured=structured,
+        dedupe=dedupe,
+        duplicate_threshold=duplicate_threshold,
+    )
+    return write_reviews(rows, output_path, structured)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point for batch Claude reviews."""
+    parser = argparse.ArgumentParser(
+        description="Review learning objectives with Claude through the Message Batches API."
+    )
+    parser.add_argument("input", type=Path, help="Input file (.csv, .jsonl or .parquet)")
+    parser.add_argument("output", type=Path, help="Output file (.csv or .jsonl)")
+    parser.add_argument(
+        "--state",
+        type=Path,
+        help="Checkpoint file used to resume an interrupted job "
+        "(default: OUTPUT with a .batch.sqlite3 suffix)",
+    )
+    parser.add_argument(
+        "--column",
+        default="objective",
+        help="Column or JSON key holding the objective text (default: objective)",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=f"Seconds before the first status check (default: {DEFAULT_POLL_INTERVAL:g})",
+    )
+    parser.add_argument(
+        "--structured",
+        action="store_true",
+        help="Ask for structured reviews and write Bloom's level, strengths, suggestions "
+        "and rubric scores as separate columns",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Review objectives that differ only in case, punctuation, course codes or the "
+        "lead-in once and copy the review to the duplicates",
+    )
+    parser.add_argument(
+        "--fuzzy-dedupe",
+        type=float,
+        nargs="?",
+        const=DEFAULT_DUPLICATE_THRESHOLD,
+        metavar="THRESHOLD",
+        help="Like --dedupe, and also merge objectives with the same content words whose text "
+        f"is at least THRESHOLD similar (default: {DEFAULT_DUPLICATE_THRESHOLD}, "
+        f"minimum: {MIN_DUPLICATE_THRESHOLD})",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        count = review_file(
+            args.input, args.output, args.state, args.column, args.poll_interval,
+            args.structured, args.dedupe, args.fuzzy_dedupe,
+        )
+    except (ValueError, ImportError, OSError) as e:
+        parser.exit(2, f"error: {e}\n")
+
+    print(f"Reviewed {count} objectives -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,26 @@
+"""Process-wide settings read from the environment and the .env file."""
+
+import functools
+import os
+from typing import Optional
+
+# Model used for all Claude requests made by the application
+CLAUDE_MODEL = "claude-3-haiku-20240307"
+
+
+@functools.lru_cache(maxsize=None)
+def load_environment() -> None:
+    """Parse the .env file into os.environ, once per process.
+
+    Streamlit re-executes page code on every interaction, so .env is loaded on
+    first use rather than at import time. Existing variables are not overridden.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def get_api_key() -> Optional[str]:
+    """Return the Anthropic API key from the environment or .env file, if set."""
+    load_environment()
+    return os.getenv("ANTHROPIC_API_KEY")
@@ -0,0 +1,358 @@
+"""Memory-mapped TF-IDF index of exemplar objectives for closest-exemplar lookups."""
+
+import argparse
+import functools
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from uoes_learning_objectives.blooms_taxonomy import TAXONOMY
+from uoes_learning_objectives.near_duplicates import canonical_text
+from uoes_learning_objectives.taxonomy_data import TaxonomyData, current_data
+
+# numpy and pandas are imported inside the functions that need them, like in utils
+if TYPE_CHECKING:
+    import numpy as np
+
+# Character n-gram lengths and the number of hashed features they map to
+NGRAM_SIZES = (3, 4, 5)
+NUM_FEATURES = 1 << 20
+
+# N-grams found in more than this share of a large corpus (and in more than
+# MIN_PRUNED_FREQUENCY exemplars) carry almost no weight and are left out, which
+# keeps queries from reading postings that span most of the corpus
+MAX_DOCUMENT_SHARE = 0.05
+MIN_PRUNED_FREQUENCY = 100
+
+# Directory of a prebuilt store; without it the store holds the sample objectives
+STORE_ENV_VAR = "UOES_EXEMPLAR_STORE"
+
+CORPUS_COLUMNS = ["discipline", "level", "objective"]
+CORPUS_FORMATS = (".csv", ".jsonl", ".parquet")
+
+# Arrays saved as one .npy file each; all are memory-mapped on load
+_ARRAYS = (
+    "feature_offsets",  # int64, NUM_FEATURES + 1: feature f owns postings offsets[f:f + 2]
+    "posting_docs",  # int32: exemplar numbers, by feature
+    "posting_weights",  # float32: L2-normalized TF-IDF weights, by feature
+    "idf",  # float32, NUM_FEATURES; 0 for pruned n-grams
+    "disciplines",  # int32: index into the discipline names, per exemplar
+    "levels",  # int8: index into TAXONOMY.levels, per exemplar
+    "text_offsets",  # int64: exemplar i is text_bytes[offsets[i]:offsets[i + 1]]
+    "text_bytes",  # uint8: UTF-8 exemplar texts, concatenated
+)
+
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+
+
+class Exemplar(NamedTuple):
+    """An exemplar objective and its cosine similarity to the query."""
+
+    discipline: str
+    level: str
+    objective: str
+    score: float
+
+
+def _ngram_features(texts: List[str]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Hash the character n-grams of many texts at once.
+
+    Returns:
+        The text number and the feature of every n-gram occurrence
+    """
+    import numpy as np
+
+    # Drop the shared lead-in and pad with spaces so that word starts and ends
+    # form n-grams, then hash every window of the concatenation in one pass
+    padded = [f" {canonical_text(text)} " for text in texts]
+    encoded = [text.encode("utf-8") for text in padded]
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+    lengths = np.array([len(text) for text in encoded], dtype=np.int64)
+    ends = np.cumsum(lengths)
+    owner = np.repeat(np.arange(len(texts)), lengths)
+
+    text_ids, features = [], []
+    for size in NGRAM_SIZES:
+        if len(data) < size:
+            continue
+        windows = len(data) - size + 1
+        hashes = np.full(windows, size, dtype=np.uint64)
+        for offset in range(size):
+            hashes = hashes * np.uint64(_HASH_MULTIPLIER) + data[offset:windows + offset]
+        # Keep only windows that lie inside one text
+        inside = np.arange(windows) + size <= ends[owner[:windows]]
+        text_ids.append(owner[:windows][inside])
+        features.append(((hashes >> np.uint64(29)) % np.uint64(NUM_FEATURES))[inside])
+    if not text_ids:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(text_ids), np.concatenate(features).astype(np.int64)
+
+
+def build_arrays(
+    records: Iterable[Tuple[str, str, str]]
+) -> Tuple[Dict[str, "np.ndarray"], List[str]]:
+    """Build the index arrays for (discipline, level, objective) records.
+
+    Returns:
+        The arrays named in _ARRAYS and the discipline names
+    """
+    import numpy as np
+
+    records = list(records)
+    names = sorted({discipline for discipline, _, _ in records})
+    discipline_codes = {name: code for code, name in enumerate(names)}
+    unknown = {level for _, level, _ in records if level not in TAXONOMY.level_rank}
+    if unknown:
+        raise ValueError(f"Unknown Bloom's levels: {', '.join(sorted(map(str, unknown)))}")
+    texts = [objective for _, _, objective in records]
+
+    # Sublinear term frequency times smoothed IDF, L2-normalized per exemplar
+    doc_ids, features = _ngram_features(texts)
+    pairs, counts = np.unique(doc_ids * NUM_FEATURES + features, return_counts=True)
+    pair_docs, pair_features = np.divmod(pairs, NUM_FEATURES)
+    document_frequency = np.bincount(pair_features, minlength=NUM_FEATURES)
+    idf = (np.log((1 + len(texts)) / (1 + document_frequency)) + 1).astype(np.float32)
+    pruned = document_frequency > max(MAX_DOCUMENT_SHARE * len(texts), MIN_PRUNED_FREQUENCY)
+    idf[pruned] = 0
+    keep = ~pruned[pair_features]
+    pair_docs, pair_features, counts = pair_docs[keep], pair_features[keep], counts[keep]
+    document_frequency[pruned] = 0
+    weights = (1 + np.log(counts)) * idf[pair_features]
+    norms = np.sqrt(np.bincount(pair_docs, weights=weights**2, minlength=len(texts)))
+    weights = weights / np.maximum(norms[pair_docs], np.finfo(np.float64).tiny)
+
+    # Regroup the postings by feature so a query only reads its own features
+    order = np.argsort(pair_features, kind="stable")
+    feature_offsets = np.zeros(NUM_FEATURES + 1, dtype=np.int64)
+    np.cumsum(document_frequency, out=feature_offsets[1:])
+
+    encoded = [text.encode("utf-8") for text in texts]
+    text_offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    np.cumsum([len(text) for text in encoded], out=text_offsets[1:])
+    arrays = {
+        "feature_offsets": feature_offsets,
+        "posting_docs": pair_docs[order].astype(np.int32),
+        "posting_weights": weights[order].astype(np.float32),
+        "idf": idf,
+        "disciplines": np.array(
+            [discipline_codes[discipline] for discipline, _, _ in records], dtype=np.int32
+        ),
+        "levels": np.array(
+            [TAXONOMY.level_rank[level] for _, level, _ in records], dtype=np.int8
+        ),
+        "text_offsets": text_offsets,
+        "text_bytes": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+    }
+    return arrays, names
+
+
+class ExemplarStore:
+    """Top-k cosine similarity search over TF-IDF vectors of character n-grams.
+
+    The postings are stored feature by feature, so a query reads only the
+    postings of its own n-grams. Stores saved with save() are opened with
+    numpy memory maps: every process that loads the same directory shares
+    one copy through the operating system's page cache.
+    """
+
+    def __init__(self, arrays: Dict[str, "np.ndarray"], disciplines: List[str]) -> None:
+        """Wrap index arrays as produced by build_arrays or load."""
+        self._arrays = arrays
+        self.disciplines = disciplines
+        self._discipline_codes = {name: code for code, name in enumerate(disciplines)}
+
+    def __len__(self) -> int:
+        return len(self._arrays["disciplines"])
+
+    @classmethod
+    def build(cls, records: Iterable[Tuple[str, str, str]]) -> "ExemplarStore":
+        """Build an in-memory store from (discipline, level, objective) records."""
+        return cls(*build_arrays(records))
+
+    @classmethod
+    def load(cls, directory: Path) -> "ExemplarStore":
+        """Open a store saved with save(), memory-mapping its arrays."""
+        import numpy as np
+
+        meta = json.loads((directory / "meta.json").read_text(encoding="utf-8"))
+        if meta["num_features"] != NUM_FEATURES or meta["ngram_sizes"] != list(NGRAM_SIZES):
+            raise ValueError(f"Exemplar store {directory} was built with other settings")
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in _ARRAYS}
+        return cls(arrays, meta["disciplines"])
+
+    def save(self, directory: Path) -> None:
+        """Write the store to a directory of .npy files plus meta.json."""
+        import numpy as np
+
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in _ARRAYS:
+            np.save(directory / f"{name}.npy", self._arrays[name])
+        meta = {
+            "disciplines": self.disciplines,
+            "num_features": NUM_FEATURES,
+            "ngram_sizes": list(NGRAM_SIZES),
+            "size": len(self),
+        }
+        (directory / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+
+    def _text(self, exemplar: int) -> str:
+        """Return the objective text of an exemplar."""
+        start, end = self._arrays["text_offsets"][exemplar:exemplar + 2]
+        return bytes(self._arrays["text_bytes"][start:end]).decode("utf-8")
+
+    def search(
+        self,
+        objective: str,
+        k: int = 5,
+        discipline: Optional[str] = None,
+        level: Optional[str] = None,
+    ) -> List[Exemplar]:
+        """Find the k exemplars most similar to an objective.
+
+        Args:
+            objective: The objective text
+            k: Maximum number of exemplars returned
+            discipline: Only consider exemplars from this discipline
+            level: Only consider exemplars at this Bloom's level
+
+        Returns:
+            Exemplars with a positive similarity, most similar first
+        """
+        import numpy as np
+
+        arrays = self._arrays
+        _, features = _ngram_features([objective])
+        features, counts = np.unique(features, return_counts=True)
+        weights = (1 + np.log(counts)) * arrays["idf"][features]
+        norm = np.sqrt((weights**2).sum())
+        if not norm:
+            return []
+
+        offsets = arrays["feature_offsets"]
+        scores = np.zeros(len(self), dtype=np.float32)
+        for feature, weight in zip(features, weights / norm):
+            start, end = offsets[feature], offsets[feature + 1]
+            if start != end:
+                # An exemplar appears at most once in a feature's postings
+                scores[arrays["posting_docs"][start:end]] += (
+                    weight * arrays["posting_weights"][start:end]
+                )
+
+        if discipline is not None:
+            code = self._discipline_codes.get(discipline, -1)
+            scores[arrays["disciplines"] != code] = 0
+        if level is not None:
+            scores[arrays["levels"] != TAXONOMY.level_rank.get(level, -1)] = 0
+
+        k = min(k, int(np.count_nonzero(scores)))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            Exemplar(
+                self.disciplines[arrays["disciplines"][i]],
+                TAXONOMY.levels[arrays["levels"][i]],
+                self._text(i),
+                float(scores[i]),
+            )
+            for i in top
+        ]
+
+
+def sample_records(data: Optional[TaxonomyData] = None) -> List[Tuple[str, str, str]]:
+    """Return the sample objectives as (discipline, level, objective) records.
+
+    Args:
+        data: Taxonomy data snapshot, defaults to the current one
+    """
+    data = data or current_data()
+    return [
+        (discipline, level, objective)
+        for discipline, objectives in data.sample_objectives.items()
+        for level, objective in objectives.items()
+    ]
+
+
+def default_store() -> ExemplarStore:
+    """Return the process-wide exemplar store, opened on first use.
+
+    The store in the UOES_EXEMPLAR_STORE directory is memory-mapped if that
+    variable is set; otherwise a small store of the sample objectives is built,
+    and rebuilt after the taxonomy data file is reloaded.
+    """
+    directory = os.getenv(STORE_ENV_VAR)
+    if directory:
+        return _mapped_store(directory)
+    return _sample_store(current_data())
+
+
+@functools.lru_cache(maxsize=1)
+def _mapped_store(directory: str) -> ExemplarStore:
+    """Open the store in directory, once."""
+    return ExemplarStore.load(Path(directory))
+
+
+@functools.lru_cache(maxsize=1)
+def _sample_store(data: TaxonomyData) -> ExemplarStore:
+    """Build the store of one snapshot's sample objectives, once per snapshot."""
+    return ExemplarStore.build(sample_records(data))
+
+
+def read_corpus(path: Path) -> List[Tuple[str, str, str]]:
+    """Read (discipline, level, objective) records from a CSV, JSONL or Parquet file."""
+    import pandas as pd
+
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        frame = pd.read_csv(path, usecols=CORPUS_COLUMNS, dtype=str)
+    elif suffix == ".jsonl":
+        frame = pd.read_json(path, lines=True, dtype=False)
+    elif suffix == ".parquet":
+        frame = pd.read_parquet(path, columns=CORPUS_COLUMNS)
+    else:
+        raise ValueError(
+            f"Unsupported file format '{suffix}'. Expected one of: {', '.join(CORPUS_FORMATS)}"
+        )
+    missing = [column for column in CORPUS_COLUMNS if column not in frame.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+    frame = frame[CORPUS_COLUMNS].dropna()
+    return list(frame.itertuples(index=False, name=None))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point for building an exemplar store."""
+    parser = argparse.ArgumentParser(
+        description="Build a memory-mapped exemplar store from a corpus of objectives."
+    )
+    parser.add_argument(
+        "input",
+        type=Path,
+        help="Corpus with discipline, level and objective columns (.csv, .jsonl or .parquet)",
+    )
+    parser.add_argument("output", type=Path, help="Directory to write the store to")
+    parser.add_argument(
+        "--include-samples",
+        action="store_true",
+        help="Also include the built-in sample objectives",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        records = read_corpus(args.input)
+        if args.include_samples:
+            records = sample_records() + records
+        store = ExemplarStore.build(records)
+        store.save(args.output)
+    except (ValueError, ImportError, OSError) as e:
+        parser.exit(2, f"error: {e}\n")
+
+    print(f"Indexed {len(store)} exemplars -> {args.output}")
+    print(f"Set {STORE_ENV_VAR}={args.output} to use it in the app")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+"""Incremental heuristic analysis for scoring text while it is being edited."""
+
+import functools
+import re
+from typing import List, NamedTuple, Optional, Tuple
+
+from uoes_learning_objectives.objective_analyzer import (
+    MEASURABLE_WORDS,
+    STANDARD_FORMAT_PHRASE,
+    TIME_BOUND_PHRASE,
+    AnalysisResult,
+    VerbMatch,
+    build_analysis,
+    match_verbs,
+    normalize_objective,
+)
+from uoes_learning_objectives.taxonomy_data import Taxonomy, current_data
+
+# Segments end right after a sentence terminator or line break. No phrase or
+# verb the heuristics look for contains one of these characters, so a match can
+# never span two segments and per-segment features combine exactly.
+SEGMENT_BOUNDARY = re.compile(r"(?<=[.!?\n])")
+
+# Number of distinct segments whose features are remembered
+SEGMENT_CACHE_SIZE = 4096
+
+
+class SegmentFeatures(NamedTuple):
+    """Heuristic features of one segment of text."""
+
+    lowered_length: int
+    has_format: bool
+    time_bound: bool
+    measurable: bool
+    verbs: Tuple[VerbMatch, ...]
+
+
+@functools.lru_cache(maxsize=SEGMENT_CACHE_SIZE)
+def segment_features(segment: str, taxonomy: Taxonomy) -> SegmentFeatures:
+    """Compute (and memoize) the heuristic features of one segment with one set of verb tables."""
+    lower = segment.lower()
+    return SegmentFeatures(
+        lowered_length=len(lower),
+        has_format=STANDARD_FORMAT_PHRASE in lower,
+        time_bound=TIME_BOUND_PHRASE in lower,
+        measurable=any(word in lower for word in MEASURABLE_WORDS),
+        verbs=tuple(match_verbs(lower, taxonomy)),
+    )
+
+
+def split_segments(text: str) -> List[str]:
+    """Split text into sentence and line segments that join back to the text."""
+    return [segment for segment in SEGMENT_BOUNDARY.split(text) if segment]
+
+
+def analyze_incrementally(text: str) -> AnalysisResult:
+    """Analyze text by combining memoized per-segment features.
+
+    The result is identical to analyze(text), but after an edit only the
+    segments that changed are scanned again.
+
+    Args:
+        text: The text to analyze, e.g. the current content of a text area
+
+    Returns:
+        The combined analysis of the whole text
+    """
+    # Every segment is scanned with the same verb tables, even if the taxonomy
+    # data file is reloaded meanwhile
+    taxonomy = current_data().taxonomy
+    offset = 0
+    has_format = time_bound = measurable = False
+    verbs: List[VerbMatch] = []
+    for segment in split_segments(text):
+        features = segment_features(segment, taxonomy)
+        has_format = has_format or features.has_format
+        time_bound = time_bound or features.time_bound
+        measurable = measurable or features.measurable
+        if offset:
+            verbs.extend(
+                match._replace(start=match.start + offset, end=match.end + offset)
+                for match in features.verbs
+            )
+        else:
+            verbs.extend(features.verbs)
+        offset += features.lowered_length
+
+    return build_analysis(
+        text,
+        text.lower(),
+        tuple(verbs),
+        has_format=has_format,
+        time_bound=time_bound,
+        measurable=measurable,
+    )
+
+
+def live_analysis(text: str, previous: Optional[AnalysisResult] = None) -> AnalysisResult:
+    """Return the analysis for text, reusing previous if the normalized text is unchanged.
+
+    Args:
+        text: The raw text as entered
+        previous: The analysis from the last run, if any
+
+    Returns:
+        The analysis of the normalized text
+    """
+    normalized = normalize_objective(text)
+    if previous is not None and previous.objective == normalized:
+        return previous
+    return analyze_incrementally(normalized)
@@ -0,0 +1,333 @@
+"""Lightweight instrumentation with Prometheus text-format export.
+
+Metrics are disabled by default and every recording function returns
+immediately in that case. Set these environment variables (or .env entries)
+to turn instrumentation on:
+
+- UOES_METRICS=1: record timers and counters
+- UOES_METRICS_PORT: serve /metrics on this local port
+- UOES_METRICS_FILE: rewrite this file after each page render
+- UOES_PROFILE_DIR: save a cProfile capture of each page render here (off
+  when unset; renders that overlap a capture in progress are not profiled)
+"""
+
+import contextlib
+import functools
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Upper bounds (seconds) of the latency histogram buckets
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class _Histogram:
+    """Cumulative bucket counts plus sum and count for one label set."""
+
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """Thread-safe store of counters and histograms keyed by name and labels."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+        self._collectors: Dict[str, Callable[[], Dict[str, float]]] = {}
+
+    def increment(self, name: str, value: float = 1.0, **labels: str) -> None:
+        """Add value to a counter."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Record one observation (usually seconds) in a histogram."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(DEFAULT_BUCKETS)
+            histogram.observe(value)
+
+    def register_collector(self, prefix: str, collect: Callable[[], Dict[str, float]]) -> None:
+        """Export the values returned by collect() as gauges named prefix_<key>."""
+        with self._lock:
+            self._collectors[prefix] = collect
+
+    def clear(self) -> None:
+        """Drop all recorded values; registered collectors are kept."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{name}{_labels(key)} {value:g}")
+
+            for name, histograms in sorted(self._histograms.items()):
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in sorted(histograms.items()):
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        lines.append(f"{name}_bucket{_labels(key, le=f'{bound:g}')} {count}")
+                    lines.append(f"{name}_bucket{_labels(key, le='+Inf')} {histogram.count}")
+                    lines.append(f"{name}_sum{_labels(key)} {histogram.total:g}")
+                    lines.append(f"{name}_count{_labels(key)} {histogram.count}")
+
+            collectors = sorted(self._collectors.items())
+
+        for prefix, collect in collectors:
+            for key, value in sorted(collect().items()):
+                name = f"{prefix}_{_sanitize(key)}"
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {value:g}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _sanitize(name: str) -> str:
+    """Make a string safe to use as part of a Prometheus metric name."""
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def _labels(key: LabelKey, **extra: str) -> str:
+    """Format a label set as {a="1",b="2"}, or an empty string without labels."""
+    pairs = list(key) + list(extra.items())
+    if not pairs:
+        return ""
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in pairs
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+REGISTRY = MetricsRegistry()
+
+# Checked by every recording function; flipped by configure() or enable()
+_enabled = False
+_profile_dir: Optional[Path] = None
+_metrics_file: Optional[Path] = None
+
+
+def enable(
+    enabled: bool = True,
+    profile_dir: Optional[Path] = None,
+    metrics_file: Optional[Path] = None,
+) -> None:
+    """Turn recording on or off programmatically."""
+    global _enabled, _profile_dir, _metrics_file
+    _enabled = enabled
+    _profile_dir = profile_dir
+    _metrics_file = metrics_file
+
+
+def is_enabled() -> bool:
+    """Return True if metrics are being recorded."""
+    return _enabled
+
+
+@functools.lru_cache(maxsize=None)
+def configure() -> None:
+    """Apply the UOES_METRICS* and UOES_PROFILE_DIR settings, once per process."""
+    from uoes_learning_objectives.config import load_environment
+
+    load_environment()
+    profile_dir = os.getenv("UOES_PROFILE_DIR")
+    metrics_file = os.getenv("UOES_METRICS_FILE")
+    enable(
+        os.getenv("UOES_METRICS", "").lower() in ("1", "true", "yes"),
+        Path(profile_dir) if profile_dir else None,
+        Path(metrics_file) if metrics_file else None,
+    )
+    port = os.getenv("UOES_METRICS_PORT")
+    if _enabled and port:
+        start_metrics_server(int(port))
+
+
+def increment(name: str, value: float = 1.0, **labels: str) -> None:
+    """Add value to a counter if metrics are enabled."""
+    if _enabled:
+        REGISTRY.increment(name, value, **labels)
+
+
+def observe(name: str, value: float, **labels: str) -> None:
+    """Record an observation in a histogram if metrics are enabled."""
+    if _enabled:
+        REGISTRY.observe(name, value, **labels)
+
+
+@contextlib.contextmanager
+def _timer(name: str, labels: Dict[str, str]) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        REGISTRY.observe(name, time.perf_counter() - start, **labels)
+
+
+def timer(name: str, **labels: str) -> "contextlib.AbstractContextManager[None]":
+    """Context manager recording its duration in a histogram.
+
+    Returns a no-op context manager when metrics are disabled.
+    """
+    if not _enabled:
+        return contextlib.nullcontext()
+    return _timer(name, labels)
+
+
+def timed(name: str, **labels: str) -> Callable[[F], F]:
+    """Decorator recording each call's duration in a histogram."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _timer(name, labels):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def register_collector(prefix: str, collect: Callable[[], Dict[str, float]]) -> None:
+    """Export a stats callback (e.g. cache hit counters) as gauges."""
+    REGISTRY.register_collector(prefix, collect)
+
+
+def render_prometheus() -> str:
+    """Return all metrics in the Prometheus text exposition format."""
+    return REGISTRY.render()
+
+
+# Metrics file writes are serialized; profile captures are skipped while one is running
+_write_lock = threading.Lock()
+_profile_lock = threading.Lock()
+
+
+def write_prometheus(path: Optional[Path] = None) -> None:
+    """Atomically write the metrics to path, or to UOES_METRICS_FILE.
+
+    A failed write is counted in uoes_metrics_write_errors_total rather than
+    raised, so exporting metrics never breaks a page render.
+    """
+    path = path or _metrics_file
+    if path is None or not _enabled:
+        return
+    import tempfile
+
+    text = render_prometheus()
+    with _write_lock:
+        tmp: Optional[Path] = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w", dir=path.parent, prefix=path.name, suffix=".tmp", delete=False
+            ) as file:
+                tmp = Path(file.name)
+                file.write(text)
+            tmp.replace(path)
+        except OSError:
+            REGISTRY.increment("uoes_metrics_write_errors_total")
+            if tmp is not None:
+                with contextlib.suppress(OSError):
+                    tmp.unlink(missing_ok=True)
+
+
+@contextlib.contextmanager
+def profile_request(name: str) -> Iterator[None]:
+    """Capture a cProfile of the block into UOES_PROFILE_DIR, if configured.
+
+    Profiling is off unless UOES_PROFILE_DIR is set. Only one profiler can be
+    active per process, so while one block is being profiled, blocks entered
+    from other threads (other sessions) run without a capture.
+    """
+    if _profile_dir is None or not _profile_lock.acquire(blocking=False):
+        yield
+        return
+    import cProfile
+
+    profile_dir = _profile_dir
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Another profiling tool (a debugger, py-spy, ...) is already active
+        _profile_lock.release()
+        yield
+        return
+    try:
+        yield
+    finally:
+        profiler.disable()
+        _profile_lock.release()
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        with contextlib.suppress(OSError):
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(profile_dir / f"{_sanitize(name)}-{stamp}-{time.monotonic_ns()}.prof")
+
+
+_server: Optional["ThreadingHTTPServer"] = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> "ThreadingHTTPServer":
+    """Serve /metrics from a background thread; later calls reuse the server."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), MetricsHandler)
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, daemon=True).start()
+        return _server
@@ -0,0 +1,279 @@
+"""MinHash/LSH index for finding near-duplicate and similar learning objectives."""
+
+import functools
+import json
+import re
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, FrozenSet, Hashable, Iterable, List, Optional, Tuple
+
+# numpy is imported inside the functions that need it, like in utils
+if TYPE_CHECKING:
+    import numpy as np
+
+# Signature length and LSH banding. With 16 bands of 4 rows, pairs with a
+# Jaccard similarity of 0.8 share a bucket with probability above 0.999.
+DEFAULT_NUM_PERM = 64
+DEFAULT_BANDS = 16
+
+# Estimated Jaccard similarity above which fuzzy matching (an explicit opt-in)
+# treats two objectives as duplicates, and the lowest threshold accepted
+DEFAULT_DUPLICATE_THRESHOLD = 0.95
+MIN_DUPLICATE_THRESHOLD = 0.9
+
+# Words that may differ between fuzzy duplicates; every other word must match
+_FILLER_WORDS = frozenset(
+    "a an and as at be by for from in into its of on or that the their these this those "
+    "to will with".split()
+)
+
+# Characters per shingle
+SHINGLE_SIZE = 5
+
+# Largest prime below 2**32; hash values and signatures fit in uint32
+_PRIME = 4_294_967_291
+_SEED = 1
+
+# "By the end of this course/BIO 101/the term, students will be able to"
+_PREFIX = re.compile(
+    r"^(?:(?:by the end of|upon completion of|after completing)\b[^,]*,\s*)?"
+    r"(?:(?:students|learners|participants) (?:will|should) be able to\s*:?\s*)?"
+)
+# Uppercase in the raw text ("BIO 101", "CS-220L"), so "art from 1600" or
+# "WWI" keep their numbers
+_COURSE_CODE = re.compile(r"\b[A-Z]{2,4}\s?-?\d{3}[A-Z]?\b")
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def canonical_text(objective: str) -> str:
+    """Reduce an objective to the part that distinguishes it from its near duplicates.
+
+    Case, punctuation, whitespace, course codes and the standard
+    "By the end of ..., students will be able to" lead-in are dropped.
+    """
+    text = _COURSE_CODE.sub(" ", objective)
+    text = _PREFIX.sub("", " ".join(text.lower().split()))
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def shingle_hashes(text: str, size: int = SHINGLE_SIZE) -> List[int]:
+    """Return the distinct CRC-32 hashes of the character shingles of text."""
+    if len(text) <= size:
+        return [zlib.crc32(text.encode("utf-8"))] if text else []
+    data = text.encode("utf-8")
+    return list({zlib.crc32(data[i:i + size]) for i in range(len(data) - size + 1)})
+
+
+@functools.lru_cache(maxsize=8)
+def _permutations(num_perm: int, seed: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Return the coefficients of num_perm universal hash functions."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _PRIME, size=(num_perm, 1), dtype=np.uint64)
+    b = rng.integers(0, _PRIME, size=(num_perm, 1), dtype=np.uint64)
+    return a, b
+
+
+def minhash(text: str, num_perm: int = DEFAULT_NUM_PERM, seed: int = _SEED) -> "np.ndarray":
+    """Compute the MinHash signature of the canonical text of an objective.
+
+    Args:
+        text: The objective text
+        num_perm: Signature length
+        seed: Seed of the hash functions; signatures only compare with equal seeds
+
+    Returns:
+        A uint32 array of length num_perm
+    """
+    import numpy as np
+
+    hashes = shingle_hashes(canonical_text(text))
+    if not hashes:
+        return np.full(num_perm, _PRIME, dtype=np.uint32)
+    a, b = _permutations(num_perm, seed)
+    # a, b and the hashes are all below 2**32, so a * h + b cannot overflow uint64
+    values = (a * np.array(hashes, dtype=np.uint64) + b) % np.uint64(_PRIME)
+    return values.min(axis=1).astype(np.uint32)
+
+
+class MinHashIndex:
+    """Locality-sensitive hashing index over MinHash signatures.
+
+    Each signature is cut into `bands` bands; items sharing any band land in
+    the same bucket and become candidates, which are then ranked by estimated
+    Jaccard similarity. A query therefore touches only its buckets rather
+    than every item.
+    """
+
+    def __init__(
+        self, num_perm: int = DEFAULT_NUM_PERM, bands: int = DEFAULT_BANDS, seed: int = _SEED
+    ) -> None:
+        """Create an empty index.
+
+        Args:
+            num_perm: Signature length
+            bands: Number of LSH bands; more bands find less similar pairs
+            seed: Seed of the MinHash functions
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.seed = seed
+        self.keys: List[Hashable] = []
+        # Rows [0, len(self)) hold the signatures; capacity grows by doubling
+        self._signatures: Optional["np.ndarray"] = None
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _band_keys(self, signature: "np.ndarray") -> List[bytes]:
+        """Split a signature into one bucket key per band."""
+        return [band.tobytes() for band in signature.reshape(self.bands, -1)]
+
+    def add(self, key: Hashable, text: str) -> None:
+        """Index text under key."""
+        self.add_signature(key, minhash(text, self.num_perm, self.seed))
+
+    def add_signature(self, key: Hashable, signature: "np.ndarray") -> None:
+        """Index a precomputed signature under key."""
+        import numpy as np
+
+        item = len(self.keys)
+        if self._signatures is None or item == len(self._signatures):
+            grown = np.empty((max(16, 2 * item), self.num_perm), dtype=np.uint32)
+            if self._signatures is not None:
+                grown[:item] = self._signatures
+            self._signatures = grown
+        self._signatures[item] = signature
+        self.keys.append(key)
+        for buckets, band in zip(self._buckets, self._band_keys(signature)):
+            buckets.setdefault(band, []).append(item)
+
+    def query_signature(
+        self, signature: "np.ndarray", threshold: float = 0.0, limit: Optional[int] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """Find indexed items similar to a signature.
+
+        Args:
+            signature: MinHash signature to look up
+            threshold: Minimum estimated Jaccard similarity
+            limit: Maximum number of matches returned
+
+        Returns:
+            (key, similarity) pairs, most similar first
+        """
+        import numpy as np
+
+        candidates: List[int] = []
+        for buckets, band in zip(self._buckets, self._band_keys(signature)):
+            candidates.extend(buckets.get(band, ()))
+        if not candidates:
+            return []
+        items = np.unique(np.array(candidates, dtype=np.intp))
+        similarities = (self._signatures[items] == signature).mean(axis=1)
+        keep = similarities >= threshold
+        items, similarities = items[keep], similarities[keep]
+        # Stable sort keeps insertion order among equally similar items
+        order = np.argsort(-similarities, kind="stable")[:limit]
+        return [(self.keys[item], float(similarities[i])) for i, item in zip(order, items[order])]
+
+    def query(
+        self, text: str, threshold: float = 0.0, limit: Optional[int] = None
+    ) -> List[Tuple[Hashable, float]]:
+        """Find indexed items similar to text; see query_signature."""
+        return self.query_signature(minhash(text, self.num_perm, self.seed), threshold, limit)
+
+    def save(self, path: Path) -> None:
+        """Write the index to a .npz file: a uint32 signature matrix plus the keys as JSON.
+
+        Keys must be JSON-serializable; lists and tuples are read back as tuples.
+        """
+        import numpy as np
+
+        signatures = (
+            self._signatures[:len(self)] if self._signatures is not None
+            else np.empty((0, self.num_perm), dtype=np.uint32)
+        )
+        np.savez(
+            path,
+            signatures=signatures,
+            keys=np.array(json.dumps(self.keys)),
+            params=np.array([self.num_perm, self.bands, self.seed]),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "MinHashIndex":
+        """Read an index written by save; the buckets are rebuilt from the signatures."""
+        import numpy as np
+
+        with np.load(path, allow_pickle=False) as data:
+            num_perm, bands, seed = (int(value) for value in data["params"])
+            index = cls(num_perm, bands, seed)
+            keys = json.loads(str(data["keys"]))
+            for key, signature in zip(keys, data["signatures"]):
+                index.add_signature(key if not isinstance(key, list) else tuple(key), signature)
+        return index
+
+
+def _content_words(canonical: str) -> FrozenSet[str]:
+    """The words of a canonical text that carry meaning: everything but filler words."""
+    return frozenset(canonical.split()) - _FILLER_WORDS
+
+
+def duplicate_groups(
+    objectives: Iterable[str], threshold: Optional[float] = None
+) -> Tuple[List[int], List[int]]:
+    """Group objectives that are the same up to near-duplicate differences.
+
+    By default objectives are duplicates only if their canonical texts are
+    equal, i.e. they differ in nothing but case, punctuation, whitespace,
+    course codes and the standard lead-in. With a threshold, objectives whose
+    canonical texts are at least that similar are grouped as well, but only
+    when they have the same content words (and with them the same action
+    verbs): "analyze" and "evaluate", or "French" and "American", never merge.
+    The first objective of every group is its representative.
+
+    Args:
+        objectives: Objective texts, in row order
+        threshold: Minimum estimated Jaccard similarity for fuzzy matches, at
+            least MIN_DUPLICATE_THRESHOLD; None matches canonical texts exactly
+
+    Returns:
+        The row numbers of the representatives, and for every row the position
+        of its representative in that list
+
+    Raises:
+        ValueError: If threshold is below MIN_DUPLICATE_THRESHOLD
+    """
+    if threshold is not None and not MIN_DUPLICATE_THRESHOLD <= threshold <= 1:
+        raise ValueError(
+            f"duplicate threshold must be between {MIN_DUPLICATE_THRESHOLD} and 1, got {threshold}"
+        )
+    index = MinHashIndex() if threshold is not None else None
+    exact: Dict[str, int] = {}
+    content: List[FrozenSet[str]] = []
+    representatives: List[int] = []
+    groups: List[int] = []
+    for row, objective in enumerate(objectives):
+        canonical = canonical_text(objective)
+        group = exact.get(canonical)
+        if group is None:
+            words = _content_words(canonical)
+            signature = None
+            if index is not None:
+                signature = minhash(objective)
+                matches = index.query_signature(signature, threshold)
+                group = next((int(key) for key, _ in matches if content[int(key)] == words), None)
+            if group is None:
+                group = len(representatives)
+                representatives.append(row)
+                content.append(words)
+                if index is not None:
+                    index.add_signature(group, signature)
+            exact[canonical] = group
+        groups.append(group)
+    return representatives, groups
+
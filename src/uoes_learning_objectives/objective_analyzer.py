@@ -1,15 +1,80 @@
 """Learning objective analyzer module."""
 
+import asyncio
+import functools
 import re
+from dataclasses import dataclass
+from types import MappingProxyType
 import streamlit as st
-import os
-import anthropic
-from typing import Dict, List, Tuple, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Mapping, NamedTuple, Tuple, Optional
 
-from dotenv import load_dotenv
-load_dotenv()
+from uoes_learning_objectives import metrics
+from uoes_learning_objectives.config import CLAUDE_MODEL, get_api_key
+from uoes_learning_objectives.blooms_taxonomy import RUBRIC_CRITERIA, TAXONOMY
+from uoes_learning_objectives.prompts import SYSTEM_PROMPT_VERSION, prompt_version, system_blocks
+from uoes_learning_objectives.response_cache import cache_key, get_response_cache
+from uoes_learning_objectives.taxonomy_data import Taxonomy, current_data
 
-from uoes_learning_objectives.blooms_taxonomy import ACTION_VERBS, RUBRIC_CRITERIA
+# pandas, numpy and the Anthropic SDK are imported where they are used so that
+# loading the Streamlit pages stays fast
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Bloom's taxonomy levels ordered from lowest to highest cognitive complexity;
+# the levels cannot change when the taxonomy data file is reloaded
+BLOOMS_LEVELS: Tuple[str, ...] = TAXONOMY.levels
+
+# Features shared by the per-objective and columnar rubric scoring paths
+SPECIFIC_MIN_LENGTH = 30
+MEASURABLE_WORDS: List[str] = ["demonstrate", "calculate", "solve", "identify", "analyze"]
+TIME_BOUND_PHRASE = "by the end of"
+STANDARD_FORMAT_PHRASE = "students will be able to"
+
+
+class VerbMatch(NamedTuple):
+    """One Bloom's taxonomy action verb found in an objective."""
+    
+    start: int
+    end: int
+    verb: str
+    level: str
+
+
+def match_verbs(objective_lower: str, taxonomy: Optional[Taxonomy] = None) -> List[VerbMatch]:
+    """Find every action verb in lowercased text in a single pass.
+    
+    Args:
+        objective_lower: The learning objective text, already lowercased
+        taxonomy: Compiled verb tables, defaults to those of the current taxonomy data
+        
+    Returns:
+        The matches in order of appearance. Verbs listed under several levels
+        (e.g. "compare") produce one match per level.
+    """
+    taxonomy = taxonomy or current_data().taxonomy
+    verb_levels = taxonomy.verb_levels
+    matches = []
+    for match in taxonomy.verb_pattern.finditer(objective_lower):
+        verb = match.group()
+        start, end = match.span()
+        for level in verb_levels[verb]:
+            matches.append(VerbMatch(start, end, verb, level))
+    
+    return matches
+
+
+def find_action_verbs(objective: str) -> List[Tuple[str, str]]:
+    """Find every Bloom's taxonomy action verb in the objective in a single pass.
+    
+    Args:
+        objective: The learning objective text
+        
+    Returns:
+        A list of (verb, level) pairs in order of appearance. Verbs listed under
+        several levels (e.g. "compare") produce one pair per level.
+    """
+    return [(match.verb, match.level) for match in match_verbs(objective.lower())]
 
 
 def contains_action_verb(objective: str, level: str) -> bool:
@@ -22,15 +87,127 @@ def contains_action_verb(objective: str, level: str) -> bool:
     Returns:
         True if the objective contains an action verb from the specified level
     """
-    verbs = ACTION_VERBS.get(level, "").split(", ")
-    objective_lower = objective.lower()
+    return any(found == level for _, found in find_action_verbs(objective))
+
+
+def highest_level(levels: Iterable[str]) -> Optional[str]:
+    """Return the highest of the given Bloom's levels, or None if there are none."""
+    # The highest level wins when verbs from several levels are present
+    return max(levels, key=TAXONOMY.level_rank.__getitem__, default=None)
+
+
+def normalize_objective(objective: str) -> str:
+    """Strip the leading and trailing whitespace that comes and goes while typing."""
+    return objective.strip()
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisResult:
+    """Everything the heuristics derive from one learning objective.
+    
+    Built in a single pass by analyze(). basic_objective_analysis,
+    identify_blooms_level and evaluate_objective_rubric are views over it, and
+    the batch analyzer, the caches and the UI all use this one shape. Verb
+    spans index into `lowered`. Feedback is stored as tuples and the scores
+    as a read-only mapping, so a cached result can be shared by every session.
+    """
+    
+    objective: str
+    lowered: str
+    length: int
+    verbs: Tuple[VerbMatch, ...]
+    level: Optional[str]
+    has_format: bool
+    time_bound: bool
+    measurable: bool
+    strengths: Tuple[str, ...]
+    suggestions: Tuple[str, ...]
+    scores: Mapping[str, int]
+    
+    @property
+    def average_score(self) -> float:
+        """Mean of the rubric scores."""
+        return sum(self.scores.values()) / len(self.scores)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as JSON-serializable types, without the lowered copy."""
+        return {
+            "objective": self.objective,
+            "length": self.length,
+            "verbs": [match._asdict() for match in self.verbs],
+            "level": self.level,
+            "has_format": self.has_format,
+            "time_bound": self.time_bound,
+            "measurable": self.measurable,
+            "strengths": list(self.strengths),
+            "suggestions": list(self.suggestions),
+            "scores": dict(self.scores),
+            "average_score": self.average_score,
+        }
+
+
+def analyze(objective: str, taxonomy: Optional[Taxonomy] = None) -> AnalysisResult:
+    """Run every heuristic on a learning objective in a single pass.
+    
+    The objective is lowercased once and scanned for action verbs once; the
+    Bloom's level, strengths, suggestions and rubric scores are all derived
+    from those features.
     
-    for verb in verbs:
-        # Check for the verb as a word (not part of another word)
-        if re.search(r'\b' + verb + r'\b', objective_lower):
-            return True
+    Args:
+        objective: The learning objective text
+        taxonomy: Compiled verb tables, defaults to those of the current taxonomy data
+        
+    Returns:
+        The complete analysis
+    """
+    lowered = objective.lower()
+    return build_analysis(
+        objective,
+        lowered,
+        tuple(match_verbs(lowered, taxonomy)),
+        has_format=STANDARD_FORMAT_PHRASE in lowered,
+        time_bound=TIME_BOUND_PHRASE in lowered,
+        measurable=any(word in lowered for word in MEASURABLE_WORDS),
+    )
+
+
+def build_analysis(
+    objective: str,
+    lowered: str,
+    verbs: Tuple[VerbMatch, ...],
+    has_format: bool,
+    time_bound: bool,
+    measurable: bool,
+) -> AnalysisResult:
+    """Derive the level, feedback and rubric scores from precomputed features.
     
-    return False
+    Args:
+        objective: The learning objective text
+        lowered: The lowercased text
+        verbs: Every action verb match in the lowercased text
+        has_format: Whether the objective uses the 'students will be able to' format
+        time_bound: Whether the objective contains a time-bound phrase
+        measurable: Whether the objective contains a measurable verb
+        
+    Returns:
+        The complete analysis
+    """
+    length = len(objective)
+    level = highest_level(match.level for match in verbs)
+    strengths, suggestions = feedback_from_features(length, has_format, time_bound, level)
+    return AnalysisResult(
+        objective=objective,
+        lowered=lowered,
+        length=length,
+        verbs=verbs,
+        level=level,
+        has_format=has_format,
+        time_bound=time_bound,
+        measurable=measurable,
+        strengths=tuple(strengths),
+        suggestions=tuple(suggestions),
+        scores=MappingProxyType(rubric_from_features(length, measurable, level, time_bound)),
+    )
 
 
 def identify_blooms_level(objective: str) -> Optional[str]:
@@ -42,14 +219,7 @@ def identify_blooms_level(objective: str) -> Optional[str]:
     Returns:
         The highest Bloom's taxonomy level found, or None if no level is detected
     """
-    # Check for verbs from highest to lowest level
-    levels = ["Create", "Evaluate", "Analyze", "Apply", "Understand", "Remember"]
-    
-    for level in levels:
-        if contains_action_verb(objective, level):
-            return level
-    
-    return None
+    return analyze(objective).level
 
 
 def basic_objective_analysis(objective: str) -> Tuple[List[str], List[str]]:
@@ -58,6 +228,36 @@ def basic_objective_analysis(objective: str) -> Tuple[List[str], List[str]]:
     Args:
         objective: The learning objective text
         
+    Returns:
+        A tuple containing (strengths, suggestions)
+    """
+    result = analyze(objective)
+    return list(result.strengths), list(result.suggestions)
+
+
+def evaluate_objective_rubric(objective: str) -> Dict[str, int]:
+    """Evaluate a learning objective against the rubric criteria.
+    
+    Args:
+        objective: The learning objective text
+        
+    Returns:
+        Dictionary with scores for each rubric criterion
+    """
+    return dict(analyze(objective).scores)
+
+
+def feedback_from_features(
+    length: int, has_format: bool, time_bound: bool, level: Optional[str]
+) -> Tuple[List[str], List[str]]:
+    """Turn precomputed objective features into strengths and suggestions.
+    
+    Args:
+        length: Number of characters in the objective
+        has_format: Whether the objective uses the 'students will be able to' format
+        time_bound: Whether the objective contains a time-bound phrase
+        level: The highest Bloom's level detected, or None
+        
     Returns:
         A tuple containing (strengths, suggestions)
     """
@@ -65,23 +265,22 @@ def basic_objective_analysis(objective: str) -> Tuple[List[str], List[str]]:
     suggestions = []
     
     # Check length
-    if len(objective) < 20:
+    if length < 20:
         suggestions.append("The objective is too short. Consider adding more detail.")
     
     # Check format
-    if "students will be able to" in objective.lower():
+    if has_format:
         strengths.append("Uses the recommended 'students will be able to' format")
     else:
         suggestions.append("Consider using the format: 'Students will be able to...'")
     
     # Check for time-bound element
-    if "by the end of" in objective.lower():
+    if time_bound:
         strengths.append("Includes a time-bound element")
     else:
         suggestions.append("Consider adding when the objective should be achieved (e.g., 'By the end of this course')")
     
     # Check for Bloom's level
-    level = identify_blooms_level(objective)
     if level:
         strengths.append(f"Uses action verbs from Bloom's taxonomy level: {level}")
     else:
@@ -90,37 +289,40 @@ def basic_objective_analysis(objective: str) -> Tuple[List[str], List[str]]:
     return strengths, suggestions
 
 
-def evaluate_objective_rubric(objective: str) -> Dict[str, int]:
-    """Evaluate a learning objective against the rubric criteria.
+def rubric_from_features(
+    length: int, measurable: bool, level: Optional[str], time_bound: bool
+) -> Dict[str, int]:
+    """Score precomputed objective features against the rubric criteria.
     
     Args:
-        objective: The learning objective text
+        length: Number of characters in the objective
+        measurable: Whether the objective contains a measurable verb
+        level: The highest Bloom's level detected, or None
+        time_bound: Whether the objective contains a time-bound phrase
         
     Returns:
         Dictionary with scores for each rubric criterion
     """
     # This is a placeholder for more advanced analysis
     # In a real implementation, this would use more sophisticated analysis
-    
+    # The same rules are applied column-wise by score_frame
     scores = {}
     
     # Basic scoring logic (to be enhanced in future versions)
     # Specific
-    scores["Specific"] = 3 if len(objective) > 30 else 2
+    scores["Specific"] = 3 if length > SPECIFIC_MIN_LENGTH else 2
     
     # Measurable
-    measurable_words = ["demonstrate", "calculate", "solve", "identify", "analyze"]
-    scores["Measurable"] = 4 if any(word in objective.lower() for word in measurable_words) else 2
+    scores["Measurable"] = 4 if measurable else 2
     
     # Action-oriented
-    level = identify_blooms_level(objective)
     scores["Action-oriented"] = 4 if level else 2
     
     # Realistic - assuming all objectives are realistic
     scores["Realistic"] = 3
     
     # Time-bound
-    scores["Time-bound"] = 4 if "by the end of" in objective.lower() else 2
+    scores["Time-bound"] = 4 if time_bound else 2
     
     # Aligned - hard to assess without context
     scores["Aligned"] = 3
@@ -128,31 +330,232 @@ def evaluate_objective_rubric(objective: str) -> Dict[str, int]:
     return scores
 
 
-def analyze_objective_with_anthropic(objective: str) -> str:
-    """Use Anthropic's Claude API to analyze a learning objective."""
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        return "Anthropic API key not found. Please set ANTHROPIC_API_KEY in your environment."
-    client = anthropic.Anthropic(api_key=api_key)
-    prompt = (
-        "You are an expert in educational assessment and Bloom's Taxonomy. "
+def score_frame(df: "pd.DataFrame", column: str = "objective") -> "pd.DataFrame":
+    """Evaluate a whole column of learning objectives against the rubric criteria.
+    
+    Applies the same rules as evaluate_objective_rubric using vectorized string
+    operations, which is much faster than scoring objectives one at a time.
+    The text is scored as Python strings, so lowercasing and verb word
+    boundaries follow Python's re module exactly like the per-objective
+    rules, whatever string backend the column uses.
+    
+    Args:
+        df: DataFrame containing the objectives
+        column: Name of the column holding the objective text
+        
+    Returns:
+        DataFrame with the same index as df, one integer column per rubric
+        criterion and an "Average" column
+    """
+    import numpy as np
+    import pandas as pd
+    
+    # Arrow-backed strings (pandas 3's default str dtype) use RE2, whose \b
+    # differs from Python's next to non-ASCII letters
+    text = df[column].fillna("").astype(str).astype(object)
+    lower = text.str.lower()
+    
+    measurable_pattern = "|".join(re.escape(word) for word in MEASURABLE_WORDS)
+    
+    specific = text.str.len().to_numpy() > SPECIFIC_MIN_LENGTH
+    measurable = lower.str.contains(measurable_pattern).to_numpy(dtype=bool)
+    # Any matched action verb means a Bloom's level is detected
+    action_oriented = lower.str.contains(current_data().taxonomy.verb_pattern.pattern).to_numpy(dtype=bool)
+    time_bound = lower.str.contains(TIME_BOUND_PHRASE, regex=False).to_numpy(dtype=bool)
+    
+    rows = len(df)
+    scores = pd.DataFrame(
+        {
+            "Specific": np.where(specific, 3, 2),
+            "Measurable": np.where(measurable, 4, 2),
+            "Action-oriented": np.where(action_oriented, 4, 2),
+            "Realistic": np.full(rows, 3),
+            "Time-bound": np.where(time_bound, 4, 2),
+            "Aligned": np.full(rows, 3),
+        },
+        index=df.index,
+        columns=list(RUBRIC_CRITERIA),
+    )
+    scores["Average"] = scores.to_numpy().mean(axis=1)
+    
+    return scores
+
+
+# Bump whenever the analysis prompt changes so cached responses are not reused
+ANALYSIS_PROMPT_VERSION = f"2.{SYSTEM_PROMPT_VERSION}"
+
+
+def _analysis_prompt(objective: str) -> str:
+    """Build the per-objective part of the analysis prompt; the rest is in the system prompt."""
+    return (
         "Analyze the following learning objective for strengths, weaknesses, and Bloom's level. "
         "Provide suggestions for improvement and a rubric-based score (1-5) for Specific, Measurable, Action-oriented, Realistic, Time-bound, and Aligned. "
         "Respond in markdown with clear sections for Strengths, Suggestions, Detected Bloom's Level, and Rubric Evaluation.\n\n"
         f"Learning Objective: {objective}"
     )
+
+
+def analysis_request(objective: str) -> Dict[str, Any]:
+    """Build the Messages API parameters used to analyze a single objective."""
+    return {
+        "model": CLAUDE_MODEL,
+        "max_tokens": 1024,
+        "temperature": 0.2,
+        "system": system_blocks(),
+        "messages": [{"role": "user", "content": _analysis_prompt(objective)}],
+    }
+
+
+def analysis_cache_key(objective: str, request: Dict[str, Any]) -> str:
+    """Build the response cache key for an analysis request."""
+    return cache_key(
+        "analysis",
+        prompt_version(ANALYSIS_PROMPT_VERSION, request),
+        objective,
+        request["model"],
+        request["temperature"],
+        request["max_tokens"],
+    )
+
+
+def analyze_objective_with_anthropic(objective: str) -> str:
+    """Use Anthropic's Claude API to analyze a learning objective.
+    
+    Successful responses are cached, so re-analyzing the same objective (up to
+    case and whitespace) does not make another API call.
+    """
+    from uoes_learning_objectives.anthropic_client import (
+        create_message,
+        get_anthropic_client,
+        message_text,
+    )
+    
+    request = analysis_request(objective)
+    key = analysis_cache_key(objective, request)
+    cache = get_response_cache()
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    
+    client = get_anthropic_client()
+    if client is None:
+        return "Anthropic API key not found. Please set ANTHROPIC_API_KEY in your environment."
     try:
-        response = client.messages.create(
-            model="claude-3-haiku-20240307",  # or another available model
-            max_tokens=1024,
-            temperature=0.2,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return response.content[0].text if hasattr(response, 'content') else str(response)
+        response = create_message(client, request, "analysis")
+        result = message_text(response)
     except Exception as e:
         return f"Error communicating with Anthropic API: {e}"
+    
+    cache.set(key, result)
+    return result
 
 
+def stream_objective_analysis(objective: str) -> Iterator[str]:
+    """Stream Claude's analysis of a learning objective as it is generated.
+    
+    Cached analyses are yielded in one piece. A fresh analysis is cached only
+    once the stream completes, so cancelled streams are never cached.
+    
+    Args:
+        objective: The learning objective text
+        
+    Returns:
+        An iterator of markdown fragments, suitable for st.write_stream
+    """
+    from uoes_learning_objectives.anthropic_client import (
+        get_anthropic_client,
+        stream_message_text,
+    )
+    
+    request = analysis_request(objective)
+    key = analysis_cache_key(objective, request)
+    cache = get_response_cache()
+    cached = cache.get(key)
+    if cached is not None:
+        yield cached
+        return
+    
+    client = get_anthropic_client()
+    if client is None:
+        yield "Anthropic API key not found. Please set ANTHROPIC_API_KEY in your environment."
+        return
+    
+    chunks = []
+    try:
+        for text in stream_message_text(client, request, "analysis"):
+            chunks.append(text)
+            yield text
+    except Exception as e:
+        yield f"\n\nError communicating with Anthropic API: {e}"
+        return
+    
+    cache.set(key, "".join(chunks))
+
+
+def analyze_objectives_with_anthropic(
+    objectives: List[str],
+    max_concurrency: int = 8,
+    requests_per_second: float = 4.0,
+    timeout: float = 60.0,
+    base_url: Optional[str] = None,
+) -> List[str]:
+    """Use Anthropic's Claude API to analyze many learning objectives concurrently.
+    
+    Args:
+        objectives: The learning objective texts
+        max_concurrency: Maximum number of requests in flight at once
+        requests_per_second: Sustained request rate
+        timeout: Seconds allowed for each request attempt
+        base_url: Optional API base URL, e.g. a local stub server in tests
+        
+    Returns:
+        One markdown analysis (or error message) per objective, in input order
+    """
+    cache = get_response_cache()
+    requests = [analysis_request(o) for o in objectives]
+    keys = [analysis_cache_key(o, r) for o, r in zip(objectives, requests)]
+    results: List[Optional[str]] = [cache.get(key) for key in keys]
+    # Only objectives missing from the cache are sent to the API
+    missing = [i for i, result in enumerate(results) if result is None]
+    if not missing:
+        return [result for result in results if result is not None]
+    
+    api_key = get_api_key()
+    if not api_key:
+        return ["Anthropic API key not found. Please set ANTHROPIC_API_KEY in your environment."] * len(objectives)
+    
+    import anthropic
+    
+    from uoes_learning_objectives.anthropic_client import ConcurrentClaudeClient, message_text
+    
+    async def run() -> List[Any]:
+        async with anthropic.AsyncAnthropic(
+            api_key=api_key, base_url=base_url, max_retries=0
+        ) as client:
+            runner = ConcurrentClaudeClient(
+                client,
+                max_concurrency=max_concurrency,
+                requests_per_second=requests_per_second,
+                timeout=timeout,
+            )
+            return await runner.create_many(requests[i] for i in missing)
+    
+    for i, response in zip(missing, asyncio.run(run())):
+        if isinstance(response, BaseException):
+            results[i] = f"Error communicating with Anthropic API: {response!r}"
+        else:
+            results[i] = message_text(response)
+            cache.set(keys[i], results[i])
+    
+    return [result or "" for result in results]
+
+
+def _cancel_claude_analysis() -> None:
+    """Remember that the user cancelled the in-flight Claude analysis."""
+    st.session_state["claude_analysis_cancelled"] = True
+
+
+@metrics.timed("uoes_objective_analyzer_seconds")
 def objective_analyzer() -> None:
     """Create an interface for analyzing and improving learning objectives."""
     st.header("Learning Objective Analyzer")
@@ -166,70 +569,123 @@ def objective_analyzer() -> None:
         placeholder="e.g., By the end of this course, students will be able to implement sorting algorithms."
     )
     
+    live = st.toggle("Live analysis", help="Update the analysis whenever the text changes")
     use_claude = st.checkbox("Use Anthropic Claude AI for analysis (requires API key)")
     
-    if user_objective and st.button("Analyze Objective"):
+    if st.session_state.pop("claude_analysis_cancelled", False):
+        st.info("Claude analysis cancelled.")
+    
+    if live and not use_claude:
+        _display_live_analysis(user_objective)
+    elif user_objective and st.button("Analyze Objective"):
         if use_claude:
             st.subheader("Anthropic Claude Analysis")
-            with st.spinner("Contacting Anthropic Claude..."):
-                result = analyze_objective_with_anthropic(user_objective)
-            st.markdown(result)
+            # Clicking Cancel reruns the script, which stops the stream below
+            st.button("Cancel", key="cancel_claude_analysis", on_click=_cancel_claude_analysis)
+            st.write_stream(stream_objective_analysis(user_objective))
         else:
-            st.subheader("Analysis Results")
-            
-            # Basic analysis
-            strengths, suggestions = basic_objective_analysis(user_objective)
-            
-            # Display strengths
-            if strengths:
-                st.success("Strengths")
-                for strength in strengths:
-                    st.markdown(f"✅ {strength}")
-            
-            # Display suggestions
-            if suggestions:
-                st.warning("Suggestions for Improvement")
-                for suggestion in suggestions:
-                    st.markdown(f"🔍 {suggestion}")
-            
-            # Bloom's level
-            level = identify_blooms_level(user_objective)
-            if level:
-                st.info(f"Detected Bloom's Taxonomy Level: **{level}**")
-                
-                st.write(f"Other verbs at this level you might consider:")
-                other_verbs = ACTION_VERBS[level].split(", ")
-                cols = st.columns(4)
-                for i, verb in enumerate(other_verbs[:8]):  # Show first 8 verbs
-                    cols[i % 4].markdown(f"- {verb}")
-            else:
-                st.warning("No clear Bloom's Taxonomy level detected. Consider using specific action verbs.")
-                
-            # Rubric evaluation
-            st.subheader("Rubric Evaluation")
-            st.write("Preliminary scoring based on the rubric:")
-            
-            scores = evaluate_objective_rubric(user_objective)
-            
-            # Display scores as a bar chart
-            chart_data = {
-                "Criteria": list(scores.keys()),
-                "Score": list(scores.values())
-            }
-            
-            st.bar_chart(chart_data, x="Criteria")
-            
-            # Overall assessment
-            avg_score = sum(scores.values()) / len(scores)
-            if avg_score >= 4:
-                st.success(f"Overall Assessment: Strong objective ({avg_score:.1f}/5)")
-            elif avg_score >= 3:
-                st.info(f"Overall Assessment: Good objective, with room for improvement ({avg_score:.1f}/5)")
-            else:
-                st.warning(f"Overall Assessment: Needs improvement ({avg_score:.1f}/5)")
-                
-            # Note about the analysis
-            st.caption("""
-            Note: This analysis is based on basic patterns and heuristics. 
-            It's meant to provide guidance but cannot replace human judgment.
-            """)
\ No newline at end of file
+            _display_heuristic_analysis(cached_analysis(normalize_objective(user_objective)))
+
+
+def cached_analysis(objective: str) -> AnalysisResult:
+    """analyze(), cached across reruns and sessions.
+    
+    A plain LRU cache rather than st.cache_data: results are immutable (tuples
+    and a read-only score mapping), so they can be shared without copying, and this module is also used outside
+    Streamlit by the batch analyzer. Entries are keyed by the compiled
+    taxonomy too, so a reloaded data file is picked up straight away.
+    
+    Args:
+        objective: The normalized learning objective text
+        
+    Returns:
+        The complete analysis
+    """
+    return _cached_analysis(objective, current_data().taxonomy)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_analysis(objective: str, taxonomy: Taxonomy) -> AnalysisResult:
+    """analyze() with one set of verb tables, memoized."""
+    return analyze(objective, taxonomy)
+
+
+def _display_live_analysis(text: str) -> None:
+    """Show the heuristic analysis of text, re-scoring only what changed since the last run."""
+    # Imported here because live_analysis builds on this module
+    from uoes_learning_objectives.live_analysis import live_analysis
+    
+    previous = st.session_state.get("live_analysis")
+    result = live_analysis(text, previous)
+    st.session_state["live_analysis"] = result
+    if result.objective:
+        _display_heuristic_analysis(result)
+
+
+def _display_heuristic_analysis(result: AnalysisResult) -> None:
+    """Render the strengths, suggestions, Bloom's level and rubric scores of an objective."""
+    st.subheader("Analysis Results")
+    
+    # Display strengths
+    if result.strengths:
+        st.success("Strengths")
+        for strength in result.strengths:
+            st.markdown(f"✅ {strength}")
+    
+    # Display suggestions
+    if result.suggestions:
+        st.warning("Suggestions for Improvement")
+        for suggestion in result.suggestions:
+            st.markdown(f"🔍 {suggestion}")
+    
+    # Bloom's level
+    if result.level:
+        st.info(f"Detected Bloom's Taxonomy Level: **{result.level}**")
+    
+        st.write(f"Other verbs at this level you might consider:")
+        cols = st.columns(4)
+        for i, verb in enumerate(current_data().taxonomy.verbs[result.level][:8]):  # Show first 8 verbs
+            cols[i % 4].markdown(f"- {verb}")
+    else:
+        st.warning("No clear Bloom's Taxonomy level detected. Consider using specific action verbs.")
+    
+    # Rubric evaluation
+    st.subheader("Rubric Evaluation")
+    st.write("Preliminary scoring based on the rubric:")
+    
+    # Display scores as a bar chart
+    chart_data = {
+        "Criteria": list(result.scores.keys()),
+        "Score": list(result.scores.values())
+    }
+    
+    st.bar_chart(chart_data, x="Criteria")
+    
+    # Overall assessment
+    avg_score = result.average_score
+    if avg_score >= 4:
+        st.success(f"Overall Assessment: Strong objective ({avg_score:.1f}/5)")
+    elif avg_score >= 3:
+        st.info(f"Overall Assessment: Good objective, with room for improvement ({avg_score:.1f}/5)")
+    else:
+        st.warning(f"Overall Assessment: Needs improvement ({avg_score:.1f}/5)")
+    
+    _display_similar_samples(result)
+    
+    # Note about the analysis
+    st.caption("""
+    Note: This analysis is based on basic patterns and heuristics. 
+    It's meant to provide guidance but cannot replace human judgment.
+    """)
+
+
+def _display_similar_samples(result: AnalysisResult) -> None:
+    """List the exemplar objectives closest to an analyzed one, at its Bloom's level if detected."""
+    # The store needs numpy, which the app does not load at start-up
+    from uoes_learning_objectives.exemplar_store import default_store
+    
+    exemplars = default_store().search(result.objective, k=3, level=result.level)
+    if exemplars:
+        with st.expander("Similar sample objectives"):
+            for exemplar in exemplars:
+                st.markdown(f"- **{exemplar.discipline}, {exemplar.level}**: {exemplar.objective}")
@@ -1,57 +1,72 @@
 """Learning Objective Creator Page."""
 
 import streamlit as st
-from uoes_learning_objectives.blooms_taxonomy import ACTION_VERBS
+import functools
+import json
 import random
-import os
-import anthropic
-from dotenv import load_dotenv
-load_dotenv()
-
-COURSE_LEVELS = [
-    "100-level (introductory)",
-    "200-level (foundation)",
-    "300-level (intermediate)",
-    "400-level (advanced)",
-    "Graduate"
-]
 
-LEVEL_SUGGESTIONS = {
-    "100-level (introductory)": "Focus on Remember, Understand",
-    "200-level (foundation)": "Focus on Understand, Apply",
-    "300-level (intermediate)": "Focus on Apply, Analyze",
-    "400-level (advanced)": "Focus on Analyze, Evaluate",
-    "Graduate": "Focus on Evaluate, Create"
-}
+from uoes_learning_objectives import metrics
+from uoes_learning_objectives.config import CLAUDE_MODEL
+from uoes_learning_objectives.prompts import SYSTEM_PROMPT_VERSION, prompt_version, system_blocks
+from uoes_learning_objectives.response_cache import (
+    cache_key,
+    get_response_cache,
+    normalize_text,
+)
+from uoes_learning_objectives.taxonomy_data import current_data
 
+# Course levels and the Bloom's levels suggested for each, as loaded from the
+# taxonomy data file at import; the page itself reads current_data()
 LEVEL_TO_BLOOMS = {
-    "100-level (introductory)": ["Remember", "Understand"],
-    "200-level (foundation)": ["Understand", "Apply"],
-    "300-level (intermediate)": ["Apply", "Analyze"],
-    "400-level (advanced)": ["Analyze", "Evaluate"],
-    "Graduate": ["Evaluate", "Create"],
+    course_level: list(levels)
+    for course_level, levels in current_data().level_to_blooms.items()
+}
+
+COURSE_LEVELS = list(LEVEL_TO_BLOOMS)
+
+LEVEL_SUGGESTIONS = {
+    course_level: f"Focus on {', '.join(levels)}"
+    for course_level, levels in LEVEL_TO_BLOOMS.items()
 }
 
 def generate_objectives(course_level, key_topics, subject_area):
-    blooms_levels = LEVEL_TO_BLOOMS[course_level]
+    data = current_data()
+    blooms_levels = data.level_to_blooms[course_level]
     topics = [t.strip() for t in key_topics.split(",") if t.strip()]
     objectives = []
     for topic in topics:
         for level in blooms_levels:
-            verbs = ACTION_VERBS[level].split(", ")
-            verb = random.choice(verbs)
+            verb = random.choice(data.taxonomy.verbs[level])
             objectives.append(
                 f"By the end of this course, students will be able to {verb} {topic}."
             )
     return objectives
 
-def get_anthropic_objectives(course_level, key_topics, subject_area):
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        return ["Anthropic API key not found. Please set ANTHROPIC_API_KEY in your environment."]
-    client = anthropic.Anthropic(api_key=api_key)
+def session_objectives(course_level, key_topics, subject_area):
+    # Reruns reuse this session's objectives until the normalized inputs change
+    # or Generate Objectives is clicked again, which draws new verbs
+    topics = tuple(" ".join(t.split()) for t in key_topics.split(",") if t.strip())
+    generation = st.session_state.get("objectives_generation", 0)
+    key = (course_level, topics, " ".join(subject_area.split()), generation)
+    cached = st.session_state.get("generated_objectives")
+    if cached is None or cached[0] != key:
+        cached = (key, generate_objectives(course_level, key_topics, subject_area))
+        st.session_state["generated_objectives"] = cached
+    return cached[1]
+
+def level_verb_lists(course_level, data=None):
+    return _level_verb_lists(course_level, data or current_data())
+
+# Keyed by the data snapshot so a reloaded data file shows up on the next rerun
+@functools.lru_cache(maxsize=64)
+def _level_verb_lists(course_level, data):
+    return [(level, data.action_verbs[level]) for level in data.level_to_blooms[course_level]]
+
+# Bump whenever the objectives prompt changes so cached responses are not reused
+OBJECTIVES_PROMPT_VERSION = f"2.{SYSTEM_PROMPT_VERSION}"
+
+def _objectives_request(course_level, key_topics, subject_area):
     prompt = (
-        f"You are an expert in educational assessment and Bloom's Taxonomy. "
         f"Given the following course information, expand on each key topic or takeaway by suggesting 1-2 detailed learning objectives for each, using appropriate Bloom's action verbs for the course level. "
         f"Format each objective as: 'By the end of this course, students will be able to [action verb] [expanded topic/skill].'\n"
         f"Subject Area: {subject_area}\n"
@@ -59,17 +74,90 @@ def get_anthropic_objectives(course_level, key_topics, subject_area):
         f"Key Topics: {key_topics}\n"
         f"Respond with a markdown bullet list grouped by topic, with 1-2 objectives per topic."
     )
+    return {
+        "model": CLAUDE_MODEL,
+        "max_tokens": 512,
+        "temperature": 0.2,
+        "system": system_blocks(),
+        "messages": [{"role": "user", "content": prompt}],
+    }
+
+def _objectives_cache_key(course_level, key_topics, subject_area, request):
+    return cache_key(
+        "objectives",
+        prompt_version(OBJECTIVES_PROMPT_VERSION, request),
+        json.dumps([normalize_text(f) for f in (course_level, subject_area, key_topics)]),
+        request["model"],
+        request["temperature"],
+        request["max_tokens"],
+    )
+
+def get_anthropic_objectives(course_level, key_topics, subject_area):
+    # Imported on first use so the page loads without the Anthropic SDK
+    from uoes_learning_objectives.anthropic_client import (
+        create_message,
+        get_anthropic_client,
+        message_text,
+    )
+
+    request = _objectives_request(course_level, key_topics, subject_area)
+    key = _objectives_cache_key(course_level, key_topics, subject_area, request)
+    cache = get_response_cache()
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    client = get_anthropic_client()
+    if client is None:
+        return ["Anthropic API key not found. Please set ANTHROPIC_API_KEY in your environment."]
     try:
-        response = client.messages.create(
-            model="claude-3-haiku-20240307",
-            max_tokens=512,
-            temperature=0.2,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        return response.content[0].text.split("\n") if hasattr(response, 'content') else [str(response)]
+        response = create_message(client, request, "objectives")
+        lines = message_text(response).split("\n")
     except Exception as e:
         return [f"Error communicating with Anthropic API: {e}"]
+    cache.set(key, lines)
+    return lines
+
+def stream_anthropic_objectives(course_level, key_topics, subject_area):
+    """Stream Claude's suggested objectives as markdown while they are generated.
+
+    Shares the cache with get_anthropic_objectives; a response is cached only
+    once the stream completes.
+    """
+    from uoes_learning_objectives.anthropic_client import (
+        get_anthropic_client,
+        stream_message_text,
+    )
+
+    request = _objectives_request(course_level, key_topics, subject_area)
+    key = _objectives_cache_key(course_level, key_topics, subject_area, request)
+    cache = get_response_cache()
+    cached = cache.get(key)
+    if cached is not None:
+        yield "\n".join(cached)
+        return
 
+    client = get_anthropic_client()
+    if client is None:
+        yield "Anthropic API key not found. Please set ANTHROPIC_API_KEY in your environment."
+        return
+    chunks = []
+    try:
+        for text in stream_message_text(client, request, "objectives"):
+            chunks.append(text)
+            yield text
+    except Exception as e:
+        yield f"\n\nError communicating with Anthropic API: {e}"
+        return
+    cache.set(key, "".join(chunks).split("\n"))
+
+def _cancel_claude_objectives():
+    st.session_state["claude_objectives_cancelled"] = True
+
+def _next_objectives_generation():
+    st.session_state["objectives_generation"] = st.session_state.get("objectives_generation", 0) + 1
+
+@metrics.timed("uoes_objective_creator_seconds")
 def objective_creator():
     st.header("Learning Objective Creator")
     st.write("""
@@ -88,20 +176,20 @@ def objective_creator():
 - **Aligned**: Supports program-level and institutional learning outcomes
         """)
 
+    data = current_data()
+
     # First row: Course Level (left), Subject Area (right)
     row1_col1, row1_col2 = st.columns(2)
     with row1_col1:
-        course_level = st.selectbox("Course Level", COURSE_LEVELS, key="course_level")
+        course_level = st.selectbox("Course Level", list(data.level_to_blooms), key="course_level")
     with row1_col2:
         subject_area = st.text_input("Subject Area", key="subject_area", placeholder="e.g., Biology")
 
     # Suggested Bloom's Taxonomy focus and verbs below course level
     if course_level:
-        st.info(f"Suggested Bloom's Taxonomy focus: {LEVEL_SUGGESTIONS[course_level]}")
-        blooms_levels = LEVEL_TO_BLOOMS[course_level]
-        for level in blooms_levels:
-            verbs = ACTION_VERBS[level].split(", ")
-            st.markdown(f"**{level}**: {', '.join(verbs)}")
+        st.info(f"Suggested Bloom's Taxonomy focus: Focus on {', '.join(data.level_to_blooms[course_level])}")
+        for level, verbs in level_verb_lists(course_level, data):
+            st.markdown(f"**{level}**: {verbs}")
 
     # Second row: Key Topics (full width)
     key_topics = st.text_area(
@@ -111,19 +199,20 @@ def objective_creator():
     )
 
     use_claude = st.checkbox("Suggest additional objectives with Anthropic Claude AI (requires API key)")
-    generate = st.button("Generate Objectives")
+    generate = st.button("Generate Objectives", on_click=_next_objectives_generation)
+
+    if st.session_state.pop("claude_objectives_cancelled", False):
+        st.info("Claude suggestions cancelled.")
 
     if generate:
         st.success("Course information submitted!")
         st.subheader("Suggested Learning Objectives")
-        objectives = generate_objectives(course_level, key_topics, subject_area)
+        objectives = session_objectives(course_level, key_topics, subject_area)
         for obj in objectives:
             st.markdown(f"- {obj}")
         if use_claude:
             st.markdown("---")
             st.subheader("Anthropic Claude AI Suggestions")
-            with st.spinner("Contacting Anthropic Claude..."):
-                ai_objectives = get_anthropic_objectives(course_level, key_topics, subject_area)
-            for line in ai_objectives:
-                if line.strip():
-                    st.markdown(line)
+            # Clicking Cancel reruns the script, which stops the stream below
+            st.button("Cancel", key="cancel_claude_objectives", on_click=_cancel_claude_objectives)
+            st.write_stream(stream_anthropic_objectives(course_level, key_topics, subject_area))
@@ -0,0 +1,104 @@
+"""Shared system prompt for every Claude request, written to be prompt-cached."""
+
+import functools
+import hashlib
+from typing import Any, Dict, List, Optional
+
+from uoes_learning_objectives.taxonomy_data import TaxonomyData, current_data
+
+# Bump whenever the system prompt changes; it is part of every prompt version
+SYSTEM_PROMPT_VERSION = "3"
+
+SYSTEM_INSTRUCTIONS = (
+    "You are an expert in educational assessment and Bloom's Taxonomy who helps "
+    "instructors write and improve course learning objectives. Use the reference "
+    "material below for Bloom's levels, action verbs and the rubric. An effective "
+    "objective starts with 'By the end of this course, students will be able to', uses "
+    "one observable action verb at the intended Bloom's level, names a specific, "
+    "assessable skill and is realistic for the course level."
+)
+
+# Smallest prompt prefix, in tokens, that claude-3-haiku (config.CLAUDE_MODEL)
+# caches; shorter prefixes are processed at full price on every request
+# despite the cache_control breakpoint. Sonnet and Opus models need 1024.
+MIN_CACHEABLE_TOKENS = 2048
+
+# Average characters per token of English text, for estimating prompt length
+CHARS_PER_TOKEN = 4
+
+
+def system_prompt(data: Optional[TaxonomyData] = None) -> str:
+    """Return the system prompt: instructions followed by the taxonomy reference tables.
+
+    The text is identical for every request until the taxonomy data file is
+    reloaded, so it forms a stable prefix that the API can cache.
+
+    Args:
+        data: Taxonomy data snapshot, defaults to the current one
+    """
+    return _render_system_prompt(data or current_data())
+
+
+@functools.lru_cache(maxsize=1)
+def _render_system_prompt(data: TaxonomyData) -> str:
+    """Build the system prompt from one snapshot, once per snapshot."""
+    sections = [SYSTEM_INSTRUCTIONS, "## Bloom's Taxonomy levels, lowest to highest"]
+    sections.extend(
+        f"- {level}: {description}. Action verbs: {data.action_verbs[level]}"
+        for level, description in data.cognitive_levels.items()
+    )
+    sections.append("## Rubric criteria, each scored from 1 (poor) to 5 (excellent)")
+    sections.extend(f"- {criterion}: {text}" for criterion, text in data.rubric_criteria.items())
+    sections.append(
+        "Scores: 1 does not meet the criterion, 2 partially meets it, 3 meets the basic "
+        "expectation, 4 exceeds it, 5 is exemplary. A strong objective scores at least 4 "
+        "in most criteria."
+    )
+    return "\n".join(sections)
+
+
+def system_blocks(data: Optional[TaxonomyData] = None) -> List[Dict[str, Any]]:
+    """Return the system prompt as content blocks with a prompt-caching breakpoint.
+
+    The breakpoint covers any tool definitions and the system prompt, so only
+    the per-request user message is processed at full price on a cache hit.
+    The API ignores the breakpoint for prefixes shorter than
+    MIN_CACHEABLE_TOKENS. The prompt holds only the instructions and the
+    reference tables (about 500 tokens with the bundled data) and is not
+    padded to reach the minimum, so with claude-3-haiku caching stays
+    inactive: padding would cost more per call than it saves. The logged
+    cache_read and cache_write counts show when caching does take effect.
+
+    Args:
+        data: Taxonomy data snapshot, defaults to the current one
+    """
+    return [
+        {"type": "text", "text": system_prompt(data), "cache_control": {"type": "ephemeral"}}
+    ]
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the number of tokens in English text."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def prompt_version(template_version: str, request: Dict[str, Any]) -> str:
+    """Combine a template version with the system prompt a request was built with.
+
+    The system prompt embeds the taxonomy data, so response cache keys built
+    from this version stop matching once the data file is edited.
+
+    Args:
+        template_version: Version of the per-request prompt template
+        request: Messages API parameters whose "system" came from system_blocks
+
+    Returns:
+        The version string to pass to response_cache.cache_key
+    """
+    return f"{template_version}.{_digest(request['system'][0]['text'])}"
+
+
+@functools.lru_cache(maxsize=4)
+def _digest(text: str) -> str:
+    """Short SHA-256 digest of a system prompt."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
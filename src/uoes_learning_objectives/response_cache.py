@@ -0,0 +1,243 @@
+"""Persistent cache for Claude responses keyed by a hash of the request."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from uoes_learning_objectives import metrics
+
+# Default on-disk location, overridable with the UOES_CACHE_PATH environment variable
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "uoes_learning_objectives" / "claude.sqlite3"
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60
+DEFAULT_MEMORY_ENTRIES = 512
+DEFAULT_DISK_ENTRIES = 50_000
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so trivially different inputs share a cache entry.
+
+    Args:
+        text: Free text such as a learning objective
+
+    Returns:
+        The text case-folded with runs of whitespace collapsed to single spaces
+    """
+    return " ".join(text.casefold().split())
+
+
+def cache_key(
+    template: str,
+    template_version: str,
+    text: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    """Build a content-addressed cache key for a Claude request.
+
+    Args:
+        template: Name of the prompt template, e.g. "analysis"
+        template_version: Version of that template; bump it when the prompt changes
+        text: The variable input substituted into the template
+        model: Model name
+        temperature: Sampling temperature
+        max_tokens: Maximum tokens in the response
+
+    Returns:
+        A SHA-256 hex digest identifying the request
+    """
+    payload = json.dumps(
+        [template, template_version, normalize_text(text), model, temperature, max_tokens]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Two-tier cache: an in-memory LRU in front of a SQLite database.
+
+    Values are any JSON-serializable objects. Entries expire `ttl` seconds after
+    they were stored, and the disk tier evicts least recently used entries once
+    it holds more than `max_disk_entries`.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        max_disk_entries: int = DEFAULT_DISK_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Open (or create) the cache.
+
+        Args:
+            path: SQLite file for the disk tier; None keeps the cache in memory only
+            ttl: Seconds an entry stays valid
+            max_memory_entries: Capacity of the in-memory LRU tier
+            max_disk_entries: Capacity of the disk tier
+            clock: Function returning the current time in seconds
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        self._db: Optional[sqlite3.Connection] = None
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss or expired entry."""
+        now = self._clock()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._memory.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return entry[1]
+            self._memory.pop(key, None)
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, created FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    if now - row[1] < self.ttl:
+                        self._db.execute(
+                            "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+                        )
+                        self._db.commit()
+                        value = json.loads(row[0])
+                        self._remember(key, row[1], value)
+                        self._counters["disk_hits"] += 1
+                        return value
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._db.commit()
+
+            self._counters["misses"] += 1
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key."""
+        now = self._clock()
+        with self._lock:
+            self._remember(key, now, value)
+            if self._db is None:
+                return
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), now, now),
+            )
+            self._evict_disk(now)
+            self._db.commit()
+
+    def _remember(self, key: str, created: float, value: Any) -> None:
+        """Insert into the memory tier, evicting the least recently used entry."""
+        self._memory[key] = (created, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self, now: float) -> None:
+        """Drop expired entries and trim the disk tier to its size limit."""
+        assert self._db is not None
+        cursor = self._db.execute(
+            "DELETE FROM responses WHERE created <= ?", (now - self.ttl,)
+        )
+        evicted = cursor.rowcount
+        (count,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+        if count > self.max_disk_entries:
+            cursor = self._db.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed LIMIT ?)",
+                (count - self.max_disk_entries,),
+            )
+            evicted += cursor.rowcount
+        self._counters["evictions"] += evicted
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit, miss and eviction counters plus the current tier sizes."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["memory_entries"] = len(self._memory)
+            stats["disk_entries"] = (
+                self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+                if self._db is not None
+                else 0
+            )
+        return stats
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache, creating it on first use.
+
+    The disk tier lives at UOES_CACHE_PATH if set, otherwise DEFAULT_CACHE_PATH.
+    Setting UOES_CACHE_PATH to an empty string keeps the cache in memory only.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            location = os.getenv("UOES_CACHE_PATH")
+            if location is None:
+                path: Optional[Path] = DEFAULT_CACHE_PATH
+            else:
+                path = Path(location) if location else None
+            _cache = ResponseCache(path)
+        return _cache
+
+
+def set_response_cache(cache: Optional[ResponseCache]) -> None:
+    """Replace the process-wide response cache; None recreates it on next use."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def _cache_stats() -> Dict[str, int]:
+    """Stats of the current process-wide cache, exported as metrics gauges."""
+    cache = _cache
+    return cache.stats() if cache is not None else {}
+
+
+metrics.register_collector("uoes_response_cache", _cache_stats)
@@ -0,0 +1,341 @@
+"""Headless HTTP/JSON analysis service, independent of the Streamlit UI.
+
+A plain ASGI application, so it runs under any ASGI server without a web
+framework. Endpoints:
+
+- GET /levels: Bloom's levels with descriptions, verbs and examples, the
+  rubric criteria and the course level mapping
+- POST /analyze: {"objective": "..."} -> heuristic analysis; add
+  "claude": true for a structured Claude review as well
+- POST /analyze/batch: {"objectives": [...]} -> one JSON analysis per line
+  (NDJSON), streamed while the batch is scored
+- POST /generate: {"course_level", "key_topics", "subject_area"} -> draft
+  objectives; add "claude": true for Claude's suggestions as well
+
+Run it with `uoes-serve --workers 4` (needs uvicorn), or point any ASGI
+server at `uoes_learning_objectives.service:app`. Workers share nothing, so
+they scale across cores.
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import socket
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from uoes_learning_objectives import metrics
+from uoes_learning_objectives.objective_analyzer import analyze, cached_analysis, normalize_objective
+from uoes_learning_objectives.objective_creator import generate_objectives
+from uoes_learning_objectives.taxonomy_data import TaxonomyData, current_data, get_taxonomy_store
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+
+# Largest request body accepted, in bytes
+MAX_BODY_BYTES = 8 * 1024 * 1024
+
+# Most objectives accepted in one /analyze/batch request
+MAX_BATCH_OBJECTIVES = 10_000
+
+# Batch results are sent in chunks of this many lines; other requests are
+# served between chunks
+BATCH_CHUNK_SIZE = 200
+
+JSON_TYPE = b"application/json"
+NDJSON_TYPE = b"application/x-ndjson"
+
+
+class HTTPError(Exception):
+    """An error reported to the client as {"error": message} with an HTTP status."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _encode(payload: Any) -> bytes:
+    """Serialize payload as compact JSON."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+async def _send_response(send: Send, status: int, body: bytes, content_type: bytes = JSON_TYPE) -> None:
+    """Send a complete response."""
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", content_type),
+            (b"content-length", str(len(body)).encode("ascii")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _read_json(receive: Receive) -> Dict[str, Any]:
+    """Read the request body and parse it as a JSON object.
+
+    Raises:
+        HTTPError: 413 if the body is larger than MAX_BODY_BYTES, 400 if it is not a JSON object
+    """
+    chunks: List[bytes] = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise HTTPError(400, "Client disconnected")
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            raise HTTPError(413, f"Request body is larger than {MAX_BODY_BYTES} bytes")
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            break
+    try:
+        body = json.loads(b"".join(chunks))
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise HTTPError(400, f"Request body is not valid JSON: {e}") from e
+    if not isinstance(body, dict):
+        raise HTTPError(400, "Request body must be a JSON object")
+    return body
+
+
+def _text(body: Dict[str, Any], field: str, default: Optional[str] = None) -> str:
+    """Return a string field of the request body.
+
+    Raises:
+        HTTPError: 400 if the field is missing or not a string
+    """
+    value = body.get(field, default)
+    if not isinstance(value, str):
+        raise HTTPError(400, f'"{field}" must be a string')
+    return value
+
+
+def _flag(body: Dict[str, Any], field: str) -> bool:
+    """Return a boolean field of the request body, False if it is missing.
+
+    Raises:
+        HTTPError: 400 if the field is not a JSON boolean
+    """
+    value = body.get(field, False)
+    if not isinstance(value, bool):
+        raise HTTPError(400, f'"{field}" must be true or false')
+    return value
+
+
+async def _with_claude(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking Claude call in a worker thread.
+
+    Raises:
+        HTTPError: 400 if no API key is set, 502 if the API call fails or
+            Claude's response is invalid
+    """
+    from uoes_learning_objectives.structured_output import MissingAPIKeyError
+
+    try:
+        return await asyncio.to_thread(func, *args)
+    except MissingAPIKeyError as e:
+        raise HTTPError(400, str(e)) from e
+    except ValueError as e:
+        raise HTTPError(502, f"Invalid response from Anthropic API: {e}") from e
+    except Exception as e:
+        raise HTTPError(502, f"Error communicating with Anthropic API: {e}") from e
+
+
+@functools.lru_cache(maxsize=1)
+def _levels_body(data: TaxonomyData) -> bytes:
+    """The /levels response for one taxonomy data snapshot, encoded once."""
+    return _encode({
+        "version": data.version,
+        "levels": [
+            {
+                "name": level,
+                "description": data.cognitive_levels[level],
+                "verbs": list(data.taxonomy.verbs[level]),
+                "example": data.example_objectives[level],
+            }
+            for level in data.taxonomy.levels
+        ],
+        "rubric_criteria": dict(data.rubric_criteria),
+        "course_levels": {course: list(levels) for course, levels in data.level_to_blooms.items()},
+    })
+
+
+async def levels(scope: Scope, receive: Receive, send: Send) -> None:
+    """GET /levels: the taxonomy, rubric criteria and course levels."""
+    await _send_response(send, 200, _levels_body(current_data()))
+
+
+async def analyze_one(scope: Scope, receive: Receive, send: Send) -> None:
+    """POST /analyze: the heuristic analysis of one objective, optionally with a Claude review."""
+    body = await _read_json(receive)
+    objective = normalize_objective(_text(body, "objective"))
+    claude = _flag(body, "claude")
+    result = cached_analysis(objective).to_dict()
+    if claude:
+        from uoes_learning_objectives.structured_output import review_objective
+
+        result["claude"] = (await _with_claude(review_objective, objective)).to_dict()
+    await _send_response(send, 200, _encode(result))
+
+
+def _batch_lines(objectives: Iterable[str]) -> Iterable[bytes]:
+    """Analyze objectives with one taxonomy snapshot, yielding one NDJSON line each."""
+    taxonomy = current_data().taxonomy
+    for index, objective in enumerate(objectives):
+        result = analyze(normalize_objective(objective), taxonomy).to_dict()
+        yield _encode({"index": index, **result}) + b"\n"
+
+
+async def analyze_batch(scope: Scope, receive: Receive, send: Send) -> None:
+    """POST /analyze/batch: stream the analysis of each objective as NDJSON."""
+    body = await _read_json(receive)
+    objectives = body.get("objectives")
+    if not isinstance(objectives, list) or not all(isinstance(o, str) for o in objectives):
+        raise HTTPError(400, '"objectives" must be a list of strings')
+    if len(objectives) > MAX_BATCH_OBJECTIVES:
+        raise HTTPError(400, f"At most {MAX_BATCH_OBJECTIVES} objectives can be analyzed per request")
+
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", NDJSON_TYPE)],
+    })
+    chunk: List[bytes] = []
+    for line in _batch_lines(objectives):
+        chunk.append(line)
+        if len(chunk) == BATCH_CHUNK_SIZE:
+            await send({"type": "http.response.body", "body": b"".join(chunk), "more_body": True})
+            chunk = []
+            # Scoring is CPU-bound; let other requests run between chunks
+            await asyncio.sleep(0)
+    await send({"type": "http.response.body", "body": b"".join(chunk)})
+
+
+async def generate(scope: Scope, receive: Receive, send: Send) -> None:
+    """POST /generate: draft objectives for a course, optionally with Claude's suggestions."""
+    body = await _read_json(receive)
+    course_level = _text(body, "course_level")
+    key_topics = body.get("key_topics")
+    if isinstance(key_topics, list) and all(isinstance(t, str) for t in key_topics):
+        key_topics = ", ".join(key_topics)
+    elif not isinstance(key_topics, str):
+        raise HTTPError(400, '"key_topics" must be a string or a list of strings')
+    subject_area = _text(body, "subject_area", "")
+    claude = _flag(body, "claude")
+    course_levels = current_data().level_to_blooms
+    if course_level not in course_levels:
+        raise HTTPError(400, f'"course_level" must be one of: {", ".join(course_levels)}')
+
+    result: Dict[str, Any] = {
+        "objectives": generate_objectives(course_level, key_topics, subject_area)
+    }
+    if claude:
+        from uoes_learning_objectives.structured_output import suggest_objectives
+
+        suggestions = await _with_claude(suggest_objectives, course_level, key_topics, subject_area)
+        result["claude"] = [suggestion._asdict() for suggestion in suggestions]
+    await _send_response(send, 200, _encode(result))
+
+
+Handler = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# Path -> (method, handler)
+ROUTES: Dict[str, Tuple[str, Handler]] = {
+    "/levels": ("GET", levels),
+    "/analyze": ("POST", analyze_one),
+    "/analyze/batch": ("POST", analyze_batch),
+    "/generate": ("POST", generate),
+}
+
+
+async def _lifespan(receive: Receive, send: Send) -> None:
+    """Apply the metrics settings and watch the taxonomy data file while the server runs."""
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            try:
+                metrics.configure()
+            except OSError:
+                # With several workers only the first can bind UOES_METRICS_PORT
+                pass
+            get_taxonomy_store().start_watcher()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope: Scope, receive: Receive, send: Send) -> None:
+    """The ASGI application."""
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    path = scope["path"].rstrip("/") or "/"
+    route = ROUTES.get(path)
+    if route is None:
+        await _send_response(send, 404, _encode({"error": f"Unknown path {path}"}))
+        return
+    method, handler = route
+    if scope["method"] != method:
+        await _send_response(send, 405, _encode({"error": f"{path} only accepts {method}"}))
+        return
+
+    metrics.increment("uoes_service_requests_total", path=path)
+    with metrics.timer("uoes_service_request_seconds", path=path):
+        try:
+            await handler(scope, receive, send)
+        except HTTPError as e:
+            metrics.increment("uoes_service_errors_total", path=path, status=str(e.status))
+            await _send_response(send, e.status, _encode({"error": e.message}))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point: serve the application with uvicorn."""
+    parser = argparse.ArgumentParser(description="Serve the learning objective analysis API.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Interface to bind (default: {DEFAULT_HOST})")
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default: {DEFAULT_PORT})"
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1)")
+    args = parser.parse_args(argv)
+
+    try:
+        import uvicorn
+        from uvicorn.supervisors import Multiprocess
+
+        # Workers import the application themselves, so it is passed by name
+        config = uvicorn.Config(
+            "uoes_learning_objectives.service:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            access_log=False,
+        )
+        if config.workers > 1:
+            # uvicorn binds the socket shared by the workers with protocol 0, so
+            # asyncio leaves Nagle's algorithm on for the connections it accepts
+            # and each response body waits ~40 ms for a delayed ACK. Accepted
+            # connections inherit TCP_NODELAY from the listening socket.
+            sock = config.bind_socket()
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            Multiprocess(config, sockets=[sock]).run()
+        else:
+            uvicorn.Server(config).run()
+    except (ImportError, OSError) as e:
+        parser.exit(2, f"error: {e}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
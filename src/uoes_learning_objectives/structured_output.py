@@ -0,0 +1,353 @@
+"""Structured (tool-use) Claude responses for objective reviews and suggestions."""
+
+import json
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from uoes_learning_objectives.blooms_taxonomy import RUBRIC_CRITERIA, TAXONOMY
+from uoes_learning_objectives.config import CLAUDE_MODEL
+from uoes_learning_objectives.prompts import SYSTEM_PROMPT_VERSION, prompt_version, system_blocks
+from uoes_learning_objectives.response_cache import cache_key, get_response_cache, normalize_text
+
+# Bump whenever a structured prompt or schema changes so cached responses are not reused
+STRUCTURED_PROMPT_VERSION = f"2.{SYSTEM_PROMPT_VERSION}"
+
+REVIEW_TOOL_NAME = "record_objective_review"
+OBJECTIVES_TOOL_NAME = "record_learning_objectives"
+
+
+class MissingAPIKeyError(ValueError):
+    """No Anthropic API key is configured, so Claude cannot be asked."""
+
+
+_LEVEL_SCHEMA = {"type": "string", "enum": list(TAXONOMY.levels)}
+_TEXT_LIST_SCHEMA = {"type": "array", "items": {"type": "string"}}
+
+REVIEW_TOOL: Dict[str, Any] = {
+    "name": REVIEW_TOOL_NAME,
+    "description": "Record the review of a learning objective.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "strengths": _TEXT_LIST_SCHEMA,
+            "suggestions": _TEXT_LIST_SCHEMA,
+            "blooms_level": _LEVEL_SCHEMA,
+            "scores": {
+                "type": "object",
+                "properties": {
+                    criterion: {"type": "integer", "minimum": 1, "maximum": 5, "description": text}
+                    for criterion, text in RUBRIC_CRITERIA.items()
+                },
+                "required": list(RUBRIC_CRITERIA),
+                "additionalProperties": False,
+            },
+        },
+        "required": ["strengths", "suggestions", "blooms_level", "scores"],
+        "additionalProperties": False,
+    },
+}
+
+OBJECTIVES_TOOL: Dict[str, Any] = {
+    "name": OBJECTIVES_TOOL_NAME,
+    "description": "Record the suggested learning objectives.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "objectives": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "topic": {"type": "string"},
+                        "blooms_level": _LEVEL_SCHEMA,
+                        "objective": {"type": "string"},
+                    },
+                    "required": ["topic", "blooms_level", "objective"],
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["objectives"],
+        "additionalProperties": False,
+    },
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ObjectiveReview:
+    """Claude's review of one objective, with read-only scores keyed like RUBRIC_CRITERIA."""
+
+    strengths: Tuple[str, ...]
+    suggestions: Tuple[str, ...]
+    blooms_level: str
+    scores: Mapping[str, int]
+
+    @property
+    def average_score(self) -> float:
+        """Mean of the rubric scores."""
+        return sum(self.scores.values()) / len(self.scores)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the review as JSON-serializable data, the inverse of parse_review."""
+        return {
+            "strengths": list(self.strengths),
+            "suggestions": list(self.suggestions),
+            "blooms_level": self.blooms_level,
+            "scores": dict(self.scores),
+        }
+
+    def to_record(self, objective: str) -> Dict[str, Any]:
+        """Flatten the review into a record with the batch analyzer's RESULT_FIELDS."""
+        return {
+            "objective": objective,
+            "blooms_level": self.blooms_level,
+            "strengths": list(self.strengths),
+            "suggestions": list(self.suggestions),
+            **self.scores,
+            "average_score": self.average_score,
+        }
+
+    def score_differences(self, heuristic_scores: Mapping[str, int]) -> Dict[str, int]:
+        """Return Claude's score minus the heuristic score for each criterion.
+
+        Args:
+            heuristic_scores: Scores as returned by evaluate_objective_rubric
+        """
+        return {
+            criterion: score - heuristic_scores[criterion]
+            for criterion, score in self.scores.items()
+        }
+
+
+class SuggestedObjective(NamedTuple):
+    """One learning objective suggested by Claude."""
+
+    topic: str
+    blooms_level: str
+    objective: str
+
+
+def _object(data: Any, keys: Tuple[str, ...], where: str) -> Dict[str, Any]:
+    """Check that data is a dict with exactly the given keys."""
+    if not isinstance(data, dict):
+        raise ValueError(f"{where} must be an object, got {type(data).__name__}")
+    if data.keys() != set(keys):
+        missing = [key for key in keys if key not in data]
+        extra = sorted(key for key in data if key not in keys)
+        raise ValueError(f"{where} has missing keys {missing} or unexpected keys {extra}")
+    return data
+
+
+def _text_list(value: Any, where: str) -> Tuple[str, ...]:
+    """Check that value is a list of strings."""
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"{where} must be a list of strings")
+    return tuple(value)
+
+
+def _level(value: Any, where: str) -> str:
+    """Check that value names a Bloom's level."""
+    if value not in TAXONOMY.level_rank:
+        raise ValueError(f"{where} must be one of {', '.join(TAXONOMY.levels)}, got {value!r}")
+    return value
+
+
+def parse_review(data: Any) -> ObjectiveReview:
+    """Validate the input of a review tool call and build an ObjectiveReview.
+
+    This checks exactly what REVIEW_TOOL's schema requires with plain type
+    checks, which is much cheaper than a general JSON Schema validator.
+
+    Args:
+        data: The decoded tool input (or ObjectiveReview.to_dict() output)
+
+    Returns:
+        The validated review
+
+    Raises:
+        ValueError: If the data does not match the schema
+    """
+    review = _object(data, ("strengths", "suggestions", "blooms_level", "scores"), "review")
+    scores = _object(review["scores"], tuple(RUBRIC_CRITERIA), "scores")
+    for criterion, score in scores.items():
+        # bool is an int subclass, but true/false is not a score
+        if type(score) is not int or not 1 <= score <= 5:
+            raise ValueError(f"score for {criterion} must be an integer from 1 to 5, got {score!r}")
+    return ObjectiveReview(
+        strengths=_text_list(review["strengths"], "strengths"),
+        suggestions=_text_list(review["suggestions"], "suggestions"),
+        blooms_level=_level(review["blooms_level"], "blooms_level"),
+        # Keep the rubric order whatever order the keys arrived in
+        scores=MappingProxyType({criterion: scores[criterion] for criterion in RUBRIC_CRITERIA}),
+    )
+
+
+def parse_objectives(data: Any) -> List[SuggestedObjective]:
+    """Validate the input of an objectives tool call.
+
+    Args:
+        data: The decoded tool input
+
+    Returns:
+        The suggested objectives, in the order Claude gave them
+
+    Raises:
+        ValueError: If the data does not match the schema
+    """
+    items = _object(data, ("objectives",), "response")["objectives"]
+    if not isinstance(items, list):
+        raise ValueError("objectives must be a list")
+    objectives = []
+    for i, item in enumerate(items):
+        fields = _object(item, SuggestedObjective._fields, f"objectives[{i}]")
+        topic, objective = fields["topic"], fields["objective"]
+        if not isinstance(topic, str) or not isinstance(objective, str):
+            raise ValueError(f"objectives[{i}] topic and objective must be strings")
+        level = _level(fields["blooms_level"], f"objectives[{i}].blooms_level")
+        objectives.append(SuggestedObjective(topic, level, objective))
+    return objectives
+
+
+def tool_input(message: Any, tool_name: str) -> Any:
+    """Return the input of the named tool call in a Message.
+
+    Raises:
+        ValueError: If the message does not call the tool
+    """
+    for block in getattr(message, "content", ()):
+        if getattr(block, "type", None) == "tool_use" and block.name == tool_name:
+            return block.input
+    raise ValueError(f"Claude's response did not call the {tool_name} tool")
+
+
+def _tool_request(prompt: str, tool: Dict[str, Any], max_tokens: int) -> Dict[str, Any]:
+    """Build Messages API parameters that force Claude to answer through a tool."""
+    return {
+        "model": CLAUDE_MODEL,
+        "max_tokens": max_tokens,
+        "temperature": 0.2,
+        "tools": [tool],
+        "system": system_blocks(),
+        "tool_choice": {"type": "tool", "name": tool["name"]},
+        "messages": [{"role": "user", "content": prompt}],
+    }
+
+
+def review_request(objective: str) -> Dict[str, Any]:
+    """Build the Messages API parameters for a structured review of one objective."""
+    prompt = (
+        "Review the following learning objective: list its strengths, suggestions for "
+        "improvement and its Bloom's level, and score it from 1 to 5 on each rubric criterion. "
+        f"Record the review with the {REVIEW_TOOL_NAME} tool.\n\n"
+        f"Learning Objective: {objective}"
+    )
+    return _tool_request(prompt, REVIEW_TOOL, 1024)
+
+
+def review_cache_key(objective: str, request: Dict[str, Any]) -> str:
+    """Build the response cache key for a structured review request."""
+    return cache_key(
+        "structured_review",
+        prompt_version(STRUCTURED_PROMPT_VERSION, request),
+        objective,
+        request["model"],
+        request["temperature"],
+        request["max_tokens"],
+    )
+
+
+def objectives_request(course_level: str, key_topics: str, subject_area: str) -> Dict[str, Any]:
+    """Build the Messages API parameters for structured objective suggestions."""
+    prompt = (
+        "Given the following course information, suggest 1-2 detailed learning objectives for "
+        "each key topic, using Bloom's action verbs appropriate for the course level. "
+        "Phrase each objective as: 'By the end of this course, students will be able to "
+        "[action verb] [expanded topic/skill].' "
+        f"Record them with the {OBJECTIVES_TOOL_NAME} tool.\n"
+        f"Subject Area: {subject_area}\n"
+        f"Course Level: {course_level}\n"
+        f"Key Topics: {key_topics}"
+    )
+    return _tool_request(prompt, OBJECTIVES_TOOL, 1024)
+
+
+def review_objective(objective: str, client: Optional[Any] = None) -> ObjectiveReview:
+    """Ask Claude for a structured review of a learning objective.
+
+    Validated reviews are cached, so reviewing the same objective again (up to
+    case and whitespace) does not make another API call.
+
+    Args:
+        objective: The learning objective text
+        client: Anthropic client; defaults to the shared client
+
+    Returns:
+        The validated review
+
+    Raises:
+        MissingAPIKeyError: If no API key is set (a ValueError)
+        ValueError: If Claude's response does not match the schema
+    """
+    from uoes_learning_objectives.anthropic_client import create_message, get_anthropic_client
+
+    request = review_request(objective)
+    key = review_cache_key(objective, request)
+    cache = get_response_cache()
+    cached = cache.get(key)
+    if cached is not None:
+        return parse_review(cached)
+
+    client = client or get_anthropic_client()
+    if client is None:
+        raise MissingAPIKeyError(
+            "Anthropic API key not found. Please set ANTHROPIC_API_KEY in your environment."
+        )
+    review = parse_review(tool_input(create_message(client, request, "review"), REVIEW_TOOL_NAME))
+    cache.set(key, review.to_dict())
+    return review
+
+
+def suggest_objectives(
+    course_level: str, key_topics: str, subject_area: str, client: Optional[Any] = None
+) -> List[SuggestedObjective]:
+    """Ask Claude for structured learning objective suggestions.
+
+    Args:
+        course_level: One of the creator's COURSE_LEVELS
+        key_topics: Comma-separated topics
+        subject_area: Subject area of the course
+        client: Anthropic client; defaults to the shared client
+
+    Returns:
+        The validated suggestions
+
+    Raises:
+        MissingAPIKeyError: If no API key is set (a ValueError)
+        ValueError: If Claude's response does not match the schema
+    """
+    from uoes_learning_objectives.anthropic_client import create_message, get_anthropic_client
+
+    request = objectives_request(course_level, key_topics, subject_area)
+    key = cache_key(
+        "structured_objectives",
+        prompt_version(STRUCTURED_PROMPT_VERSION, request),
+        json.dumps([normalize_text(f) for f in (course_level, subject_area, key_topics)]),
+        request["model"],
+        request["temperature"],
+        request["max_tokens"],
+    )
+    cache = get_response_cache()
+    cached = cache.get(key)
+    if cached is not None:
+        return parse_objectives(cached)
+
+    client = client or get_anthropic_client()
+    if client is None:
+        raise MissingAPIKeyError(
+            "Anthropic API key not found. Please set ANTHROPIC_API_KEY in your environment."
+        )
+    data = tool_input(create_message(client, request, "objectives"), OBJECTIVES_TOOL_NAME)
+    objectives = parse_objectives(data)
+    cache.set(key, data)
+    return objectives
@@ -0,0 +1,273 @@
+"""Streaming analysis of every learning objective in a whole syllabus."""
+
+import io
+import re
+import zipfile
+from collections import Counter
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from xml.etree import ElementTree
+
+import streamlit as st
+
+from uoes_learning_objectives.blooms_taxonomy import TAXONOMY
+from uoes_learning_objectives.objective_analyzer import AnalysisResult, analyze
+
+SUPPORTED_SYLLABUS_FORMATS = (".txt", ".md", ".docx")
+
+# Characters read from a text file at a time
+READ_CHUNK_SIZE = 64 * 1024
+
+# Longest segment kept in memory; longer runs of text without a sentence
+# break are cut here so memory stays bounded for any input
+MAX_SEGMENT_LENGTH = 2_000
+
+# Rows kept for the per-objective table; the level distribution counts them all
+MAX_TABLE_ROWS = 500
+
+# Bullets ("-", "*", "•"), numbering ("1.", "2)", "a.") and markdown headings
+LIST_MARKER = re.compile(r"^(?:[-*+•◦▪]|\(?(?:\d{1,3}|[a-zA-Z])[.)])\s+")
+HEADING = re.compile(r"^#{1,6}\s")
+
+# A sentence ends at ., ! or ? followed by whitespace and an uppercase letter,
+# digit or opening quote/bracket, so abbreviations like "e.g. data" are kept whole
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(\[])")
+
+_WORD_NAMESPACE = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def iter_text_chunks(file: IO[bytes], chunk_size: int = READ_CHUNK_SIZE) -> Iterator[str]:
+    """Read a UTF-8 text or markdown file lazily in chunks.
+
+    Args:
+        file: Binary file object, e.g. a Streamlit UploadedFile
+        chunk_size: Characters returned per chunk
+
+    Returns:
+        An iterator of text chunks
+    """
+    reader = io.TextIOWrapper(file, encoding="utf-8", errors="replace", newline=None)
+    try:
+        while chunk := reader.read(chunk_size):
+            yield chunk
+    finally:
+        # Leave the caller's file open
+        reader.detach()
+
+
+def iter_docx_paragraphs(file: IO[bytes]) -> Iterator[str]:
+    """Stream the paragraphs of a .docx document without loading it whole.
+
+    The document XML is parsed incrementally and each finished top-level
+    element is discarded, so memory does not grow with the document.
+
+    Args:
+        file: Binary file object of a .docx document
+
+    Returns:
+        An iterator of paragraph texts, each ending in a newline
+    """
+    with zipfile.ZipFile(file) as archive, archive.open("word/document.xml") as xml:
+        depth = 0
+        body = None
+        texts: List[str] = []
+        for event, element in ElementTree.iterparse(xml, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if element.tag == f"{_WORD_NAMESPACE}body":
+                    body = element
+                continue
+            depth -= 1
+            tag = element.tag
+            if tag == f"{_WORD_NAMESPACE}t":
+                texts.append(element.text or "")
+            elif tag == f"{_WORD_NAMESPACE}tab":
+                texts.append("\t")
+            elif tag == f"{_WORD_NAMESPACE}br":
+                texts.append("\n")
+            elif tag == f"{_WORD_NAMESPACE}p":
+                yield "".join(texts) + "\n"
+                texts = []
+            # document > body > top-level paragraph or table
+            if depth == 2 and body is not None:
+                body.clear()
+
+
+def read_syllabus(file: IO[bytes], name: str) -> Iterator[str]:
+    """Stream the text of an uploaded syllabus, choosing the reader from its name.
+
+    Args:
+        file: Binary file object
+        name: File name; its suffix selects the format
+
+    Returns:
+        An iterator of text chunks
+    """
+    suffix = name[name.rfind("."):].lower() if "." in name else ""
+    if suffix not in SUPPORTED_SYLLABUS_FORMATS:
+        raise ValueError(
+            f"Unsupported file format '{suffix}'. "
+            f"Expected one of: {', '.join(SUPPORTED_SYLLABUS_FORMATS)}"
+        )
+    if suffix == ".docx":
+        return iter_docx_paragraphs(file)
+    return iter_text_chunks(file)
+
+
+def _lines(chunks: Iterable[str], max_length: int) -> Iterator[str]:
+    """Regroup text chunks into lines, cutting overlong lines at whitespace."""
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split("\n")
+        yield from lines
+        while len(pending) > max_length:
+            head, pending = _cut(pending, max_length)
+            yield head
+    if pending:
+        yield pending
+
+
+def _cut(text: str, max_length: int) -> Tuple[str, str]:
+    """Split text at the last space within max_length, or at max_length if there is none."""
+    cut = text.rfind(" ", 0, max_length + 1)
+    cut = cut if cut > 0 else max_length
+    return text[:cut], text[cut:].lstrip(" ")
+
+
+def segment_sentences(
+    chunks: Iterable[str], max_length: int = MAX_SEGMENT_LENGTH
+) -> Iterator[str]:
+    """Split streamed text into sentences and list items as it arrives.
+
+    Blank lines, headings and list markers end a segment; lines wrapped inside
+    a paragraph are joined. Only the unfinished tail of the current paragraph
+    is held in memory.
+
+    Args:
+        chunks: Text in pieces of any size, e.g. from read_syllabus
+        max_length: Segments are cut at this many characters
+
+    Returns:
+        An iterator of whitespace-normalized segments
+    """
+    paragraph = ""
+    for line in _lines(chunks, max_length):
+        stripped = " ".join(line.split())
+        marker = LIST_MARKER.match(stripped)
+        if not stripped or marker or HEADING.match(stripped):
+            if paragraph:
+                yield paragraph
+            paragraph = ""
+            if not stripped or not marker:
+                continue
+            stripped = stripped[marker.end():]
+
+        paragraph = f"{paragraph} {stripped}" if paragraph else stripped
+        *sentences, paragraph = SENTENCE_BREAK.split(paragraph)
+        yield from sentences
+        while len(paragraph) > max_length:
+            head, paragraph = _cut(paragraph, max_length)
+            yield head
+    if paragraph:
+        yield paragraph
+
+
+def candidate_objectives(segments: Iterable[str]) -> Iterator[AnalysisResult]:
+    """Analyze each segment once and keep those that read like learning objectives.
+
+    Args:
+        segments: Sentences and list items, e.g. from segment_sentences
+
+    Returns:
+        An iterator of the analyses of segments containing a Bloom's taxonomy
+        action verb
+    """
+    for segment in segments:
+        result = analyze(segment)
+        if result.verbs:
+            yield result
+
+
+def analyze_syllabus(chunks: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Segment a syllabus and analyze each candidate objective as it is found.
+
+    Args:
+        chunks: Syllabus text in pieces of any size
+
+    Returns:
+        An iterator of result records, as produced by the batch analyzer
+    """
+    # The batch module pulls in multiprocessing, which the app does not need at start-up
+    from uoes_learning_objectives.batch_analyzer import analysis_record
+
+    return (analysis_record(result) for result in candidate_objectives(segment_sentences(chunks)))
+
+
+def level_distribution(counts: Counter) -> Dict[str, List[Any]]:
+    """Chart data with the number of objectives at each Bloom's level, in order."""
+    levels = list(TAXONOMY.levels)
+    return {"Level": levels, "Objectives": [counts.get(level, 0) for level in levels]}
+
+
+def syllabus_analyzer() -> None:
+    """Create an interface for analyzing every objective in a syllabus."""
+    st.header("Syllabus Analyzer")
+    st.write("""
+    Paste or upload a syllabus. Each sentence or list item that uses a Bloom's action verb is
+    analyzed as a separate learning objective.
+    """)
+
+    uploaded = st.file_uploader("Upload a syllabus", type=["txt", "md", "docx"])
+    pasted = st.text_area("Or paste the syllabus text:", height=200)
+
+    if not st.button("Analyze Syllabus"):
+        return
+
+    chunks: Optional[Iterable[str]] = None
+    if uploaded is not None:
+        chunks = read_syllabus(uploaded, uploaded.name)
+    elif pasted.strip():
+        chunks = [pasted]
+    if chunks is None:
+        st.warning("Upload a file or paste some text first.")
+        return
+
+    progress = st.empty()
+    table = st.empty()
+    rows: List[Dict[str, Any]] = []
+    levels: Counter = Counter()
+    count = 0
+    total = 0.0
+
+    for record in analyze_syllabus(chunks):
+        count += 1
+        levels[record["blooms_level"]] += 1
+        total += record["average_score"]
+        if len(rows) < MAX_TABLE_ROWS:
+            rows.append(
+                {
+                    "Objective": record["objective"],
+                    "Bloom's level": record["blooms_level"],
+                    "Average score": round(record["average_score"], 2),
+                    "Suggestions": len(record["suggestions"]),
+                }
+            )
+        # Refresh the page while the first objectives come in, then only every 50
+        if count <= 10 or count % 50 == 0:
+            if count <= MAX_TABLE_ROWS:
+                table.dataframe(rows, hide_index=True)
+            progress.caption(f"{count} objectives analyzed")
+
+    if not count:
+        progress.empty()
+        st.warning("No learning objectives with Bloom's action verbs were found.")
+        return
+
+    progress.caption(f"{count} objectives analyzed")
+    table.dataframe(rows, hide_index=True)
+    if count > len(rows):
+        st.caption(f"Showing the first {len(rows)} of {count} objectives.")
+
+    st.subheader("Bloom's Level Distribution")
+    st.bar_chart(level_distribution(levels), x="Level", y="Objectives")
+    st.info(f"Average rubric score across {count} objectives: {total / count:.1f}/5")
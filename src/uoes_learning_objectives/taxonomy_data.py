@@ -0,0 +1,372 @@
+"""Versioned taxonomy and exemplar data, loaded from a JSON file and reloaded when it changes.
+
+The Bloom's levels, action verbs, example objectives, rubric criteria, course
+level mapping and sample objectives live in data/taxonomy.json (or the file
+named by UOES_TAXONOMY_DATA). Each load compiles the file into an immutable
+TaxonomyData snapshot. A watcher thread polls the file and swaps in a new
+snapshot when it changes, so edits take effect without restarting Streamlit.
+
+Code that needs several of the tables should call current_data() once and use
+that snapshot throughout, so a reload in the middle of an analysis cannot mix
+old and new data.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from uoes_learning_objectives import metrics
+
+# Data file shipped with the package, used unless UOES_TAXONOMY_DATA is set
+DEFAULT_DATA_PATH = Path(__file__).with_name("data") / "taxonomy.json"
+DATA_ENV_VAR = "UOES_TAXONOMY_DATA"
+
+# Seconds between checks of the data file for changes
+DEFAULT_POLL_INTERVAL = 2.0
+
+
+@dataclass(frozen=True, eq=False)
+class Taxonomy:
+    """Immutable, precomputed view of the Bloom's taxonomy verb tables.
+
+    Compared and hashed by identity, so a compiled taxonomy can key caches.
+    """
+
+    # Levels ordered from lowest to highest cognitive complexity
+    levels: Tuple[str, ...]
+    # Level -> its action verbs
+    verbs: Mapping[str, Tuple[str, ...]]
+    # Verb -> every level listing it, lowest first
+    verb_levels: Mapping[str, Tuple[str, ...]]
+    # Level -> ordinal used to rank levels (0 is Remember)
+    level_rank: Mapping[str, int]
+    # Matches any action verb as a whole word in lowercased text
+    verb_pattern: "re.Pattern[str]"
+
+    @property
+    def ambiguous_verbs(self) -> Mapping[str, Tuple[str, ...]]:
+        """Verbs listed under more than one level, with those levels."""
+        return MappingProxyType(
+            {verb: levels for verb, levels in self.verb_levels.items() if len(levels) > 1}
+        )
+
+
+def compile_taxonomy(level_verbs: Mapping[str, Iterable[str]]) -> Taxonomy:
+    """Build the immutable lookup tables for a level -> verbs mapping.
+
+    Args:
+        level_verbs: Action verbs for each level, ordered from lowest to highest level
+
+    Returns:
+        The compiled Taxonomy
+    """
+    verbs = {level: tuple(level_verbs[level]) for level in level_verbs}
+
+    verb_levels: Dict[str, List[str]] = {}
+    for level, level_list in verbs.items():
+        for verb in level_list:
+            verb_levels.setdefault(verb, []).append(level)
+
+    # Longest verbs first so a multi-word verb is preferred over its prefix
+    alternation = "|".join(
+        re.escape(verb) for verb in sorted(verb_levels, key=len, reverse=True)
+    )
+
+    return Taxonomy(
+        levels=tuple(verbs),
+        verbs=MappingProxyType(verbs),
+        verb_levels=MappingProxyType(
+            {verb: tuple(levels) for verb, levels in verb_levels.items()}
+        ),
+        level_rank=MappingProxyType({level: rank for rank, level in enumerate(verbs)}),
+        verb_pattern=re.compile(r'\b(?:' + alternation + r')\b'),
+    )
+
+
+@dataclass(frozen=True, eq=False)
+class TaxonomyData:
+    """One immutable snapshot of the data file and the tables compiled from it.
+
+    Compared and hashed by identity, so caches of values derived from the data
+    can be keyed by the snapshot they were computed from.
+    """
+
+    # The "version" field of the file
+    version: str
+    # SHA-256 of the file contents
+    digest: str
+    taxonomy: Taxonomy
+    # Level -> one-line description
+    cognitive_levels: Mapping[str, str]
+    # Level -> its verbs as one comma-separated string
+    action_verbs: Mapping[str, str]
+    # Level -> example objective
+    example_objectives: Mapping[str, str]
+    # Criterion -> description
+    rubric_criteria: Mapping[str, str]
+    # Course level -> suggested Bloom's levels
+    level_to_blooms: Mapping[str, Tuple[str, ...]]
+    # Discipline -> level -> sample objective
+    sample_objectives: Mapping[str, Mapping[str, str]]
+
+
+def _object(value: Any, where: str) -> Dict[str, Any]:
+    """Return value if it is a non-empty JSON object, else raise ValueError."""
+    if not isinstance(value, dict) or not value:
+        raise ValueError(f"{where} must be a non-empty object")
+    return value
+
+
+def _text(value: Any, where: str) -> str:
+    """Return value if it is a non-empty string, else raise ValueError."""
+    if not isinstance(value, str) or not value.strip():
+        raise ValueError(f"{where} must be a non-empty string")
+    return value
+
+
+def _known_levels(levels: Iterable[str], known: Mapping[str, Any], where: str) -> Tuple[str, ...]:
+    """Return levels as a tuple if every one is a Bloom's level, else raise ValueError."""
+    levels = tuple(levels)
+    unknown = [level for level in levels if level not in known]
+    if unknown:
+        raise ValueError(f"{where} has unknown Bloom's levels: {', '.join(map(str, unknown))}")
+    return levels
+
+
+def parse_taxonomy_data(raw: bytes) -> TaxonomyData:
+    """Validate the contents of a data file and compile them into a snapshot.
+
+    Args:
+        raw: The JSON file contents
+
+    Returns:
+        The compiled snapshot
+
+    Raises:
+        ValueError: If the contents are not valid JSON or do not match the expected layout
+    """
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Taxonomy data is not valid JSON: {e}") from e
+    data = _object(data, "Taxonomy data")
+
+    levels = _object(data.get("levels"), "levels")
+    level_verbs: Dict[str, Tuple[str, ...]] = {}
+    descriptions: Dict[str, str] = {}
+    examples: Dict[str, str] = {}
+    for level, entry in levels.items():
+        entry = _object(entry, f"levels.{level}")
+        verbs = entry.get("verbs")
+        if not isinstance(verbs, list) or not verbs:
+            raise ValueError(f"levels.{level}.verbs must be a non-empty list")
+        level_verbs[level] = tuple(
+            _text(verb, f"levels.{level}.verbs").strip().lower() for verb in verbs
+        )
+        descriptions[level] = _text(entry.get("description"), f"levels.{level}.description")
+        examples[level] = _text(entry.get("example"), f"levels.{level}.example")
+
+    rubric = {
+        criterion: _text(text, f"rubric_criteria.{criterion}")
+        for criterion, text in _object(data.get("rubric_criteria"), "rubric_criteria").items()
+    }
+    course_levels = {}
+    for course_level, blooms in _object(data.get("course_levels"), "course_levels").items():
+        if not isinstance(blooms, list) or not blooms:
+            raise ValueError(f"course_levels.{course_level} must be a non-empty list")
+        course_levels[course_level] = _known_levels(blooms, levels, f"course_levels.{course_level}")
+    samples = {}
+    for discipline, objectives in _object(data.get("sample_objectives"), "sample_objectives").items():
+        where = f"sample_objectives.{discipline}"
+        objectives = _object(objectives, where)
+        _known_levels(objectives, levels, where)
+        samples[discipline] = MappingProxyType(
+            {level: _text(text, f"{where}.{level}") for level, text in objectives.items()}
+        )
+
+    taxonomy = compile_taxonomy(level_verbs)
+    return TaxonomyData(
+        version=str(data.get("version", "")),
+        digest=hashlib.sha256(raw).hexdigest(),
+        taxonomy=taxonomy,
+        cognitive_levels=MappingProxyType(descriptions),
+        action_verbs=MappingProxyType(
+            {level: ", ".join(verbs) for level, verbs in taxonomy.verbs.items()}
+        ),
+        example_objectives=MappingProxyType(examples),
+        rubric_criteria=MappingProxyType(rubric),
+        level_to_blooms=MappingProxyType(course_levels),
+        sample_objectives=MappingProxyType(samples),
+    )
+
+
+def load_taxonomy_data(path: Path) -> TaxonomyData:
+    """Read and compile a data file; see parse_taxonomy_data."""
+    return parse_taxonomy_data(Path(path).read_bytes())
+
+
+def _file_state(path: Path) -> Tuple[int, int, int]:
+    """Return what identifies a version of the file: inode, size and modification time."""
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class TaxonomyStore:
+    """Holds the current snapshot of a data file and swaps in a new one when the file changes.
+
+    Readers take the snapshot with a single attribute read, so they never block
+    and always see either the old or the new data in full. Reloads are
+    serialized by a lock and timed in the uoes_taxonomy_reload_seconds histogram.
+
+    Bloom's level names and rubric criteria cannot change on reload, because
+    tool schemas and output columns are built from them at import time; a file
+    that renames them is rejected until the app is restarted.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Load the data file.
+
+        Args:
+            path: Path of the JSON data file
+
+        Raises:
+            ValueError: If the file is not valid taxonomy data
+            OSError: If the file cannot be read
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._state = _file_state(self.path)
+        self._data = load_taxonomy_data(self.path)
+        self.reloads = 0
+        self.failed_reloads = 0
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def snapshot(self) -> TaxonomyData:
+        """Return the current snapshot."""
+        return self._data
+
+    def reload_if_changed(self) -> bool:
+        """Reload the file if it changed since it was last read.
+
+        A file that fails to load is not retried until it changes again, and the
+        previous snapshot stays in use.
+
+        Returns:
+            True if a new snapshot was swapped in
+
+        Raises:
+            ValueError: If the changed file is not valid taxonomy data, or renames
+                levels or rubric criteria
+            OSError: If the file cannot be read
+        """
+        with self._lock:
+            state = _file_state(self.path)
+            if state == self._state:
+                return False
+            self._state = state
+            start = time.perf_counter()
+            try:
+                data = load_taxonomy_data(self.path)
+                self._check_compatible(data)
+            except (ValueError, OSError):
+                self.failed_reloads += 1
+                metrics.increment("uoes_taxonomy_reloads_total", result="error")
+                raise
+            # Rebinding one attribute is atomic, so readers switch over in one step
+            self._data = data
+            self.reloads += 1
+            metrics.observe("uoes_taxonomy_reload_seconds", time.perf_counter() - start)
+            metrics.increment("uoes_taxonomy_reloads_total", result="ok")
+            return True
+
+    def _check_compatible(self, data: TaxonomyData) -> None:
+        """Raise ValueError if data renames or reorders the levels or rubric criteria."""
+        current = self._data
+        if data.taxonomy.levels != current.taxonomy.levels:
+            raise ValueError(
+                "Bloom's levels cannot change while the app is running; expected "
+                + ", ".join(current.taxonomy.levels)
+            )
+        if tuple(data.rubric_criteria) != tuple(current.rubric_criteria):
+            raise ValueError(
+                "Rubric criteria cannot change while the app is running; expected "
+                + ", ".join(current.rubric_criteria)
+            )
+
+    def _watch(self, interval: float) -> None:
+        """Poll the file until stopped; reload errors are counted, not raised."""
+        while not self._stop.wait(interval):
+            try:
+                self.reload_if_changed()
+            except (ValueError, OSError):
+                pass
+
+    def start_watcher(self, interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        """Check the file for changes every interval seconds from a daemon thread.
+
+        Later calls do nothing while the watcher is running.
+        """
+        with self._lock:
+            if self._watcher is None or not self._watcher.is_alive():
+                self._stop.clear()
+                self._watcher = threading.Thread(
+                    target=self._watch, args=(interval,), name="taxonomy-watcher", daemon=True
+                )
+                self._watcher.start()
+
+    def stop_watcher(self) -> None:
+        """Stop the watcher thread, if running, and wait for it to exit."""
+        self._stop.set()
+        watcher = self._watcher
+        if watcher is not None:
+            watcher.join()
+            self._watcher = None
+
+    def stats(self) -> Dict[str, int]:
+        """Return reload counters, exported as metrics gauges."""
+        return {"reloads": self.reloads, "failed_reloads": self.failed_reloads}
+
+
+_store: Optional[TaxonomyStore] = None
+_store_lock = threading.Lock()
+
+
+def get_taxonomy_store() -> TaxonomyStore:
+    """Return the process-wide store, loading UOES_TAXONOMY_DATA or DEFAULT_DATA_PATH on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = TaxonomyStore(Path(os.getenv(DATA_ENV_VAR) or DEFAULT_DATA_PATH))
+        return _store
+
+
+def set_taxonomy_store(store: Optional[TaxonomyStore]) -> None:
+    """Replace the process-wide store; None reloads the data file on next use."""
+    global _store
+    with _store_lock:
+        if _store is not None and _store is not store:
+            _store.stop_watcher()
+        _store = store
+
+
+def current_data() -> TaxonomyData:
+    """Return the current snapshot of the process-wide store."""
+    store = _store
+    return (store if store is not None else get_taxonomy_store()).snapshot()
+
+
+def _store_stats() -> Dict[str, int]:
+    """Stats of the process-wide store, exported as metrics gauges."""
+    store = _store
+    return store.stats() if store is not None else {}
+
+
+metrics.register_collector("uoes_taxonomy_data", _store_stats)
@@ -1,7 +1,10 @@
 """Reusable UI components for the Streamlit application."""
 
+import functools
+import html
+
 import streamlit as st
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Iterable, Mapping, Sequence, Tuple, Union
 
 
 def page_header(title: str, description: str = "") -> None:
@@ -58,29 +61,70 @@ def sidebar_navigation(pages: Dict[str, Callable]) -> str:
     return selected_page
 
 
-def display_taxonomy_level_badge(level: str) -> None:
-    """Display a badge for the Bloom's Taxonomy level.
+# Badge background color for each Bloom's Taxonomy level
+LEVEL_COLORS = {
+    "Remember": "#ff9999",
+    "Understand": "#ffcc99",
+    "Apply": "#ffff99",
+    "Analyze": "#99ff99",
+    "Evaluate": "#99ccff",
+    "Create": "#cc99ff"
+}
+
+# Rows per page of the sample objectives table
+OBJECTIVES_PAGE_SIZE = 50
+
+# Style sheet for level badges and tables, sent once with each HTML element
+# instead of repeating inline styles in every cell
+TABLE_STYLE = (
+    "<style>"
+    ".uoes-table{width:100%;border-collapse:collapse;border:none}"
+    ".uoes-table th,.uoes-table td{padding:.4rem .6rem;border:none;vertical-align:top}"
+    ".uoes-level{display:inline-block;padding:.3rem .6rem;white-space:nowrap;"
+    "border-radius:.5rem;font-weight:bold;background-color:#cccccc}"
+    + "".join(f".uoes-level-{level}{{background-color:{color}}}" for level, color in LEVEL_COLORS.items())
+    + "</style>"
+)
+
+
+def level_badge_html(level: str) -> str:
+    """Return the HTML of a badge for the Bloom's Taxonomy level.
     
     Args:
         level: The Bloom's Taxonomy level
+        
+    Returns:
+        A span styled by TABLE_STYLE, which must be part of the same element
     """
-    level_colors = {
-        "Remember": "#ff9999",
-        "Understand": "#ffcc99", 
-        "Apply": "#ffff99",
-        "Analyze": "#99ff99",
-        "Evaluate": "#99ccff",
-        "Create": "#cc99ff"
-    }
+    css_class = f"uoes-level uoes-level-{level}" if level in LEVEL_COLORS else "uoes-level"
+    return f'<span class="{css_class}">{html.escape(level)}</span>'
+
+
+def html_table(header: Sequence[str], rows: Iterable[Sequence[str]]) -> str:
+    """Build a styled HTML table element.
     
-    color = level_colors.get(level, "#cccccc")
+    Args:
+        header: Column titles
+        rows: Cells of each row, already HTML
+        
+    Returns:
+        The style sheet and table HTML, to pass to st.markdown with unsafe_allow_html
+    """
+    head = "".join(f"<th>{html.escape(title)}</th>" for title in header)
+    body = "".join("<tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>" for row in rows)
+    return (
+        f'{TABLE_STYLE}<table class="uoes-table"><thead><tr>{head}</tr></thead>'
+        f"<tbody>{body}</tbody></table>"
+    )
+
+
+def display_taxonomy_level_badge(level: str) -> None:
+    """Display a badge for the Bloom's Taxonomy level.
     
-    st.markdown(f"""
-    <div style="display: inline-block; padding: 0.3rem 0.6rem; 
-        background-color: {color}; border-radius: 0.5rem; font-weight: bold;">
-        {level}
-    </div>
-    """, unsafe_allow_html=True)
+    Args:
+        level: The Bloom's Taxonomy level
+    """
+    st.markdown(TABLE_STYLE + level_badge_html(level), unsafe_allow_html=True)
 
 
 def create_tabs_container(tab_names: List[str]) -> List[Any]:
@@ -95,26 +139,89 @@ def create_tabs_container(tab_names: List[str]) -> List[Any]:
     return st.tabs(tab_names)
 
 
-def display_sample_objectives(samples: Dict[str, Dict[str, str]], 
-                              discipline_filter: str = "All") -> None:
-    """Display sample objectives with filtering capabilities.
+@functools.lru_cache(maxsize=256)
+def objectives_table_html(rows: Tuple[Tuple[str, str, str], ...], show_discipline: bool = True) -> str:
+    """Render objectives as one HTML table with a level badge per row.
+    
+    The whole table is sent to the browser as a single element, instead of a
+    pair of columns and two elements per objective.
+    
+    Args:
+        rows: (discipline, level, objective) tuples
+        show_discipline: Whether to include the discipline column
+        
+    Returns:
+        The style sheet and table HTML
+    """
+    header = ["Level", "Objective"]
+    cells = []
+    for discipline, level, objective in rows:
+        row = [level_badge_html(level), html.escape(objective)]
+        cells.append([html.escape(discipline), *row] if show_discipline else row)
+    return html_table(["Discipline", *header] if show_discipline else header, cells)
+
+
+@functools.lru_cache(maxsize=256)
+def filter_objectives(
+    rows: Tuple[Tuple[str, str, str], ...], discipline_filter: str = "All", query: str = ""
+) -> Tuple[Tuple[str, str, str], ...]:
+    """Select the objectives of one discipline that contain every word of a search query.
     
     Args:
-        samples: Dictionary with disciplines as keys and dictionaries of level:objective as values
+        rows: (discipline, level, objective) tuples
+        discipline_filter: Only keep this discipline, or "All"
+        query: Search words, matched case-insensitively against all three fields
+        
+    Returns:
+        The matching rows, in their original order
+    """
+    words = query.casefold().split()
+    return tuple(
+        row for row in rows
+        if (discipline_filter == "All" or row[0] == discipline_filter)
+        and all(word in " ".join(row).casefold() for word in words)
+    )
+
+
+def display_sample_objectives(
+    samples: Union[Mapping[str, Mapping[str, str]], Sequence[Tuple[str, str, str]]],
+    discipline_filter: str = "All",
+    page_size: int = OBJECTIVES_PAGE_SIZE,
+) -> None:
+    """Display sample objectives with search, filtering and pagination.
+    
+    Args:
+        samples: (discipline, level, objective) tuples, or a dictionary of
+            sample objectives by discipline and level
         discipline_filter: Optional filter for a specific discipline
+        page_size: Maximum number of objectives shown at once
     """
-    if discipline_filter != "All":
-        filtered_samples = {discipline_filter: samples.get(discipline_filter, {})}
+    if isinstance(samples, Mapping):
+        rows = tuple(
+            (discipline, level, objective)
+            for discipline, objectives in samples.items()
+            for level, objective in objectives.items()
+        )
     else:
-        filtered_samples = samples
+        rows = tuple(samples)
     
-    for discipline, objectives in filtered_samples.items():
-        st.subheader(discipline)
-        for level, objective in objectives.items():
-            col1, col2 = st.columns([1, 9])
-            with col1:
-                display_taxonomy_level_badge(level)
-            with col2:
-                st.write(objective)
-        
-        st.markdown("---")
\ No newline at end of file
+    query = st.text_input("Search objectives:", key="sample_objectives_search")
+    matches = filter_objectives(rows, discipline_filter, query.strip())
+    if not matches:
+        st.info("No objectives match your search.")
+        return
+    
+    pages = -(-len(matches) // page_size)
+    page = 1
+    if pages > 1:
+        # Keyed by the filters so that changing them goes back to the first page
+        page = st.number_input(
+            f"Page (of {pages})", min_value=1, max_value=pages, value=1,
+            key=f"sample_objectives_page:{discipline_filter}:{query.strip().casefold()}",
+        )
+    start = (page - 1) * page_size
+    st.markdown(
+        objectives_table_html(matches[start:start + page_size], discipline_filter == "All"),
+        unsafe_allow_html=True,
+    )
+    st.caption(f"Showing {start + 1}-{min(start + page_size, len(matches))} of {len(matches)} objectives")
@@ -1,11 +1,14 @@
 """Utility functions for data processing and analysis."""
 
-from typing import Optional
-import pandas as pd
-import numpy as np
+from typing import TYPE_CHECKING, Optional
 
+# pandas and numpy are imported inside the functions that need them so that
+# importing this module stays cheap for the Streamlit pages
+if TYPE_CHECKING:
+    import pandas as pd
 
-def get_sample_data(rows: int = 10) -> pd.DataFrame:
+
+def get_sample_data(rows: int = 10) -> "pd.DataFrame":
     """Generate sample data for demonstration.
 
     Args:
@@ -14,6 +17,9 @@ def get_sample_data(rows: int = 10) -> pd.DataFrame:
     Returns:
         DataFrame with sample data including random numbers and dates
     """
+    import numpy as np
+    import pandas as pd
+
     np.random.seed(42)  # For reproducibility
 
     return pd.DataFrame(
@@ -26,7 +32,7 @@ def get_sample_data(rows: int = 10) -> pd.DataFrame:
     )
 
 
-def process_data(df: pd.DataFrame) -> pd.DataFrame:
+def process_data(df: "pd.DataFrame") -> "pd.DataFrame":
     """Process input dataframe by adding computed columns.
 
     Args:
@@ -48,7 +54,7 @@ def process_data(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def validate_dataframe(
-    df: pd.DataFrame, required_columns: Optional[list[str]] = None
+    df: "pd.DataFrame", required_columns: Optional[list[str]] = None
 ) -> bool:
     """Validate that a DataFrame meets the required schema.
 